@@ -0,0 +1,168 @@
+"""
+Benchmark: `field:(a OR b ...)` versus `{!terms f=field}a,b,...` ID lookups.
+
+By default this starts a local Solr-compatible stub that parses both query
+forms the way Solr does: one scored clause per OR term, rejecting more than
+maxBooleanClauses (1024), versus a single set lookup for the terms parser.
+OR lookups are therefore chunked at 1024 IDs per request, as callers must
+do today. Point --solr-url at a real Solr (e.g. a local Docker core loaded
+with BV-BRC data) for production-representative numbers.
+
+  python benchmarks/terms_filter.py
+  python benchmarks/terms_filter.py --solr-url http://localhost:8983/solr --collection genome_feature --field feature_id --ids-file ids.txt
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+from urllib.parse import parse_qs
+
+from bvbrc_solr_api.core.solr_http_client import select
+from bvbrc_solr_api.core.solr_query_builder import MAX_BOOLEAN_CLAUSES, qb
+from bvbrc_solr_api.core.transport import Transport
+
+
+_OR_QUERY = re.compile(r"^(\w+):\((.*)\)$", re.S)
+_TERMS_QUERY = re.compile(r"^\{!terms f=(\w+)(?: separator=\"(.*?)\")?\}(.*)$", re.S)
+
+
+class StubIndex:
+  """Tiny inverted index answering OR and terms filters on one field."""
+
+  def __init__(self, field: str, size: int):
+    self.field = field
+    self.docs = [{field: f"fig|{i}.peg.{i % 7}", "genome_id": str(i % 1000)} for i in range(size)]
+    self.postings = {doc[field]: [n] for n, doc in enumerate(self.docs)}
+
+  def _or(self, body: str) -> List[int]:
+    clauses = []
+    for raw in body.split(" OR "):
+      term = raw.strip()
+      if term.startswith('"'):
+        term = term[1:-1].replace("\\", "")
+      clauses.append(term)
+    if len(clauses) > MAX_BOOLEAN_CLAUSES:
+      raise ValueError("too many boolean clauses")
+    # BooleanQuery: each clause is its own scorer whose hits are merged and scored.
+    scores: Dict[int, float] = {}
+    for term in clauses:
+      for doc in self.postings.get(term, ()):
+        scores[doc] = scores.get(doc, 0.0) + 1.0 / (1 + len(clauses))
+    return sorted(scores, key=lambda doc: -scores[doc])
+
+  def _terms(self, separator: str, body: str) -> List[int]:
+    wanted = set(body.split(separator))
+    return sorted(n for term in wanted for n in self.postings.get(term, ()))
+
+  def search(self, fq: str) -> List[int]:
+    match = _TERMS_QUERY.match(fq)
+    if match:
+      return self._terms(json.loads(f'"{match.group(2)}"') if match.group(2) else ",", match.group(3))
+    match = _OR_QUERY.match(fq)
+    if match:
+      return self._or(match.group(2))
+    raise ValueError(f"unsupported filter {fq[:40]}")
+
+
+def start_stub(index: StubIndex):
+  class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+      pass
+
+    def do_POST(self):
+      body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+      if self.headers.get("Content-Type") == "application/json":
+        params = json.loads(body)["params"]
+      else:
+        params = {k: v if k == "fq" else v[0] for k, v in parse_qs(body.decode()).items()}
+      fqs = params.get("fq") or []
+      fqs = [fqs] if isinstance(fqs, str) else fqs
+      try:
+        hits = index.search(fqs[0])
+        rows = int(params.get("rows", 10))
+        out = json.dumps({"response": {"numFound": len(hits), "docs": [index.docs[n] for n in hits[:rows]]}}).encode()
+        status = 200
+      except ValueError as exc:
+        out = json.dumps({"error": {"msg": str(exc)}}).encode()
+        status = 400
+      self.send_response(status)
+      self.send_header("Content-Type", "application/json")
+      self.send_header("Content-Length", str(len(out)))
+      self.end_headers()
+      self.wfile.write(out)
+
+  server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def lookup(mode: str, ids: List[str], args: argparse.Namespace, transport: Transport) -> Dict[str, Any]:
+  if mode == "or":
+    filters = [qb.in_(args.field, ids[i:i + MAX_BOOLEAN_CLAUSES]) for i in range(0, len(ids), MAX_BOOLEAN_CLAUSES)]
+    request_format = "form"
+  else:
+    filters = qb.terms_chunks(args.field, ids, args.chunk_size)
+    request_format = "json"
+  found = 0
+  started = time.perf_counter()
+  for fq in filters:
+    result = select(
+      args.collection,
+      qb.build_params(fq_list=[fq], fields=[args.field], rows=len(ids)),
+      base_url=args.solr_url,
+      request_format=request_format,
+      transport=transport,
+    )
+    found += len(result["response"]["docs"])
+  return {
+    "seconds": time.perf_counter() - started,
+    "requests": len(filters),
+    "bytes": sum(len(fq) for fq in filters),
+    "found": found,
+  }
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--solr-url", help="Solr base URL; omit to use the local stub")
+  parser.add_argument("--collection", default="genome_feature")
+  parser.add_argument("--field", default="feature_id")
+  parser.add_argument("--ids-file", help="one ID per line (required with --solr-url)")
+  parser.add_argument("--sizes", default="100,1000,5000,10000", help="ID-set sizes to test")
+  parser.add_argument("--repeat", type=int, default=5)
+  parser.add_argument("--chunk-size", type=int, default=5000, help="IDs per terms request")
+  args = parser.parse_args()
+
+  if args.solr_url:
+    with open(args.ids_file, encoding="utf-8") as fh:
+      all_ids = [line.strip() for line in fh if line.strip()]
+  else:
+    index = StubIndex(args.field, 200_000)
+    server, args.solr_url = start_stub(index)
+    all_ids = [doc[args.field] for doc in index.docs[::7]]
+
+  transport = Transport(retry=None)
+  print(f"{'ids':>6} {'mode':>5} {'median ms':>10} {'p95 ms':>8} {'requests':>8} {'filter KiB':>10} {'found':>6}")
+  for size in (int(n) for n in args.sizes.split(",")):
+    ids = all_ids[:size]
+    for mode in ("or", "terms"):
+      runs = [lookup(mode, ids, args, transport) for _ in range(args.repeat)]
+      times = sorted(run["seconds"] * 1000 for run in runs)
+      p95 = times[min(len(times) - 1, int(round(0.95 * (len(times) - 1))))]
+      print(
+        f"{len(ids):>6} {mode:>5} {statistics.median(times):>10.1f} {p95:>8.1f} "
+        f"{runs[0]['requests']:>8} {runs[0]['bytes'] / 1024:>10.1f} {runs[0]['found']:>6}"
+      )
+  transport.close()
+
+
+if __name__ == "__main__":
+  main()
@@ -1,6 +1,19 @@
 import httpx
 
+from .core.arrow import ArrowBuilder
+from .core.cache import DiskCache, MemoryCache, ResponseCache
+from .core.checkpoint import CheckpointedExport, resume as resume_export
+from .core.concurrency import AdaptiveConcurrencyLimiter
+from .core.export import AsyncExportStream, ExportStream
+from .core.facets import FacetResult, FieldStats, RangeSpec
 from .core.http_client import create_context, run as run_internal
+from .core.mirror import Mirror
+from .core.page_size import PageSizer
+from .core.record_types import Record, record_type
+from .core.retry import RetryPolicy, TokenBucket
+from .core.router import MirrorRouter
+from .core.sinks import CsvSink, JsonLinesSink, ParquetSink, RollingJsonLinesSink, open_sink, read_export
+from .core.transport import Transport, configure_transport, create_transport, get_default_transport
 from .resources.antibiotics import Antibiotics
 from .resources.bioset import Bioset
 from .resources.bioset_result import BiosetResult
@@ -43,18 +56,36 @@ class AsyncBVBRCClient:
 
   Usage:
     async with create_client() as client:
-      ...
+      genome = await client.genome.get_by_id("83332.12")
   """
 
   def __init__(self, context_overrides: dict | None = None):
-    self._ctx = create_context(context_overrides or {})
+    overrides = context_overrides or {}
+    self._ctx = create_context(overrides)
+    self._coalesce = bool(overrides.get("coalesce", False))
+    for key in ("coalesce_window", "coalesce_max_batch"):
+      if key in overrides:
+        self._ctx[key] = overrides[key]
+    # Client-scoped connection pool unless the caller supplied a transport.
+    self._owns_transport = self._ctx.get("transport") is None
+    if self._owns_transport:
+      self._ctx["transport"] = create_transport(overrides)
     self._http_client: httpx.AsyncClient | None = None
 
+  @property
+  def transport(self) -> Transport:
+    return self._ctx["transport"]
+
   async def __aenter__(self):
-    # Shared async client used by async Solr selectors.
-    self._http_client = httpx.AsyncClient(timeout=self._ctx.get("timeout", 60.0))
+    # Shared async client used by async RQL calls and Solr selectors.
+    self._http_client = self.transport.get_async_client()
+    # Resources consume context only; the async client in it makes every
+    # query method awaitable (e.g. `await client.genome.get_by_id(...)`).
+    self._ctx["async_client"] = self._http_client
+    if self._coalesce:
+      # Opt-in: concurrent get_by_id/get_by_md5 calls share one in() query per collection.
+      self._ctx["loaders"] = {}
 
-    # Keep resource objects API-compatible; they still consume context only.
     self.antibiotics = Antibiotics(self._ctx)
     self.bioset = Bioset(self._ctx)
     self.bioset_result = BiosetResult(self._ctx)
@@ -92,8 +123,11 @@ class AsyncBVBRCClient:
     return self
 
   async def __aexit__(self, exc_type, exc_val, exc_tb):
-    if self._http_client:
-      await self._http_client.aclose()
+    self._ctx.pop("async_client", None)
+    self._ctx.pop("loaders", None)
+    if self._owns_transport:
+      await self.transport.aclose()
+    self._http_client = None
     return False
 
 
@@ -118,6 +152,34 @@ __all__ = [
   "AsyncBVBRCClient",
   "create_client",
   "query",
+  "Transport",
+  "configure_transport",
+  "get_default_transport",
+  "RetryPolicy",
+  "AdaptiveConcurrencyLimiter",
+  "CheckpointedExport",
+  "ExportStream",
+  "AsyncExportStream",
+  "FacetResult",
+  "FieldStats",
+  "RangeSpec",
+  "JsonLinesSink",
+  "RollingJsonLinesSink",
+  "CsvSink",
+  "ParquetSink",
+  "open_sink",
+  "read_export",
+  "Mirror",
+  "MirrorRouter",
+  "ArrowBuilder",
+  "Record",
+  "record_type",
+  "PageSizer",
+  "resume_export",
+  "TokenBucket",
+  "ResponseCache",
+  "MemoryCache",
+  "DiskCache",
   "Antibiotics",
   "Bioset",
   "BiosetResult",
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from typing import Any, AsyncIterable, Dict, Iterable, List, Sequence
+
+try:
+  import pyarrow as pa
+except ImportError:  # pragma: no cover - optional
+  pa = None
+
+
+DEFAULT_BATCH_ROWS = 8192
+
+
+def _require_pyarrow():
+  if pa is None:
+    raise ImportError("Arrow results need pyarrow: pip install \"bvbrc-solr-python-api[arrow]\"")
+  return pa
+
+
+def _infer(name: str, values: List[Any]):
+  try:
+    return pa.array(values)
+  except (OverflowError, pa.ArrowInvalid, pa.ArrowTypeError) as exc:
+    # Integers beyond int64 (e.g. large ids) still fit a 38-digit decimal.
+    if all(value is None or (isinstance(value, int) and not isinstance(value, bool)) for value in values):
+      try:
+        return pa.array(values, type=pa.decimal128(38, 0))
+      except (OverflowError, pa.ArrowInvalid):
+        pass
+    raise ValueError(f"Cannot convert column '{name}' to Arrow: {exc}") from exc
+
+
+def _declared(field: Any, values: List[Any]):
+  # Infer, then cast safely, so values that do not fit the declared type raise instead of truncating.
+  try:
+    array = pa.array(values)
+  except (OverflowError, pa.ArrowInvalid, pa.ArrowTypeError):
+    return pa.array(values, type=field.type)
+  if array.type == field.type:
+    return array
+  try:
+    return array.cast(field.type)
+  except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as exc:
+    raise ValueError(f"Column '{field.name}' does not fit declared type {field.type}: {exc}") from exc
+
+
+class ArrowBuilder:
+  """
+  Assembles documents into Arrow record batches as they stream in.
+
+  Rows are buffered column-wise for at most `batch_size` documents and then
+  converted, so only one batch of Python objects is alive at a time. With a
+  declared `schema` columns are built with its types (other fields are
+  dropped, and values that do not fit raise ValueError); otherwise each
+  batch is inferred and `to_table()` promotes them to one schema.
+  String columns named in `dictionary_fields` (low-cardinality values such
+  as feature_type or strand) are dictionary-encoded. `to_table()` returns a
+  pyarrow.Table ready for zero-copy `to_pandas()` / `polars.from_arrow()`.
+  """
+
+  def __init__(
+    self,
+    schema: Any = None,
+    *,
+    dictionary_fields: Sequence[str] = (),
+    batch_size: int = DEFAULT_BATCH_ROWS,
+  ) -> None:
+    _require_pyarrow()
+    self.schema = schema
+    self.dictionary_fields = set(dictionary_fields)
+    self.batch_size = max(1, int(batch_size))
+    self.batches: List[Any] = []
+    self._columns: Dict[str, List[Any]] = {}
+    self._rows = 0
+
+  @property
+  def num_rows(self) -> int:
+    return sum(batch.num_rows for batch in self.batches) + self._rows
+
+  def append(self, doc: Dict[str, Any]) -> None:
+    columns = self._columns
+    rows = self._rows
+    for name, value in doc.items():
+      column = columns.get(name)
+      if column is None:
+        column = columns[name] = [None] * rows
+      column.append(value)
+    self._rows = rows = rows + 1
+    if len(doc) != len(columns):
+      for column in columns.values():
+        if len(column) < rows:
+          column.append(None)
+    if rows >= self.batch_size:
+      self.flush()
+
+  def extend(self, docs: Iterable[Dict[str, Any]]) -> "ArrowBuilder":
+    for doc in docs:
+      self.append(doc)
+    return self
+
+  async def aextend(self, docs: AsyncIterable[Dict[str, Any]]) -> "ArrowBuilder":
+    async for doc in docs:
+      self.append(doc)
+    return self
+
+  def _array(self, name: str, values: List[Any]):
+    # Each batch is inferred on its own: converting to an earlier batch's type
+    # would silently truncate (int64 drops the fraction of 1.5). to_table()
+    # promotes the batches to a common schema.
+    array = _infer(name, values)
+    if name in self.dictionary_fields and (pa.types.is_string(array.type) or pa.types.is_large_string(array.type)):
+      array = array.dictionary_encode()
+    return array
+
+  def flush(self):
+    """Convert buffered rows into a RecordBatch (returned and kept in `batches`)."""
+    if not self._rows:
+      return None
+    columns, rows = self._columns, self._rows
+    self._columns, self._rows = {}, 0
+    if self.schema is not None:
+      arrays = [_declared(field, columns.get(field.name, [None] * rows)) for field in self.schema]
+      batch = pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+    else:
+      batch = pa.RecordBatch.from_arrays([self._array(name, values) for name, values in columns.items()], names=list(columns))
+    self.batches.append(batch)
+    return batch
+
+  def to_table(self):
+    self.flush()
+    if not self.batches:
+      return self.schema.empty_table() if self.schema is not None else pa.table({})
+    if self.schema is not None:
+      return pa.Table.from_batches(self.batches, schema=self.schema)
+    # Batches may differ in columns or types (int64 then double); promote to one schema.
+    return pa.concat_tables([pa.Table.from_batches([batch]) for batch in self.batches], promote_options="permissive")
+
+
+def arrow_builder(arrow: bool | ArrowBuilder, dictionary_fields: Sequence[str] = ()) -> ArrowBuilder:
+  """Resolve an `arrow=` argument: True builds a default ArrowBuilder, a builder is used as is."""
+  return arrow if isinstance(arrow, ArrowBuilder) else ArrowBuilder(dictionary_fields=dictionary_fields)
+
+
+__all__ = ["ArrowBuilder", "DEFAULT_BATCH_ROWS", "arrow_builder"]
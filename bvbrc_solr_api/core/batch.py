@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List
+
+import httpx
+
+from .cache import ResponseCache
+from .http_client import async_run, run
+from .query_builder import _encode, in_filters
+from .solr_http_client import async_select, select
+from .solr_query_builder import DEFAULT_TERMS_CHUNK_SIZE, qb as solrqb
+from .transport import Transport
+
+
+DEFAULT_CHUNK_SIZE = 500
+# Keep each in() body comfortably below common proxy request-body limits.
+DEFAULT_MAX_BODY_BYTES = 64 * 1024
+DEFAULT_MAX_WORKERS = 8
+
+
+class BatchResult(dict):
+  """Docs keyed by requested ID; `missing` lists the IDs that matched nothing."""
+
+  def __init__(self, found: Dict[Any, Any], missing: List[Any]):
+    super().__init__(found)
+    self.missing = missing
+
+
+def _unique(ids: Iterable[Any]) -> List[Any]:
+  seen = set()
+  ordered = []
+  for value in ids:
+    key = str(value)
+    if key not in seen:
+      seen.add(key)
+      ordered.append(value)
+  return ordered
+
+
+def chunk_ids(
+  field: str,
+  ids: Iterable[Any],
+  chunk_size: int = DEFAULT_CHUNK_SIZE,
+  max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+) -> List[List[Any]]:
+  """Split IDs so each chunk has at most `chunk_size` values and its in() filter fits `max_body_bytes`."""
+  # in(field,) wrapper plus room for the limit()/select() suffixes
+  overhead = len(in_filters(field, [""])) + 64
+  chunks: List[List[Any]] = []
+  current: List[Any] = []
+  size = overhead
+  for value in _unique(ids):
+    encoded = len(_encode(value)) + 1
+    if current and (len(current) >= chunk_size or size + encoded > max_body_bytes):
+      chunks.append(current)
+      current = []
+      size = overhead
+    current.append(value)
+    size += encoded
+  if current:
+    chunks.append(current)
+  return chunks
+
+
+def _chunk_options(field: str, chunk: List[Any], options: Dict[str, Any]) -> Dict[str, Any]:
+  chunk_options = dict(options)
+  select_fields = chunk_options.get("select")
+  if select_fields and field not in select_fields:
+    chunk_options["select"] = list(select_fields) + [field]
+  limit_value = chunk_options.get("limit")
+  chunk_options["limit"] = max(len(chunk), limit_value if isinstance(limit_value, int) else 0)
+  return chunk_options
+
+
+def _collect(field: str, ids: List[Any], responses: Iterable[List[Dict[str, Any]]]) -> BatchResult:
+  requested = {str(value): value for value in ids}
+  found: Dict[Any, Any] = {}
+  for docs in responses:
+    for doc in docs:
+      key = str(doc.get(field))
+      if key in requested and requested[key] not in found:
+        found[requested[key]] = doc
+  ordered = {value: found[value] for value in ids if value in found}
+  return BatchResult(ordered, [value for value in ids if value not in found])
+
+
+def get_many(
+  core_name: str,
+  field: str,
+  ids: Iterable[Any],
+  options: Dict[str, Any] | None,
+  base_url: str | None,
+  headers: Dict[str, str] | None,
+  transport: Transport | None = None,
+  *,
+  chunk_size: int = DEFAULT_CHUNK_SIZE,
+  max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+  max_workers: int = DEFAULT_MAX_WORKERS,
+  cache: ResponseCache | None = None,
+) -> BatchResult:
+  """Fetch many records by `field` with chunked in() queries dispatched on a thread pool."""
+  options = options or {}
+  unique_ids = _unique(ids)
+  chunks = chunk_ids(field, unique_ids, chunk_size, max_body_bytes)
+  if not chunks:
+    return BatchResult({}, [])
+
+  def fetch(chunk: List[Any]) -> List[Dict[str, Any]]:
+    return run(core_name, in_filters(field, chunk), _chunk_options(field, chunk, options), base_url, headers, transport, cache=cache)
+
+  with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+    responses = list(executor.map(fetch, chunks))
+  return _collect(field, unique_ids, responses)
+
+
+async def async_get_many(
+  core_name: str,
+  field: str,
+  ids: Iterable[Any],
+  options: Dict[str, Any] | None,
+  base_url: str | None,
+  headers: Dict[str, str] | None,
+  transport: Transport | None = None,
+  client: httpx.AsyncClient | None = None,
+  *,
+  chunk_size: int = DEFAULT_CHUNK_SIZE,
+  max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+  max_workers: int = DEFAULT_MAX_WORKERS,
+  cache: ResponseCache | None = None,
+) -> BatchResult:
+  """Async counterpart of get_many; chunks run concurrently on the shared client."""
+  options = options or {}
+  unique_ids = _unique(ids)
+  chunks = chunk_ids(field, unique_ids, chunk_size, max_body_bytes)
+  semaphore = asyncio.Semaphore(max(1, max_workers))
+
+  async def fetch(chunk: List[Any]) -> List[Dict[str, Any]]:
+    async with semaphore:
+      return await async_run(
+        core_name, in_filters(field, chunk), _chunk_options(field, chunk, options), base_url, headers, transport, client, cache=cache
+      )
+
+  responses = await asyncio.gather(*[fetch(chunk) for chunk in chunks])
+  return _collect(field, unique_ids, responses)
+
+
+def _terms_params(field: str, chunk: List[Any], fields: List[str] | None) -> Dict[str, Any]:
+  if fields and field not in fields:
+    fields = list(fields) + [field]
+  return solrqb.build_params(fq_list=[solrqb.terms(field, chunk)], fields=fields, rows=len(chunk))
+
+
+def _solr_docs(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+  return result.get("response", {}).get("docs", [])
+
+
+def solr_get_many(
+  collection: str,
+  field: str,
+  ids: Iterable[Any],
+  *,
+  fields: List[str] | None = None,
+  base_url: str | None = None,
+  headers: Dict[str, str] | None = None,
+  auth: Any = None,
+  timeout: float = 60.0,
+  transport: Transport | None = None,
+  chunk_size: int = DEFAULT_TERMS_CHUNK_SIZE,
+  max_workers: int = DEFAULT_MAX_WORKERS,
+  request_format: str = "json",
+) -> BatchResult:
+  """
+  Fetch many records by a unique `field` with `{!terms}` filters on Solr.
+
+  Each chunk is one fq set lookup rather than an OR of N scored clauses, so
+  it is cheap to parse and never hits maxBooleanClauses. The JSON request
+  format keeps large ID lists in the POST body.
+  """
+  unique_ids = _unique(ids)
+  chunks = [unique_ids[i:i + chunk_size] for i in range(0, len(unique_ids), max(1, chunk_size))]
+  if not chunks:
+    return BatchResult({}, [])
+
+  def fetch(chunk: List[Any]) -> List[Dict[str, Any]]:
+    return _solr_docs(select(
+      collection,
+      _terms_params(field, chunk, fields),
+      base_url=base_url,
+      headers=headers,
+      auth=auth,
+      timeout=timeout,
+      request_format=request_format,
+      transport=transport,
+    ))
+
+  with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+    responses = list(executor.map(fetch, chunks))
+  return _collect(field, unique_ids, responses)
+
+
+async def async_solr_get_many(
+  collection: str,
+  field: str,
+  ids: Iterable[Any],
+  *,
+  fields: List[str] | None = None,
+  base_url: str | None = None,
+  headers: Dict[str, str] | None = None,
+  auth: Any = None,
+  timeout: float = 60.0,
+  transport: Transport | None = None,
+  client: httpx.AsyncClient | None = None,
+  chunk_size: int = DEFAULT_TERMS_CHUNK_SIZE,
+  max_workers: int = DEFAULT_MAX_WORKERS,
+  request_format: str = "json",
+) -> BatchResult:
+  """Async counterpart of solr_get_many."""
+  unique_ids = _unique(ids)
+  chunks = [unique_ids[i:i + chunk_size] for i in range(0, len(unique_ids), max(1, chunk_size))]
+  semaphore = asyncio.Semaphore(max(1, max_workers))
+
+  async def fetch(chunk: List[Any]) -> List[Dict[str, Any]]:
+    async with semaphore:
+      return _solr_docs(await async_select(
+        collection,
+        _terms_params(field, chunk, fields),
+        client=client,
+        base_url=base_url,
+        headers=headers,
+        auth=auth,
+        timeout=timeout,
+        request_format=request_format,
+        transport=transport,
+      ))
+
+  responses = await asyncio.gather(*[fetch(chunk) for chunk in chunks])
+  return _collect(field, unique_ids, responses)
+
+
+__all__ = [
+  "BatchResult",
+  "async_get_many",
+  "async_solr_get_many",
+  "chunk_ids",
+  "get_many",
+  "solr_get_many",
+]
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+
+# Reference collections change rarely; cache them for a day by default.
+DEFAULT_COLLECTION_TTLS = {
+  "antibiotics": 86400.0,
+  "enzyme_class_ref": 86400.0,
+  "gene_ontology_ref": 86400.0,
+  "pathway_ref": 86400.0,
+  "subsystem_ref": 86400.0,
+  "taxonomy": 86400.0,
+}
+DEFAULT_TTL = 300.0
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class MemoryCache:
+  """In-process LRU store bounded by entry count and (optionally) total bytes."""
+
+  def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int | None = None):
+    self.max_entries = max(1, int(max_entries))
+    self.max_bytes = max_bytes
+    self.evictions = 0
+    self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+    self._bytes = 0
+    self._lock = threading.Lock()
+
+  def get(self, key: str) -> Tuple[float, bytes] | None:
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is not None:
+        self._entries.move_to_end(key)
+      return entry
+
+  def set(self, key: str, value: bytes, expires_at: float) -> None:
+    with self._lock:
+      previous = self._entries.pop(key, None)
+      if previous is not None:
+        self._bytes -= len(previous[1])
+      self._entries[key] = (expires_at, value)
+      self._bytes += len(value)
+      while len(self._entries) > self.max_entries or (self.max_bytes is not None and self._bytes > self.max_bytes and len(self._entries) > 1):
+        _, (_, evicted) = self._entries.popitem(last=False)
+        self._bytes -= len(evicted)
+        self.evictions += 1
+
+  def delete(self, key: str) -> None:
+    with self._lock:
+      entry = self._entries.pop(key, None)
+      if entry is not None:
+        self._bytes -= len(entry[1])
+
+  def clear(self) -> None:
+    with self._lock:
+      self._entries.clear()
+      self._bytes = 0
+
+
+class DiskCache:
+  """
+  SQLite-backed store with zlib-compressed values, shareable across processes.
+
+  Least-recently-used rows are evicted once `max_entries` or `max_bytes`
+  (compressed) is exceeded.
+  """
+
+  def __init__(self, path: str, max_entries: int = 100_000, max_bytes: int | None = None, timeout: float = 30.0):
+    self.path = path
+    self.max_entries = max(1, int(max_entries))
+    self.max_bytes = max_bytes
+    self.evictions = 0
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    self._lock = threading.Lock()
+    self._conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False, isolation_level=None)
+    self._conn.execute("PRAGMA journal_mode=WAL")
+    self._conn.execute(
+      "CREATE TABLE IF NOT EXISTS cache ("
+      "key TEXT PRIMARY KEY, expires_at REAL, accessed_at REAL, size INTEGER, value BLOB)"
+    )
+    self._conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed_at)")
+
+  def get(self, key: str) -> Tuple[float, bytes] | None:
+    with self._lock:
+      row = self._conn.execute("SELECT expires_at, value FROM cache WHERE key = ?", (key,)).fetchone()
+      if row is None:
+        return None
+      self._conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+    return row[0], zlib.decompress(row[1])
+
+  def set(self, key: str, value: bytes, expires_at: float) -> None:
+    compressed = zlib.compress(value)
+    with self._lock:
+      self._conn.execute(
+        "INSERT OR REPLACE INTO cache (key, expires_at, accessed_at, size, value) VALUES (?, ?, ?, ?, ?)",
+        (key, expires_at, time.time(), len(compressed), compressed),
+      )
+      self._evict()
+
+  def _evict(self) -> None:
+    count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache").fetchone()
+    excess = max(0, count - self.max_entries)
+    while excess or (self.max_bytes is not None and total > self.max_bytes and count > 1):
+      row = self._conn.execute("SELECT key, size FROM cache ORDER BY accessed_at LIMIT 1").fetchone()
+      if row is None:
+        return
+      self._conn.execute("DELETE FROM cache WHERE key = ?", (row[0],))
+      self.evictions += 1
+      count -= 1
+      total -= row[1]
+      excess = max(0, excess - 1)
+
+  def delete(self, key: str) -> None:
+    with self._lock:
+      self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+  def clear(self) -> None:
+    with self._lock:
+      self._conn.execute("DELETE FROM cache")
+
+  def close(self) -> None:
+    self._conn.close()
+
+
+def _auth_identity(auth: Any) -> Any:
+  if auth is None or isinstance(auth, (str, tuple, list)):
+    return auth
+  header = getattr(auth, "_auth_header", None)
+  if isinstance(header, str):
+    # httpx.BasicAuth: the precomputed Authorization value identifies the credentials.
+    return header
+  # Other auth flows cannot be compared; never share entries between instances.
+  return f"{type(auth).__module__}.{type(auth).__qualname__}@{id(auth)}"
+
+
+def request_scope(url: str, headers: Dict[str, str] | None = None, auth: Any = None) -> str:
+  """
+  Cache scope for a request: its endpoint URL plus a digest of the headers and auth.
+
+  Entries are only shared between requests to the same endpoint with the
+  same credentials, so one server's results or an authenticated (private)
+  response is never served to a different endpoint, token or anonymous caller.
+  """
+  identity = json.dumps(
+    [sorted((key.lower(), str(value)) for key, value in (headers or {}).items()), _auth_identity(auth)],
+    default=str,
+  )
+  return url + "#" + hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+# Filter lists whose order does not change the result set: form/JSON params
+# "fq" and the JSON Request API "filter".
+_FILTER_KEYS = ("fq", "filter")
+
+
+def _sorted_filters(params: Dict[str, Any]) -> Dict[str, Any]:
+  return {k: sorted(map(str, v)) if k in _FILTER_KEYS and isinstance(v, (list, tuple)) else v for k, v in params.items()}
+
+
+class ResponseCache:
+  """
+  TTL cache for parsed RQL and Solr responses.
+
+  Entries are keyed on (collection, normalized body/params, format, scope),
+  where the scope from request_scope() binds them to one endpoint and set
+  of credentials, and stored as JSON so callers never share mutable results. A TTL of 0
+  disables caching for that collection.
+  """
+
+  def __init__(
+    self,
+    backend: MemoryCache | DiskCache | None = None,
+    *,
+    ttl: float = DEFAULT_TTL,
+    collection_ttls: Dict[str, float] | None = None,
+  ):
+    self.backend = backend if backend is not None else MemoryCache()
+    self.ttl = ttl
+    self.collection_ttls = dict(DEFAULT_COLLECTION_TTLS)
+    self.collection_ttls.update(collection_ttls or {})
+    self._lock = threading.Lock()
+    self._hits = 0
+    self._misses = 0
+    self._stores = 0
+
+  def ttl_for(self, collection: str) -> float:
+    return self.collection_ttls.get(collection, self.ttl)
+
+  @staticmethod
+  def make_key(collection: str, payload: Any, fmt: str | None, scope: str = "") -> str:
+    if isinstance(payload, str):
+      # RQL bodies: top-level &-joined terms are order independent
+      normalized: Any = sorted(payload.split("&"))
+    else:
+      normalized = _sorted_filters(payload or {})
+      if isinstance(normalized.get("params"), dict):
+        # JSON Request API bodies ({"params": {...}}) nest the classic params.
+        normalized["params"] = _sorted_filters(normalized["params"])
+    raw = json.dumps([collection, normalized, fmt or "", scope], sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+  def get(self, collection: str, payload: Any, fmt: str | None = None, scope: str = "") -> Any:
+    if self.ttl_for(collection) <= 0:
+      return None
+    key = self.make_key(collection, payload, fmt, scope)
+    entry = self.backend.get(key)
+    if entry is not None and entry[0] < time.time():
+      self.backend.delete(key)
+      entry = None
+    with self._lock:
+      if entry is None:
+        self._misses += 1
+        return None
+      self._hits += 1
+    return json.loads(entry[1])
+
+  def set(self, collection: str, payload: Any, fmt: str | None, value: Any, scope: str = "") -> None:
+    ttl = self.ttl_for(collection)
+    if ttl <= 0:
+      return
+    key = self.make_key(collection, payload, fmt, scope)
+    self.backend.set(key, json.dumps(value).encode("utf-8"), time.time() + ttl)
+    with self._lock:
+      self._stores += 1
+
+  def clear(self) -> None:
+    self.backend.clear()
+
+  @property
+  def stats(self) -> Dict[str, int]:
+    with self._lock:
+      return {
+        "hits": self._hits,
+        "misses": self._misses,
+        "stores": self._stores,
+        "evictions": self.backend.evictions,
+      }
+
+
+__all__ = [
+  "DiskCache",
+  "MemoryCache",
+  "ResponseCache",
+  "request_scope",
+]
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, Generator, List
+
+from .cursor import CursorPager
+from .transport import Transport
+
+
+CHECKPOINT_VERSION = 1
+
+
+def params_hash(collection: str, base_params: Dict[str, Any], sort: str) -> str:
+  """Identity of an export: a cursorMark is only valid for the same query and sort."""
+  raw = json.dumps([collection, base_params, sort], sort_keys=True, default=str)
+  return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class CheckpointStore:
+  """JSON checkpoint file replaced atomically (write, fsync, rename) on every save."""
+
+  def __init__(self, path: str):
+    self.path = path
+
+  def load(self) -> Dict[str, Any] | None:
+    try:
+      with open(self.path, "r", encoding="utf-8") as fh:
+        return json.load(fh)
+    except FileNotFoundError:
+      return None
+
+  def save(self, state: Dict[str, Any]) -> None:
+    directory = os.path.dirname(os.path.abspath(self.path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".checkpoint-", dir=directory)
+    try:
+      with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        json.dump(state, fh, sort_keys=True)
+        fh.flush()
+        os.fsync(fh.fileno())
+      os.replace(tmp_path, self.path)
+    except BaseException:
+      if os.path.exists(tmp_path):
+        os.unlink(tmp_path)
+      raise
+    if hasattr(os, "O_DIRECTORY"):
+      # Make the rename itself durable.
+      dir_fd = os.open(directory, os.O_DIRECTORY)
+      try:
+        os.fsync(dir_fd)
+      finally:
+        os.close(dir_fd)
+
+  def clear(self) -> None:
+    if os.path.exists(self.path):
+      os.unlink(self.path)
+
+
+class CheckpointedExport:
+  """
+  Cursor export that commits (cursorMark, rows emitted) after every page.
+
+  A page is committed only once the consumer asks for the next one, so a
+  crash re-delivers at most the page being processed. With `run(sink)` the
+  sink's durable offset is committed too and rolled back on restart, which
+  makes the output exactly-once: no duplicates, no gaps. A checkpoint
+  belongs to the mode that first committed to it (iteration or run), and
+  starting an export whose checkpoint belongs to a different query or mode
+  raises ValueError.
+  """
+
+  def __init__(self, pager: CursorPager, checkpoint: str | CheckpointStore):
+    self.pager = pager
+    self.store = checkpoint if isinstance(checkpoint, CheckpointStore) else CheckpointStore(checkpoint)
+    self.key = params_hash(pager.collection, pager.base_params, pager.sort)
+    state = self.store.load()
+    if state is not None and state.get("params_hash") != self.key:
+      raise ValueError(f"Checkpoint {self.store.path} belongs to a different export; clear it or use another path")
+    self.state: Dict[str, Any] = state or self._initial_state()
+    pager.cursor = self.state["cursor"]
+
+  def _initial_state(self) -> Dict[str, Any]:
+    pager = self.pager
+    return {
+      "version": CHECKPOINT_VERSION,
+      "collection": pager.collection,
+      "params_hash": self.key,
+      "base_params": pager.base_params,
+      "base_url": pager.base_url,
+      "rows": pager.rows,
+      "sort": pager.sort,
+      "unique_key": pager.unique_key,
+      "cursor": pager.cursor,
+      "rows_emitted": 0,
+      "pages": 0,
+      "sink_position": 0,
+      "mode": None,
+      "done": False,
+    }
+
+  def _claim(self, mode: str) -> None:
+    owner = self.state.get("mode")
+    if owner is None and self.state["rows_emitted"]:
+      # Checkpoints written before the mode was recorded.
+      owner = "run" if self.state["sink_position"] else "iter"
+    if owner is not None and owner != mode:
+      used = "run(sink)" if owner == "run" else "iteration"
+      raise ValueError(f"Checkpoint {self.store.path} was written by {used}; resume it the same way or clear it")
+    self.state["mode"] = mode
+
+  @property
+  def done(self) -> bool:
+    return bool(self.state["done"])
+
+  @property
+  def rows_emitted(self) -> int:
+    return int(self.state["rows_emitted"])
+
+  def _commit(self, cursor: str, count: int, done: bool, sink_position: int | None = None) -> None:
+    state = dict(self.state)
+    state.update({
+      "cursor": cursor,
+      "rows_emitted": state["rows_emitted"] + count,
+      "pages": state["pages"] + (1 if count else 0),
+      "done": done,
+      "updated_at": time.time(),
+    })
+    if sink_position is not None:
+      state["sink_position"] = sink_position
+    self.store.save(state)
+    self.state = state
+    self.pager.cursor = cursor
+
+  def _pages(self) -> Generator[tuple, None, None]:
+    while not self.done:
+      cursor = self.state["cursor"]
+      docs, next_cursor = self.pager.fetch_page(cursor)
+      done = not docs or next_cursor is None or next_cursor == cursor
+      yield docs, (cursor if done else next_cursor), done
+
+  def iter_pages(self) -> Generator[List[Dict[str, Any]], None, None]:
+    self._claim("iter")
+    for docs, cursor, done in self._pages():
+      if docs:
+        yield docs
+      self._commit(cursor, len(docs), done)
+
+  def __iter__(self):
+    return self.iter_docs()
+
+  def iter_docs(self) -> Generator[Dict[str, Any], None, None]:
+    for docs in self.iter_pages():
+      yield from docs
+
+  def run(self, sink: Any) -> int:
+    """
+    Write every remaining page to `sink` and return the total rows emitted.
+
+    The sink needs write(docs), flush() -> durable offset and
+    truncate(offset) (see JsonLinesSink). Anything written after the last
+    commit, e.g. by a run that crashed, is truncated away first.
+    """
+    self._claim("run")
+    sink.truncate(int(self.state["sink_position"]))
+    for docs, cursor, done in self._pages():
+      if docs:
+        sink.write(docs)
+      self._commit(cursor, len(docs), done, sink.flush())
+    return self.rows_emitted
+
+
+def resume(
+  checkpoint: str | CheckpointStore,
+  *,
+  headers: Dict[str, str] | None = None,
+  auth: Any = None,
+  timeout: float = 60.0,
+  transport: Transport | None = None,
+  base_url: str | None = None,
+) -> CheckpointedExport:
+  """
+  Rebuild an export from its checkpoint file and continue after the last committed page.
+
+  Headers and auth are not persisted and must be passed again if needed.
+  """
+  store = checkpoint if isinstance(checkpoint, CheckpointStore) else CheckpointStore(checkpoint)
+  state = store.load()
+  if state is None:
+    raise FileNotFoundError(f"No checkpoint at {store.path}")
+  pager = CursorPager(
+    collection=state["collection"],
+    base_params=state["base_params"],
+    base_url=base_url or state["base_url"],
+    headers=headers,
+    auth=auth,
+    rows=state["rows"],
+    sort=state["sort"],
+    unique_key=state["unique_key"],
+    start_cursor=state["cursor"],
+    timeout=timeout,
+    transport=transport,
+  )
+  return CheckpointedExport(pager, store)
+
+
+__all__ = [
+  "CheckpointStore",
+  "CheckpointedExport",
+  "params_hash",
+  "resume",
+]
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import gzip
+import json
+import zlib
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urlencode
+
+try:
+  import brotli
+except ImportError:  # pragma: no cover - optional
+  try:
+    import brotlicffi as brotli
+  except ImportError:
+    brotli = None
+
+try:
+  import zstandard
+except ImportError:  # pragma: no cover - optional
+  zstandard = None
+
+
+# Below this size compressing a request body costs more than it saves.
+DEFAULT_COMPRESS_MIN_BYTES = 16 * 1024
+
+
+def supported_encodings() -> List[str]:
+  """Content codings httpx can decode here: gzip/deflate always, br and zstd when installed."""
+  encodings = ["gzip", "deflate"]
+  if brotli is not None:
+    encodings.append("br")
+  if zstandard is not None:
+    encodings.append("zstd")
+  return encodings
+
+
+ACCEPT_ENCODING = ", ".join(supported_encodings())
+
+
+def compress(data: bytes, encoding: str = "gzip") -> bytes:
+  if encoding == "gzip":
+    return gzip.compress(data, compresslevel=6)
+  if encoding == "deflate":
+    return zlib.compress(data, 6)
+  if encoding == "br" and brotli is not None:
+    return brotli.compress(data, quality=5)
+  if encoding == "zstd" and zstandard is not None:
+    return zstandard.ZstdCompressor(level=3).compress(data)
+  raise ValueError(f"Unsupported request encoding '{encoding}'. Available: {', '.join(supported_encodings())}")
+
+
+def _form_value(value: Any) -> Any:
+  # Match httpx's form encoding of booleans and None.
+  if value is True:
+    return "true"
+  if value is False:
+    return "false"
+  if value is None:
+    return ""
+  return value
+
+
+def _body_bytes(kwargs: Dict[str, Any]) -> bytes | None:
+  if kwargs.get("content") is not None:
+    content = kwargs["content"]
+    return content.encode("utf-8") if isinstance(content, str) else bytes(content)
+  if kwargs.get("json") is not None:
+    return json.dumps(kwargs["json"], ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+  if kwargs.get("data") is not None:
+    data = {
+      key: [_form_value(item) for item in value] if isinstance(value, (list, tuple)) else _form_value(value)
+      for key, value in kwargs["data"].items()
+    }
+    return urlencode(data, doseq=True).encode("utf-8")
+  return None
+
+
+def encode_request(kwargs: Dict[str, Any], min_bytes: int | None, encoding: str = "gzip") -> Tuple[Dict[str, Any], int, int]:
+  """
+  Serialize the request body once, compressing it when it reaches `min_bytes`.
+
+  Returns (kwargs, raw body size, body size on the wire). With `min_bytes`
+  None the kwargs are returned unchanged.
+  """
+  if min_bytes is None:
+    return kwargs, 0, 0
+  body = _body_bytes(kwargs)
+  if body is None:
+    return kwargs, 0, 0
+  encoded = dict(kwargs)
+  for key in ("content", "json", "data"):
+    encoded.pop(key, None)
+  headers = dict(encoded.get("headers") or {})
+  if len(body) >= min_bytes:
+    wire = compress(body, encoding)
+    headers["Content-Encoding"] = encoding
+  else:
+    wire = body
+  if kwargs.get("json") is not None:
+    headers.setdefault("Content-Type", "application/json")
+  elif kwargs.get("data") is not None:
+    headers.setdefault("Content-Type", "application/x-www-form-urlencoded")
+  encoded["headers"] = headers
+  encoded["content"] = wire
+  return encoded, len(body), len(wire)
+
+
+__all__ = [
+  "ACCEPT_ENCODING",
+  "DEFAULT_COMPRESS_MIN_BYTES",
+  "compress",
+  "encode_request",
+  "supported_encodings",
+]
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Dict
+
+import httpx
+
+
+DEFAULT_INITIAL_LIMIT = 8
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 256
+DEFAULT_BACKOFF = 0.5
+DEFAULT_LATENCY_TOLERANCE = 2.0
+# Smoothing for recent latency, and the time constant (seconds) over which
+# the no-load baseline may creep up towards it.
+_SHORT_ALPHA = 0.3
+_BASELINE_DRIFT_SECONDS = 60.0
+_OVERLOAD_EXCEPTIONS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+
+class AdaptiveConcurrencyLimiter:
+  """
+  AIMD limit on in-flight async requests.
+
+  Each successful response grows the limit by 1/limit (about +1 per round
+  trip) while recent latency stays within `latency_tolerance` times the
+  no-load baseline (the lowest smoothed latency seen, creeping up over about
+  a minute so it can follow a server that gets slower) and the limit is
+  actually in use. Timeouts, dropped connections, 429 and 5xx responses
+  cut it by `backoff`; latency beyond twice the tolerance trims it gently.
+  Cuts are spaced at least one recent latency apart so a burst of failures
+  from one overload counts once. Callers beyond the limit wait in FIFO order
+  (`queue_depth`).
+
+  Not thread-safe: share it only among tasks on one event loop.
+  """
+
+  def __init__(
+    self,
+    initial_limit: int = DEFAULT_INITIAL_LIMIT,
+    *,
+    min_limit: int = DEFAULT_MIN_LIMIT,
+    max_limit: int = DEFAULT_MAX_LIMIT,
+    backoff: float = DEFAULT_BACKOFF,
+    latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+  ) -> None:
+    self.min_limit = max(1, int(min_limit))
+    self.max_limit = max(self.min_limit, int(max_limit))
+    self.backoff = backoff
+    self.latency_tolerance = latency_tolerance
+    self._limit = float(min(self.max_limit, max(self.min_limit, initial_limit)))
+    self._in_flight = 0
+    self._waiters: deque = deque()
+    self._short_latency: float | None = None
+    self._baseline_latency: float | None = None
+    self._observed_at = time.monotonic()
+    self._last_cut = 0.0
+    self._successes = 0
+    self._errors = 0
+    self._increases = 0
+    self._decreases = 0
+
+  @property
+  def limit(self) -> int:
+    return int(self._limit)
+
+  @property
+  def in_flight(self) -> int:
+    return self._in_flight
+
+  @property
+  def queue_depth(self) -> int:
+    return sum(1 for waiter in self._waiters if not waiter.done())
+
+  async def acquire(self) -> None:
+    if self._in_flight < self.limit and not self._waiters:
+      self._in_flight += 1
+      return
+    waiter = asyncio.get_running_loop().create_future()
+    self._waiters.append(waiter)
+    try:
+      await waiter
+    except asyncio.CancelledError:
+      if waiter.done() and not waiter.cancelled():
+        # Slot was granted just as we were cancelled; hand it on.
+        self._in_flight -= 1
+        self._wake()
+      else:
+        self._waiters.remove(waiter)
+      raise
+
+  def release(self, latency: float | None = None, error: bool = False) -> None:
+    in_use = self._in_flight
+    self._in_flight -= 1
+    if error:
+      self._errors += 1
+      self._cut(self.backoff)
+    elif latency is not None:
+      self._successes += 1
+      self._observe(latency, in_use)
+    self._wake()
+
+  def _observe(self, latency: float, in_use: int) -> None:
+    now = time.monotonic()
+    if self._short_latency is None:
+      self._short_latency = self._baseline_latency = latency
+    else:
+      self._short_latency += _SHORT_ALPHA * (latency - self._short_latency)
+      drift = 1.0 - math.exp(-(now - self._observed_at) / _BASELINE_DRIFT_SECONDS)
+      self._baseline_latency = min(
+        self._short_latency,
+        self._baseline_latency + drift * (self._short_latency - self._baseline_latency),
+      )
+    self._observed_at = now
+    ratio = self._short_latency / self._baseline_latency if self._baseline_latency else 1.0
+    if ratio > 2 * self.latency_tolerance:
+      self._cut(0.9)
+    elif ratio <= self.latency_tolerance and in_use * 2 >= self._limit and self._limit < self.max_limit:
+      # Only grow when at least half the limit is in use; an idle limit says nothing.
+      self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+      self._increases += 1
+
+  def _cut(self, factor: float) -> None:
+    now = time.monotonic()
+    if now - self._last_cut < (self._short_latency or 0.0):
+      return
+    self._last_cut = now
+    self._limit = max(float(self.min_limit), self._limit * factor)
+    self._decreases += 1
+
+  def _wake(self) -> None:
+    while self._waiters and self._in_flight < self.limit:
+      waiter = self._waiters.popleft()
+      if not waiter.done():
+        self._in_flight += 1
+        waiter.set_result(None)
+
+  def slot(self) -> "RequestSlot":
+    return RequestSlot(self)
+
+  @property
+  def stats(self) -> Dict[str, Any]:
+    return {
+      "limit": self.limit,
+      "in_flight": self._in_flight,
+      "queue_depth": self.queue_depth,
+      "latency_recent": self._short_latency,
+      "latency_baseline": self._baseline_latency,
+      "successes": self._successes,
+      "errors": self._errors,
+      "increases": self._increases,
+      "decreases": self._decreases,
+    }
+
+
+class RequestSlot:
+  """
+  `async with` guard holding one limiter slot for the duration of a request.
+
+  Call `response()` or `exception()` inside the block to feed the outcome
+  back; with no limiter it is a no-op.
+  """
+
+  def __init__(self, limiter: AdaptiveConcurrencyLimiter | None):
+    self.limiter = limiter
+    self._started = 0.0
+    self._latency: float | None = None
+    self._error = False
+
+  async def __aenter__(self) -> "RequestSlot":
+    if self.limiter is not None:
+      await self.limiter.acquire()
+    self._started = time.monotonic()
+    return self
+
+  async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+    if self.limiter is not None:
+      self.limiter.release(self._latency, self._error)
+    return False
+
+  def response(self, response: httpx.Response) -> None:
+    self._latency = time.monotonic() - self._started
+    self._error = response.status_code == 429 or response.status_code >= 500
+
+  def exception(self, exc: BaseException) -> None:
+    self._error = isinstance(exc, _OVERLOAD_EXCEPTIONS)
+
+
+__all__ = [
+  "AdaptiveConcurrencyLimiter",
+  "RequestSlot",
+]
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List
+
+import httpx
+
+from .http_client import async_fetch_page, fetch_page
+from .paginate import async_paginate, paginate
+from .transport import Transport
+
+
+DEFAULT_COUNT_WORKERS = 8
+# Page size for the opt-in scan when the server sends no Content-Range.
+_FALLBACK_PAGE_SIZE = 5000
+
+
+def _probe_options(key: str | None) -> Dict[str, Any]:
+  # One row, one column: the total comes from Content-Range, not the body.
+  options: Dict[str, Any] = {"limit": 1}
+  if key:
+    options["select"] = [key]
+  return options
+
+
+def _scan_options(key: str | None, max_scan: int) -> tuple:
+  # One row past max_scan tells "exactly max_scan" apart from "more".
+  limit = max(0, int(max_scan)) + 1
+  return {"select": [key] if key else None, "limit": limit}, min(_FALLBACK_PAGE_SIZE, limit)
+
+
+def count(
+  core_name: str,
+  filter: str,
+  base_url: str | None,
+  headers: Dict[str, str] | None,
+  transport: Transport | None = None,
+  *,
+  key: str | None = None,
+  max_scan: int | None = None,
+) -> int | None:
+  """
+  Number of rows matching `filter`, read from the Content-Range total of a limit(1) query.
+
+  Without that header the count is unknown and None is returned, unless
+  `max_scan` opts into paging through up to that many rows (selecting only
+  `key`) and counting them; None still means more than `max_scan` matched.
+  """
+  rows, total = fetch_page(core_name, filter, _probe_options(key), base_url, headers, transport)
+  if total is not None:
+    return total
+  if len(rows) < 1:
+    return 0
+  if max_scan is None:
+    return None
+  options, page_size = _scan_options(key, max_scan)
+  found = sum(1 for _ in paginate(core_name, filter, options, base_url, headers, transport, page_size=page_size))
+  return found if found <= max_scan else None
+
+
+async def async_count(
+  core_name: str,
+  filter: str,
+  base_url: str | None,
+  headers: Dict[str, str] | None,
+  transport: Transport | None = None,
+  client: httpx.AsyncClient | None = None,
+  *,
+  key: str | None = None,
+  max_scan: int | None = None,
+) -> int | None:
+  """Async counterpart of count."""
+  rows, total = await async_fetch_page(core_name, filter, _probe_options(key), base_url, headers, transport, client)
+  if total is not None:
+    return total
+  if len(rows) < 1:
+    return 0
+  if max_scan is None:
+    return None
+  options, page_size = _scan_options(key, max_scan)
+  found = 0
+  async for _ in async_paginate(core_name, filter, options, base_url, headers, transport, client, page_size=page_size):
+    found += 1
+  return found if found <= max_scan else None
+
+
+def exists(
+  core_name: str,
+  filter: str,
+  base_url: str | None,
+  headers: Dict[str, str] | None,
+  transport: Transport | None = None,
+  *,
+  key: str | None = None,
+) -> bool:
+  """True when at least one row matches `filter`."""
+  rows, total = fetch_page(core_name, filter, _probe_options(key), base_url, headers, transport)
+  return bool(total) if total is not None else len(rows) > 0
+
+
+async def async_exists(
+  core_name: str,
+  filter: str,
+  base_url: str | None,
+  headers: Dict[str, str] | None,
+  transport: Transport | None = None,
+  client: httpx.AsyncClient | None = None,
+  *,
+  key: str | None = None,
+) -> bool:
+  """Async counterpart of exists."""
+  rows, total = await async_fetch_page(core_name, filter, _probe_options(key), base_url, headers, transport, client)
+  return bool(total) if total is not None else len(rows) > 0
+
+
+def count_many(
+  core_name: str,
+  filters: Iterable[str],
+  base_url: str | None,
+  headers: Dict[str, str] | None,
+  transport: Transport | None = None,
+  *,
+  key: str | None = None,
+  max_workers: int = DEFAULT_COUNT_WORKERS,
+  max_scan: int | None = None,
+) -> List[int | None]:
+  """Count each filter concurrently on a thread pool; results follow the input order."""
+  filters = list(filters)
+  if not filters:
+    return []
+
+  def fetch(filter: str) -> int | None:
+    return count(core_name, filter, base_url, headers, transport, key=key, max_scan=max_scan)
+
+  with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(filters)))) as executor:
+    return list(executor.map(fetch, filters))
+
+
+async def async_count_many(
+  core_name: str,
+  filters: Iterable[str],
+  base_url: str | None,
+  headers: Dict[str, str] | None,
+  transport: Transport | None = None,
+  client: httpx.AsyncClient | None = None,
+  *,
+  key: str | None = None,
+  max_workers: int = DEFAULT_COUNT_WORKERS,
+  max_scan: int | None = None,
+) -> List[int | None]:
+  """Async counterpart of count_many; at most `max_workers` counts are in flight."""
+  semaphore = asyncio.Semaphore(max(1, max_workers))
+
+  async def fetch(filter: str) -> int | None:
+    async with semaphore:
+      return await async_count(core_name, filter, base_url, headers, transport, client, key=key, max_scan=max_scan)
+
+  return list(await asyncio.gather(*(fetch(filter) for filter in filters)))
+
+
+__all__ = [
+  "DEFAULT_COUNT_WORKERS",
+  "async_count",
+  "async_count_many",
+  "async_exists",
+  "count",
+  "count_many",
+  "exists",
+]
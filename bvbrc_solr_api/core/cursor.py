@@ -1,8 +1,27 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Generator, Iterable, List, Optional
+import asyncio
+import time
+from typing import Any, AsyncGenerator, Dict, Generator, Iterable, List, Optional, Sequence, Tuple
 
-from .solr_http_client import select
+import httpx
+
+from .arrow import ArrowBuilder, arrow_builder
+from .page_size import PageSizer
+from .record_types import Record, as_typed, async_as_typed, resolve_record_type
+from .solr_http_client import async_iter_select, async_select, iter_select, select
+from .transport import Transport
+
+
+def _stable_sort(owner: str, sort: str | None, unique_key: str | None) -> str:
+  if not sort:
+    if not unique_key:
+      raise ValueError(f"{owner} requires either sort or unique_key for deterministic ordering")
+    return f"{unique_key} asc"
+  if unique_key and unique_key not in sort:
+    # Ensure stable tie-breaker
+    return f"{sort}, {unique_key} asc"
+  return sort
 
 
 class CursorPager:
@@ -19,6 +38,11 @@ class CursorPager:
     unique_key: str | None = "id",
     start_cursor: str = "*",
     timeout: float = 60.0,
+    transport: Transport | None = None,
+    stream: bool = False,
+    adaptive: bool | PageSizer = False,
+    dictionary_fields: Sequence[str] = (),
+    record_type: type | None = None,
   ) -> None:
     self.collection = collection
     self.base_params = dict(base_params)
@@ -30,51 +54,288 @@ class CursorPager:
     self.unique_key = unique_key
     self.cursor = start_cursor
     self.timeout = timeout
+    self.transport = transport
+    # stream=True parses each page incrementally instead of buffering it
+    self.stream = stream
+    self.sort = _stable_sort("CursorPager", self.sort, self.unique_key)
+    # adaptive=True resizes rows between pages; see PageSizer
+    self.sizer = adaptive if isinstance(adaptive, PageSizer) else PageSizer(self.rows, adaptive=bool(adaptive))
+    # Columns dictionary-encoded by to_arrow() (see ArrowBuilder)
+    self.dictionary_fields = tuple(dictionary_fields)
+    # Record class yielded by iter_records() (see record_types.record_type)
+    self.record_type = record_type
 
-    if not self.sort:
-      if not self.unique_key:
-        raise ValueError("CursorPager requires either sort or unique_key for deterministic ordering")
-      self.sort = f"{self.unique_key} asc"
-    elif self.unique_key and self.unique_key not in self.sort:
-      # Ensure stable tie-breaker
-      self.sort = f"{self.sort}, {self.unique_key} asc"
+  @property
+  def stats(self) -> Dict[str, Any]:
+    return self.sizer.stats
 
   def __iter__(self):
     return self.iter_docs()
 
+  def to_arrow(self, arrow: bool | ArrowBuilder = True):
+    """Consume the remaining docs into a pyarrow.Table, one record batch at a time."""
+    return arrow_builder(arrow, self.dictionary_fields).extend(self.iter_docs()).to_table()
+
+  def iter_typed(self, record_type: type | None = None) -> Generator[Record, None, None]:
+    """Like iter_docs, yielding compact `record_type` instances instead of dicts."""
+    return as_typed(self.iter_docs(), resolve_record_type(record_type, self.record_type))
+
   def iter_docs(self) -> Generator[Dict[str, Any], None, None]:
+    if self.stream:
+      yield from self._iter_streamed_docs()
+      return
+    for docs in self.iter_pages():
+      yield from docs
+
+  def _iter_streamed_docs(self) -> Generator[Dict[str, Any], None, None]:
     last_mark = None
     while True:
       params = dict(self.base_params)
-      params["rows"] = self.rows
+      params["rows"] = self.sizer.rows
       params["sort"] = self.sort
       params["cursorMark"] = self.cursor
 
-      result = select(
+      meta: Dict[str, Any] = {}
+      info: Dict[str, Any] = {}
+      count = 0
+      started = time.monotonic()
+      for doc in iter_select(
         self.collection,
         params,
         base_url=self.base_url,
         headers=self.headers,
         auth=self.auth,
         timeout=self.timeout,
-      )
+        transport=self.transport,
+        meta=meta,
+        info=info,
+      ):
+        count += 1
+        yield doc
+      # Elapsed includes consumer time between docs; acceptable for sizing.
+      self.sizer.observe(params["rows"], count, info.get("bytes"), time.monotonic() - started)
+      next_cursor = meta.get("nextCursorMark")
+
+      if not count:
+        return
+      if next_cursor is None or next_cursor == self.cursor or next_cursor == last_mark:
+        return
+      last_mark = self.cursor
+      self.cursor = next_cursor
+
+  def fetch_page(self, cursor: str) -> Tuple[List[Dict[str, Any]], str | None]:
+    """Fetch the page at `cursor`; returns (docs, nextCursorMark)."""
+    params = dict(self.base_params)
+    params["rows"] = self.sizer.rows
+    params["sort"] = self.sort
+    params["cursorMark"] = cursor
+
+    info: Dict[str, Any] = {}
+    started = time.monotonic()
+    result = select(
+      self.collection,
+      params,
+      base_url=self.base_url,
+      headers=self.headers,
+      auth=self.auth,
+      timeout=self.timeout,
+      transport=self.transport,
+      info=info,
+    )
+    docs = result.get("response", {}).get("docs", [])
+    self.sizer.observe(params["rows"], len(docs), info.get("bytes"), time.monotonic() - started)
+    return docs, result.get("nextCursorMark")
 
-      response = result.get("response", {})
-      docs: List[Dict[str, Any]] = response.get("docs", [])
-      next_cursor = result.get("nextCursorMark")
+  def iter_pages(self) -> Generator[List[Dict[str, Any]], None, None]:
+    last_mark = None
+    while True:
+      docs, next_cursor = self.fetch_page(self.cursor)
 
       if not docs:
         return
 
+      yield docs
+
+      if next_cursor is None or next_cursor == self.cursor or next_cursor == last_mark:
+        return
+      last_mark = self.cursor
+      self.cursor = next_cursor
+
+
+_DONE = object()
+
+
+class AsyncCursorPager:
+  """
+  Async cursorMark pager with read-ahead.
+
+  A background task keeps up to `prefetch` pages queued while the caller is
+  still consuming the current one. `cursor` always names the page last
+  handed to the caller, not the one in flight.
+  """
+
+  def __init__(
+    self,
+    *,
+    collection: str,
+    base_params: Dict[str, Any],
+    base_url: str,
+    headers: Dict[str, str] | None = None,
+    auth: Any = None,
+    rows: int = 1000,
+    sort: str | None = None,
+    unique_key: str | None = "id",
+    start_cursor: str = "*",
+    timeout: float = 60.0,
+    client: httpx.AsyncClient | None = None,
+    transport: Transport | None = None,
+    prefetch: int = 2,
+    stream: bool = False,
+    adaptive: bool | PageSizer = False,
+    dictionary_fields: Sequence[str] = (),
+    record_type: type | None = None,
+  ) -> None:
+    self.collection = collection
+    self.base_params = dict(base_params)
+    self.base_url = base_url
+    self.headers = headers or {}
+    self.auth = auth
+    self.rows = int(rows)
+    self.unique_key = unique_key
+    self.sort = _stable_sort("AsyncCursorPager", sort, unique_key)
+    self.cursor = start_cursor
+    self.timeout = timeout
+    self.client = client
+    self.transport = transport
+    self.prefetch = max(1, int(prefetch))
+    # stream=True parses docs as they arrive; pages are then read without read-ahead
+    self.stream = stream
+    self.sizer = adaptive if isinstance(adaptive, PageSizer) else PageSizer(self.rows, adaptive=bool(adaptive))
+    self.dictionary_fields = tuple(dictionary_fields)
+    self.record_type = record_type
+
+  @property
+  def stats(self) -> Dict[str, Any]:
+    return self.sizer.stats
+
+  def __aiter__(self):
+    return self.iter_docs()
+
+  async def to_arrow(self, arrow: bool | ArrowBuilder = True):
+    """Async counterpart of CursorPager.to_arrow."""
+    builder = arrow_builder(arrow, self.dictionary_fields)
+    await builder.aextend(self.iter_docs())
+    return builder.to_table()
+
+  def iter_typed(self, record_type: type | None = None) -> AsyncGenerator[Record, None]:
+    return async_as_typed(self.iter_docs(), resolve_record_type(record_type, self.record_type))
+
+  async def _fetch_pages(self, queue: asyncio.Queue) -> None:
+    cursor = self.cursor
+    last_mark = None
+    try:
+      while True:
+        params = dict(self.base_params)
+        params["rows"] = self.sizer.rows
+        params["sort"] = self.sort
+        params["cursorMark"] = cursor
+
+        info: Dict[str, Any] = {}
+        started = time.monotonic()
+        result = await async_select(
+          self.collection,
+          params,
+          client=self.client,
+          base_url=self.base_url,
+          headers=self.headers,
+          auth=self.auth,
+          timeout=self.timeout,
+          transport=self.transport,
+          info=info,
+        )
+
+        docs: List[Dict[str, Any]] = result.get("response", {}).get("docs", [])
+        self.sizer.observe(params["rows"], len(docs), info.get("bytes"), time.monotonic() - started)
+        next_cursor = result.get("nextCursorMark")
+        if not docs:
+          break
+        await queue.put((cursor, docs))
+
+        if next_cursor is None or next_cursor == cursor or next_cursor == last_mark:
+          break
+        last_mark = cursor
+        cursor = next_cursor
+    except Exception as exc:
+      await queue.put(exc)
+      return
+    await queue.put(_DONE)
+
+  async def iter_pages(self) -> AsyncGenerator[List[Dict[str, Any]], None]:
+    queue: asyncio.Queue = asyncio.Queue(maxsize=self.prefetch)
+    producer = asyncio.create_task(self._fetch_pages(queue))
+    try:
+      while True:
+        item = await queue.get()
+        if item is _DONE:
+          return
+        if isinstance(item, Exception):
+          raise item
+        self.cursor, docs = item
+        yield docs
+    finally:
+      if not producer.done():
+        producer.cancel()
+        try:
+          await producer
+        except asyncio.CancelledError:
+          pass
+
+  async def iter_docs(self) -> AsyncGenerator[Dict[str, Any], None]:
+    if self.stream:
+      async for doc in self._iter_streamed_docs():
+        yield doc
+      return
+    async for docs in self.iter_pages():
       for doc in docs:
         yield doc
 
+  async def _iter_streamed_docs(self) -> AsyncGenerator[Dict[str, Any], None]:
+    last_mark = None
+    while True:
+      params = dict(self.base_params)
+      params["rows"] = self.sizer.rows
+      params["sort"] = self.sort
+      params["cursorMark"] = self.cursor
+
+      meta: Dict[str, Any] = {}
+      info: Dict[str, Any] = {}
+      count = 0
+      started = time.monotonic()
+      async for doc in async_iter_select(
+        self.collection,
+        params,
+        client=self.client,
+        base_url=self.base_url,
+        headers=self.headers,
+        auth=self.auth,
+        timeout=self.timeout,
+        transport=self.transport,
+        meta=meta,
+        info=info,
+      ):
+        count += 1
+        yield doc
+      self.sizer.observe(params["rows"], count, info.get("bytes"), time.monotonic() - started)
+      next_cursor = meta.get("nextCursorMark")
+
+      if not count:
+        return
       if next_cursor is None or next_cursor == self.cursor or next_cursor == last_mark:
         return
       last_mark = self.cursor
       self.cursor = next_cursor
 
 
-__all__ = ["CursorPager"]
+__all__ = ["AsyncCursorPager", "CursorPager"]
 
 
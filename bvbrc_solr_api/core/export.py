@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, AsyncGenerator, Dict, Generator
+
+import httpx
+
+from .arrow import ArrowBuilder, arrow_builder
+from .cursor import AsyncCursorPager, CursorPager
+from .record_types import Record, as_typed, async_as_typed, resolve_record_type
+from .solr_http_client import async_iter_export, iter_export
+
+logger = logging.getLogger(__name__)
+
+# Statuses meaning "this query cannot be exported" (no docValues, no /export handler).
+_FALLBACK_STATUSES = (400, 404)
+
+
+def _unexportable(params: Dict[str, Any]) -> str | None:
+  # /export needs an explicit docValues field list; wildcards and score are rejected.
+  fields = [field.strip() for field in str(params.get("fl") or "").split(",") if field.strip()]
+  if not fields:
+    return "no fields requested (fl is required by /export)"
+  for field in fields:
+    if "*" in field or field == "score":
+      return f"field {field!r} is not exportable"
+  return None
+
+
+def _export_params(pager: CursorPager | AsyncCursorPager) -> Dict[str, Any]:
+  params = dict(pager.base_params)
+  for key in ("rows", "start", "cursorMark"):
+    params.pop(key, None)
+  params["sort"] = pager.sort
+  return params
+
+
+class ExportStream:
+  """
+  Full-collection dump through Solr's /export handler.
+
+  The whole sorted result set streams back in one response and is parsed
+  tuple by tuple, instead of re-running the query per cursorMark page.
+  When the query cannot be exported (no `fields`, wildcard or score in fl,
+  or Solr rejects it before the first tuple, e.g. a field without
+  docValues) the wrapped CursorPager is used instead; `mode` and
+  `fallback_reason` record which path ran.
+  """
+
+  def __init__(self, pager: CursorPager):
+    self.pager = pager
+    self.mode: str | None = None
+    self.fallback_reason: str | None = None
+    self._docs = 0
+    self._info: Dict[str, Any] = {}
+
+  @property
+  def stats(self) -> Dict[str, Any]:
+    if self.mode == "cursor":
+      return {**self.pager.stats, "mode": self.mode, "fallback_reason": self.fallback_reason}
+    return {"mode": self.mode, "docs": self._docs, "bytes": self._info.get("bytes", 0)}
+
+  def __iter__(self):
+    return self.iter_docs()
+
+  def to_arrow(self, arrow: bool | ArrowBuilder = True):
+    """Consume the dump into a pyarrow.Table (see CursorPager.to_arrow)."""
+    return arrow_builder(arrow, self.pager.dictionary_fields).extend(self.iter_docs()).to_table()
+
+  def iter_typed(self, record_type: type | None = None) -> Generator[Record, None, None]:
+    return as_typed(self.iter_docs(), resolve_record_type(record_type, self.pager.record_type))
+
+  def iter_docs(self) -> Generator[Dict[str, Any], None, None]:
+    pager = self.pager
+    reason = _unexportable(pager.base_params)
+    if reason is None:
+      self.mode = "export"
+      try:
+        for doc in iter_export(
+          pager.collection,
+          _export_params(pager),
+          base_url=pager.base_url,
+          headers=pager.headers,
+          auth=pager.auth,
+          timeout=pager.timeout,
+          transport=pager.transport,
+          info=self._info,
+        ):
+          self._docs += 1
+          yield doc
+        return
+      except httpx.HTTPStatusError as exc:
+        if self._docs or exc.response.status_code not in _FALLBACK_STATUSES:
+          raise
+        reason = f"/export returned HTTP {exc.response.status_code}"
+      except ValueError as exc:
+        if self._docs:
+          raise
+        reason = str(exc)
+    self.mode = "cursor"
+    self.fallback_reason = reason
+    logger.warning("Falling back to cursor paging for %s: %s", pager.collection, reason)
+    yield from pager.iter_docs()
+
+
+class AsyncExportStream:
+  """Async counterpart of ExportStream; falls back to the wrapped AsyncCursorPager."""
+
+  def __init__(self, pager: AsyncCursorPager):
+    self.pager = pager
+    self.mode: str | None = None
+    self.fallback_reason: str | None = None
+    self._docs = 0
+    self._info: Dict[str, Any] = {}
+
+  @property
+  def stats(self) -> Dict[str, Any]:
+    if self.mode == "cursor":
+      return {**self.pager.stats, "mode": self.mode, "fallback_reason": self.fallback_reason}
+    return {"mode": self.mode, "docs": self._docs, "bytes": self._info.get("bytes", 0)}
+
+  def __aiter__(self):
+    return self.iter_docs()
+
+  async def to_arrow(self, arrow: bool | ArrowBuilder = True):
+    builder = arrow_builder(arrow, self.pager.dictionary_fields)
+    await builder.aextend(self.iter_docs())
+    return builder.to_table()
+
+  def iter_typed(self, record_type: type | None = None) -> AsyncGenerator[Record, None]:
+    return async_as_typed(self.iter_docs(), resolve_record_type(record_type, self.pager.record_type))
+
+  async def iter_docs(self) -> AsyncGenerator[Dict[str, Any], None]:
+    pager = self.pager
+    reason = _unexportable(pager.base_params)
+    if reason is None:
+      self.mode = "export"
+      try:
+        async for doc in async_iter_export(
+          pager.collection,
+          _export_params(pager),
+          client=pager.client,
+          base_url=pager.base_url,
+          headers=pager.headers,
+          auth=pager.auth,
+          timeout=pager.timeout,
+          transport=pager.transport,
+          info=self._info,
+        ):
+          self._docs += 1
+          yield doc
+        return
+      except httpx.HTTPStatusError as exc:
+        if self._docs or exc.response.status_code not in _FALLBACK_STATUSES:
+          raise
+        reason = f"/export returned HTTP {exc.response.status_code}"
+      except ValueError as exc:
+        if self._docs:
+          raise
+        reason = str(exc)
+    self.mode = "cursor"
+    self.fallback_reason = reason
+    logger.warning("Falling back to cursor paging for %s: %s", pager.collection, reason)
+    async for doc in pager.iter_docs():
+      yield doc
+
+
+__all__ = ["AsyncExportStream", "ExportStream"]
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+
+DEFAULT_FACET_LIMIT = 100
+DEFAULT_FACET_MINCOUNT = 1
+
+
+class FacetBucket(NamedTuple):
+  value: Any
+  count: int
+
+
+class RangeFacet(NamedTuple):
+  field: str
+  buckets: List[FacetBucket]
+  start: Any
+  end: Any
+  gap: Any
+  before: int | None = None
+  after: int | None = None
+  between: int | None = None
+
+
+class PivotBucket(NamedTuple):
+  field: str
+  value: Any
+  count: int
+  pivot: List["PivotBucket"]
+
+
+class FieldStats(NamedTuple):
+  field: str
+  count: int
+  missing: int
+  min: Any = None
+  max: Any = None
+  sum: float | None = None
+  mean: float | None = None
+  stddev: float | None = None
+  sum_of_squares: float | None = None
+
+
+class RangeSpec(NamedTuple):
+  """Range facet request: dates take Solr date math (start="NOW/YEAR-5YEARS", gap="+1MONTH")."""
+  field: str
+  start: Any
+  end: Any
+  gap: Any
+  other: str | None = None
+
+
+def _buckets(flat: Sequence[Any]) -> List[FacetBucket]:
+  # Solr's default json.nl=flat: [value, count, value, count, ...]
+  return [FacetBucket(value, int(count)) for value, count in zip(flat[0::2], flat[1::2])]
+
+
+def _pivots(entries: Iterable[Dict[str, Any]]) -> List[PivotBucket]:
+  return [
+    PivotBucket(entry.get("field"), entry.get("value"), int(entry.get("count", 0)), _pivots(entry.get("pivot") or []))
+    for entry in entries
+  ]
+
+
+def build_facet_params(
+  base_params: Dict[str, Any],
+  *,
+  fields: Sequence[str] | None = None,
+  ranges: Sequence[RangeSpec | Tuple] | None = None,
+  pivots: Sequence[Sequence[str] | str] | None = None,
+  json_facet: Dict[str, Any] | None = None,
+  stats: Sequence[str] | None = None,
+  limit: int = DEFAULT_FACET_LIMIT,
+  mincount: int = DEFAULT_FACET_MINCOUNT,
+  missing: bool = False,
+  sort: str = "count",
+) -> Dict[str, Any]:
+  """Add facet/stats params to a select request; rows=0 so no documents are returned."""
+  params = dict(base_params)
+  params["rows"] = 0
+  if fields or ranges or pivots:
+    params["facet"] = "true"
+    params["facet.limit"] = limit
+    params["facet.mincount"] = mincount
+    params["facet.sort"] = sort
+    if missing:
+      params["facet.missing"] = "true"
+  if fields:
+    params["facet.field"] = list(fields)
+  if ranges:
+    specs = [spec if isinstance(spec, RangeSpec) else RangeSpec(*spec) for spec in ranges]
+    params["facet.range"] = [spec.field for spec in specs]
+    for spec in specs:
+      params[f"f.{spec.field}.facet.range.start"] = spec.start
+      params[f"f.{spec.field}.facet.range.end"] = spec.end
+      params[f"f.{spec.field}.facet.range.gap"] = spec.gap
+      if spec.other:
+        params[f"f.{spec.field}.facet.range.other"] = spec.other
+      # Report empty range buckets so the series has no holes.
+      params[f"f.{spec.field}.facet.mincount"] = 0
+  if pivots:
+    params["facet.pivot"] = [pivot if isinstance(pivot, str) else ",".join(pivot) for pivot in pivots]
+  if json_facet:
+    params["json.facet"] = json.dumps(json_facet)
+  if stats:
+    params["stats"] = "true"
+    params["stats.field"] = list(stats)
+  return params
+
+
+class FacetResult:
+  """
+  Typed view of a rows=0 facet/stats response.
+
+  `fields` maps field -> [FacetBucket], `ranges` field -> RangeFacet,
+  `pivots` "a,b" -> [PivotBucket], `stats` field -> FieldStats and `json`
+  holds the JSON Facet API output as returned. `raw` is the full response.
+  """
+
+  def __init__(self, raw: Dict[str, Any]):
+    self.raw = raw
+    self.num_found = int(raw.get("response", {}).get("numFound", 0))
+    counts = raw.get("facet_counts") or {}
+    self.fields: Dict[str, List[FacetBucket]] = {
+      field: _buckets(flat) for field, flat in (counts.get("facet_fields") or {}).items()
+    }
+    self.ranges: Dict[str, RangeFacet] = {
+      field: RangeFacet(
+        field,
+        _buckets(info.get("counts") or []),
+        info.get("start"),
+        info.get("end"),
+        info.get("gap"),
+        info.get("before"),
+        info.get("after"),
+        info.get("between"),
+      )
+      for field, info in (counts.get("facet_ranges") or {}).items()
+    }
+    self.pivots: Dict[str, List[PivotBucket]] = {
+      key: _pivots(entries) for key, entries in (counts.get("facet_pivot") or {}).items()
+    }
+    self.stats: Dict[str, FieldStats] = {
+      field: FieldStats(
+        field,
+        int(info.get("count") or 0),
+        int(info.get("missing") or 0),
+        info.get("min"),
+        info.get("max"),
+        info.get("sum"),
+        info.get("mean"),
+        info.get("stddev"),
+        info.get("sumOfSquares"),
+      )
+      for field, info in ((raw.get("stats") or {}).get("stats_fields") or {}).items()
+      if info is not None
+    }
+    self.json: Dict[str, Any] = raw.get("facets") or {}
+
+  def counts(self, field: str) -> Dict[Any, int]:
+    """Field facet as a plain {value: count} dict."""
+    return {bucket.value: bucket.count for bucket in self.fields.get(field, [])}
+
+  def __repr__(self) -> str:
+    return (
+      f"FacetResult(num_found={self.num_found}, fields={list(self.fields)}, ranges={list(self.ranges)}, "
+      f"pivots={list(self.pivots)}, stats={list(self.stats)})"
+    )
+
+
+__all__ = [
+  "FacetBucket",
+  "FacetResult",
+  "FieldStats",
+  "PivotBucket",
+  "RangeFacet",
+  "RangeSpec",
+  "build_facet_params",
+]
@@ -1,15 +1,25 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable
+import re
+from typing import Any, AsyncGenerator, Dict, Generator, Iterable, List, Tuple
 
 import httpx
 
+from .arrow import ArrowBuilder, arrow_builder
+from .cache import ResponseCache, request_scope
+from .compression import ACCEPT_ENCODING
+from .records import aiter_records, iter_records, record_format
+from .transport import Transport, get_default_transport
+
 
 DEFAULT_BASE_URL = "https://www.bv-brc.org/api-bulk"
 DEFAULT_HEADERS = {
   "Accept": "application/json",
   "Content-Type": "application/rqlquery+x-www-form-urlencoded",
+  "Accept-Encoding": ACCEPT_ENCODING,
 }
+# e.g. "items 0-999/48213"; the total is "*" when the server does not know it.
+_CONTENT_RANGE_TOTAL = re.compile(r"/\s*(\d+)\s*$")
 
 
 def create_context(overrides: Dict[str, Any] | None = None) -> Dict[str, Any]:
@@ -20,6 +30,10 @@ def create_context(overrides: Dict[str, Any] | None = None) -> Dict[str, Any]:
   return {
     "base_url": base_url,
     "headers": headers,
+    "transport": overrides.get("transport"),
+    "cache": overrides.get("cache"),
+    "bulk_profile": overrides.get("bulk_profile"),
+    "router": overrides.get("router"),
   }
 
 
@@ -29,6 +43,7 @@ def _build_body(filter: str, options: Dict[str, Any]) -> str:
   select_fields: Iterable[str] | None = options.get("select")
   sort_expr: str | None = options.get("sort")
   limit_value: int | None = options.get("limit")
+  offset_value: int | None = options.get("offset")
   http_download: bool = bool(options.get("http_download", False))
 
   if http_download and not sort_expr:
@@ -44,26 +59,235 @@ def _build_body(filter: str, options: Dict[str, Any]) -> str:
   if sort_expr:
     params.append(qb_sort(sort_expr))
   if isinstance(final_limit, int):
-    params.append(qb_limit(final_limit))
+    params.append(qb_limit(final_limit, offset_value if isinstance(offset_value, int) else None))
   if http_download:
     params.append(qb_http_download(True))
 
   return "&".join([p for p in params if p])
 
-def run(core_name: str, filter: str, options: Dict[str, Any] | None, base_url: str | None, headers: Dict[str, str] | None):
-  options = options or {}
+
+def _prepare(core_name: str, filter: str, options: Dict[str, Any] | None, base_url: str | None, headers: Dict[str, str] | None):
   url = f"{(base_url or DEFAULT_BASE_URL).rstrip('/')}/{core_name}/"
-  body = _build_body(filter, options)
-  final_headers = headers or DEFAULT_HEADERS
+  return url, _build_body(filter, options or {}), headers or DEFAULT_HEADERS
+
+
+def run(
+  core_name: str,
+  filter: str,
+  options: Dict[str, Any] | None,
+  base_url: str | None,
+  headers: Dict[str, str] | None,
+  transport: Transport | None = None,
+  cache: ResponseCache | None = None,
+  stream: bool = False,
+  router: Any = None,
+  arrow: bool | ArrowBuilder = False,
+):
+  """
+  Run an RQL query and return the decoded rows.
+
+  With `arrow` (True or an ArrowBuilder) rows are streamed straight into
+  Arrow record batches and a pyarrow.Table is returned instead; the cache
+  is bypassed in that mode.
+  """
+  if stream:
+    return iter_run(core_name, filter, options, base_url, headers, transport)
+  if router is not None:
+    # e.g. MirrorRouter: a local answer, or None to go to the network.
+    local = router.run(core_name, filter, options)
+    if local is not None:
+      return arrow_builder(arrow).extend(local).to_table() if arrow else local
+  if arrow:
+    return arrow_builder(arrow).extend(iter_run(core_name, filter, options, base_url, headers, transport)).to_table()
+  url, body, final_headers = _prepare(core_name, filter, options, base_url, headers)
+
+  scope = request_scope(url, final_headers) if cache is not None else ""
+  if cache is not None:
+    cached = cache.get(core_name, body, final_headers.get("Accept"), scope)
+    if cached is not None:
+      return cached
+
+  # Shared pooled transport keeps connections alive across calls.
+  response = (transport or get_default_transport()).post(url, content=body, headers=final_headers, timeout=60.0)
+  response.raise_for_status()
+  result = response.json()
+  if cache is not None:
+    cache.set(core_name, body, final_headers.get("Accept"), result, scope)
+  return result
+
+
+async def async_run(
+  core_name: str,
+  filter: str,
+  options: Dict[str, Any] | None,
+  base_url: str | None,
+  headers: Dict[str, str] | None,
+  transport: Transport | None = None,
+  client: httpx.AsyncClient | None = None,
+  cache: ResponseCache | None = None,
+  router: Any = None,
+  arrow: bool | ArrowBuilder = False,
+):
+  """Async counterpart of run; without `client` or `transport` it uses the default transport's pool."""
+  if router is not None:
+    local = router.run(core_name, filter, options)
+    if local is not None:
+      return arrow_builder(arrow).extend(local).to_table() if arrow else local
+  if arrow:
+    builder = arrow_builder(arrow)
+    await builder.aextend(async_iter_run(core_name, filter, options, base_url, headers, transport, client))
+    return builder.to_table()
+  url, body, final_headers = _prepare(core_name, filter, options, base_url, headers)
+
+  scope = request_scope(url, final_headers) if cache is not None else ""
+  if cache is not None:
+    cached = cache.get(core_name, body, final_headers.get("Accept"), scope)
+    if cached is not None:
+      return cached
+
+  if transport is not None:
+    response = await transport.async_post(url, client=client, content=body, headers=final_headers, timeout=60.0)
+  elif client is not None:
+    response = await client.post(url, content=body, headers=final_headers, timeout=60.0)
+  else:
+    response = await get_default_transport().async_post(url, content=body, headers=final_headers, timeout=60.0)
+  response.raise_for_status()
+  result = response.json()
+  if cache is not None:
+    cache.set(core_name, body, final_headers.get("Accept"), result, scope)
+  return result
+
+
+def parse_total(content_range: str | None) -> int | None:
+  match = _CONTENT_RANGE_TOTAL.search(content_range or "")
+  return int(match.group(1)) if match else None
+
+
+def fetch_page(
+  core_name: str,
+  filter: str,
+  options: Dict[str, Any] | None,
+  base_url: str | None,
+  headers: Dict[str, str] | None,
+  transport: Transport | None = None,
+  cache: ResponseCache | None = None,
+  router: Any = None,
+) -> Tuple[List[Any], int | None]:
+  """
+  Run one query and return (rows, total) with total taken from Content-Range.
+
+  Rows answered by `router` or `cache` carry no total (None).
+  """
+  if router is not None:
+    local = router.run(core_name, filter, options)
+    if local is not None:
+      return local, None
+  url, body, final_headers = _prepare(core_name, filter, options, base_url, headers)
+  scope = request_scope(url, final_headers) if cache is not None else ""
+  if cache is not None:
+    cached = cache.get(core_name, body, final_headers.get("Accept"), scope)
+    if cached is not None:
+      return cached, None
+  response = (transport or get_default_transport()).post(url, content=body, headers=final_headers, timeout=60.0)
+  response.raise_for_status()
+  result = response.json()
+  if cache is not None:
+    cache.set(core_name, body, final_headers.get("Accept"), result, scope)
+  return result, parse_total(response.headers.get("Content-Range"))
+
+
+async def async_fetch_page(
+  core_name: str,
+  filter: str,
+  options: Dict[str, Any] | None,
+  base_url: str | None,
+  headers: Dict[str, str] | None,
+  transport: Transport | None = None,
+  client: httpx.AsyncClient | None = None,
+  cache: ResponseCache | None = None,
+  router: Any = None,
+) -> Tuple[List[Any], int | None]:
+  """Async counterpart of fetch_page."""
+  if router is not None:
+    local = router.run(core_name, filter, options)
+    if local is not None:
+      return local, None
+  url, body, final_headers = _prepare(core_name, filter, options, base_url, headers)
+  scope = request_scope(url, final_headers) if cache is not None else ""
+  if cache is not None:
+    cached = cache.get(core_name, body, final_headers.get("Accept"), scope)
+    if cached is not None:
+      return cached, None
+  if transport is not None:
+    response = await transport.async_post(url, client=client, content=body, headers=final_headers, timeout=60.0)
+  elif client is not None:
+    response = await client.post(url, content=body, headers=final_headers, timeout=60.0)
+  else:
+    response = await get_default_transport().async_post(url, content=body, headers=final_headers, timeout=60.0)
+  response.raise_for_status()
+  result = response.json()
+  if cache is not None:
+    cache.set(core_name, body, final_headers.get("Accept"), result, scope)
+  return result, parse_total(response.headers.get("Content-Range"))
+
+
+def iter_run(
+  core_name: str,
+  filter: str,
+  options: Dict[str, Any] | None,
+  base_url: str | None,
+  headers: Dict[str, str] | None,
+  transport: Transport | None = None,
+) -> Generator[Any, None, None]:
+  """
+  Streaming run: yields records as the response body arrives.
+
+  The record format follows the Accept header: JSON and CSV/TSV rows come
+  back as dicts, FASTA as one text record per entry. Responses are never
+  cached. Pair with options {"http_download": True, "sort": ...} for bulk
+  exports.
+  """
+  url, body, final_headers = _prepare(core_name, filter, options, base_url, headers)
+  fmt = record_format(final_headers.get("Accept"))
+  with (transport or get_default_transport()).stream(url, content=body, headers=final_headers, timeout=60.0) as response:
+    response.raise_for_status()
+    yield from iter_records(response.iter_bytes(), fmt)
+
+
+async def async_iter_run(
+  core_name: str,
+  filter: str,
+  options: Dict[str, Any] | None,
+  base_url: str | None,
+  headers: Dict[str, str] | None,
+  transport: Transport | None = None,
+  client: httpx.AsyncClient | None = None,
+) -> AsyncGenerator[Any, None]:
+  """Async counterpart of iter_run."""
+  url, body, final_headers = _prepare(core_name, filter, options, base_url, headers)
+  fmt = record_format(final_headers.get("Accept"))
+  request_kwargs = {"content": body, "headers": final_headers, "timeout": 60.0}
+  if transport is not None:
+    stream = transport.async_stream(url, client=client, **request_kwargs)
+  elif client is not None:
+    stream = client.stream("POST", url, **request_kwargs)
+  else:
+    stream = get_default_transport().async_stream(url, **request_kwargs)
 
-  with httpx.Client() as client:
-    response = client.post(url, content=body, headers=final_headers, timeout=60.0)
+  async with stream as response:
     response.raise_for_status()
-    return response.json()
+    async for record in aiter_records(response.aiter_bytes(), fmt):
+      yield record
 
 
 __all__ = [
   "create_context",
+  "async_fetch_page",
+  "async_iter_run",
+  "async_run",
+  "fetch_page",
+  "iter_run",
+  "parse_total",
   "run",
 ]
 
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any, AsyncGenerator, AsyncIterable, Dict, Generator, Iterable, List, Sequence
+
+
+SOLR_DOCS_PATH = ("response", "docs")
+_WHITESPACE = " \t\r\n"
+_SCALAR_END = _WHITESPACE + ",]}"
+
+
+class _NeedMore(Exception):
+  pass
+
+
+def _set_path(target: Dict[str, Any], path: Sequence[str], value: Any) -> None:
+  for key in path[:-1]:
+    target = target.setdefault(key, {})
+  target[path[-1]] = value
+
+
+class JsonItemParser:
+  """
+  Push parser yielding the items of one JSON array as bytes arrive.
+
+  `path` names the array: () for a top-level array (RQL responses) or
+  ("response", "docs") for Solr. Only the item being decoded is buffered, so
+  memory stays proportional to one document. Values outside the array are
+  collected into `meta` with the same nesting (e.g. meta["nextCursorMark"]).
+  """
+
+  def __init__(self, path: Sequence[str] = ()):
+    self.path = tuple(path)
+    self.meta: Dict[str, Any] = {}
+    self.done = False
+    self._decoder = json.JSONDecoder()
+    self._text = codecs.getincrementaldecoder("utf-8")()
+    self._buf = ""
+    self._pos = 0
+    self._pending: List[str] = []
+    self._pending_len = 0
+    # Chars that must be buffered before a partially received value is retried;
+    # doubling it keeps re-parsing of large documents linear overall.
+    self._min_size = 0
+    self._eof = False
+    self._stack: List[tuple] = []
+    self._state = "value"
+    self._value_path: tuple = ()
+    self._key = ""
+
+  def feed(self, data: bytes) -> List[Any]:
+    text = self._text.decode(data)
+    if text:
+      self._pending.append(text)
+      self._pending_len += len(text)
+    return self._drain()
+
+  def close(self) -> List[Any]:
+    text = self._text.decode(b"", final=True)
+    if text:
+      self._pending.append(text)
+      self._pending_len += len(text)
+    self._eof = True
+    items = self._drain()
+    if not self.done:
+      raise ValueError("Truncated JSON response")
+    return items
+
+  def _drain(self) -> List[Any]:
+    if self._pending:
+      if not self._eof and len(self._buf) - self._pos + self._pending_len < self._min_size:
+        return []
+      self._buf = self._buf[self._pos:] + "".join(self._pending)
+      self._pos = 0
+      self._pending = []
+      self._pending_len = 0
+    items: List[Any] = []
+    try:
+      while not self.done:
+        self._step(items)
+    except _NeedMore:
+      pass
+    return items
+
+  def _skip_ws(self) -> str:
+    buf = self._buf
+    pos = self._pos
+    size = len(buf)
+    while pos < size and buf[pos] in _WHITESPACE:
+      pos += 1
+    self._pos = pos
+    if pos >= size:
+      if self._eof:
+        raise ValueError("Unexpected end of JSON response")
+      self._min_size = 1
+      raise _NeedMore
+    return buf[pos]
+
+  def _decode(self) -> Any:
+    start = self._pos
+    try:
+      value, end = self._decoder.raw_decode(self._buf, start)
+    except json.JSONDecodeError:
+      if self._eof:
+        raise
+      self._min_size = 2 * (len(self._buf) - start)
+      raise _NeedMore
+    if not self._eof and not isinstance(value, (dict, list, str)) and (end == len(self._buf) or self._buf[end] not in _SCALAR_END):
+      # A number or literal cut by the chunk boundary ("1." or "1e") decodes
+      # as a shorter prefix; wait until a delimiter follows it.
+      self._min_size = len(self._buf) - start + 1
+      raise _NeedMore
+    self._min_size = 0
+    self._pos = end
+    return value
+
+  def _expect(self, expected: str) -> str:
+    ch = self._skip_ws()
+    if ch not in expected:
+      raise ValueError(f"Malformed JSON response: expected one of {expected!r}, got {ch!r}")
+    self._pos += 1
+    return ch
+
+  def _after_value(self) -> None:
+    if not self._stack:
+      self.done = True
+      return
+    self._state = "after_member" if self._stack[-1][0] == "obj" else "after_item"
+
+  def _step(self, items: List[Any]) -> None:
+    state = self._state
+    if state == "value":
+      path = self._value_path
+      ch = self._skip_ws()
+      if ch == "{" and len(path) < len(self.path) and self.path[:len(path)] == path:
+        self._pos += 1
+        target = self.meta
+        for key in path:
+          target = target.setdefault(key, {})
+        self._stack.append(("obj", path))
+        self._state = "first_key"
+      elif ch == "[" and path == self.path:
+        self._pos += 1
+        self._stack.append(("arr", path))
+        self._state = "first_item"
+      else:
+        value = self._decode()
+        if path:
+          _set_path(self.meta, path, value)
+        self._after_value()
+    elif state in ("first_key", "next_key"):
+      if state == "first_key" and self._skip_ws() == "}":
+        self._pos += 1
+        self._stack.pop()
+        self._after_value()
+        return
+      self._skip_ws()
+      self._key = self._decode()
+      self._state = "colon"
+    elif state == "colon":
+      self._expect(":")
+      self._value_path = self._stack[-1][1] + (self._key,)
+      self._state = "value"
+    elif state == "after_member":
+      if self._expect(",}") == ",":
+        self._state = "next_key"
+      else:
+        self._stack.pop()
+        self._after_value()
+    elif state == "first_item":
+      if self._skip_ws() == "]":
+        self._pos += 1
+        self._stack.pop()
+        self._after_value()
+      else:
+        self._state = "item"
+    elif state == "item":
+      self._skip_ws()
+      items.append(self._decode())
+      self._state = "after_item"
+    elif state == "after_item":
+      if self._expect(",]") == ",":
+        self._state = "item"
+      else:
+        self._stack.pop()
+        self._after_value()
+
+
+def iter_json_items(
+  chunks: Iterable[bytes],
+  path: Sequence[str] = (),
+  meta: Dict[str, Any] | None = None,
+) -> Generator[Any, None, None]:
+  """Yield array items from a byte stream; `meta` receives the surrounding values once exhausted."""
+  parser = JsonItemParser(path)
+  for chunk in chunks:
+    yield from parser.feed(chunk)
+  yield from parser.close()
+  if meta is not None:
+    meta.update(parser.meta)
+
+
+async def aiter_json_items(
+  chunks: AsyncIterable[bytes],
+  path: Sequence[str] = (),
+  meta: Dict[str, Any] | None = None,
+) -> AsyncGenerator[Any, None]:
+  """Async counterpart of iter_json_items."""
+  parser = JsonItemParser(path)
+  async for chunk in chunks:
+    for item in parser.feed(chunk):
+      yield item
+  for item in parser.close():
+    yield item
+  if meta is not None:
+    meta.update(parser.meta)
+
+
+__all__ = [
+  "JsonItemParser",
+  "SOLR_DOCS_PATH",
+  "aiter_json_items",
+  "iter_json_items",
+]
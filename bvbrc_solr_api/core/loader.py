@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List
+
+
+DEFAULT_COALESCE_WINDOW = 0.002
+DEFAULT_COALESCE_MAX_BATCH = 500
+
+
+class BatchLoader:
+  """
+  DataLoader-style coalescing of concurrent single-key loads.
+
+  Keys requested within `window` seconds are fetched with one call to
+  `batch_fn(keys)`, which returns a mapping of key -> value. Identical keys
+  already queued or in flight share a single future.
+  """
+
+  def __init__(
+    self,
+    batch_fn: Callable[[List[Any]], Awaitable[Dict[Any, Any]]],
+    *,
+    window: float = DEFAULT_COALESCE_WINDOW,
+    max_batch: int = DEFAULT_COALESCE_MAX_BATCH,
+  ) -> None:
+    self.batch_fn = batch_fn
+    self.window = window
+    self.max_batch = max(1, int(max_batch))
+    self._futures: Dict[str, asyncio.Future] = {}
+    self._queue: List[Any] = []
+    self._timer: asyncio.TimerHandle | None = None
+    self._tasks: set[asyncio.Task] = set()
+
+  async def load(self, key: Any) -> Any:
+    token = str(key)
+    future = self._futures.get(token)
+    if future is None:
+      loop = asyncio.get_running_loop()
+      future = loop.create_future()
+      self._futures[token] = future
+      self._queue.append(key)
+      if len(self._queue) >= self.max_batch:
+        self._dispatch()
+      elif self._timer is None:
+        self._timer = loop.call_later(self.window, self._dispatch)
+    # Shield so one cancelled caller does not cancel the shared result.
+    return await asyncio.shield(future)
+
+  def _dispatch(self) -> None:
+    if self._timer is not None:
+      self._timer.cancel()
+      self._timer = None
+    batch, self._queue = self._queue, []
+    if batch:
+      task = asyncio.get_running_loop().create_task(self._fetch(batch))
+      self._tasks.add(task)
+      task.add_done_callback(self._tasks.discard)
+
+  async def _fetch(self, keys: List[Any]) -> None:
+    try:
+      results = await self.batch_fn(keys)
+    except Exception as exc:
+      for key in keys:
+        future = self._futures.pop(str(key), None)
+        if future is not None and not future.done():
+          future.set_exception(exc)
+      return
+    except BaseException:
+      # Cancellation or interpreter shutdown: never leave waiters hanging.
+      for key in keys:
+        future = self._futures.pop(str(key), None)
+        if future is not None and not future.done():
+          future.cancel()
+      raise
+    for key in keys:
+      future = self._futures.pop(str(key), None)
+      if future is not None and not future.done():
+        future.set_result(results.get(key))
+
+
+__all__ = ["BatchLoader"]
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Generator, Iterable, List, Sequence
+
+from .resource import BaseResource
+from .solr_query_builder import qb as solrqb
+
+
+DEFAULT_MODIFIED_FIELD = "date_modified"
+DEFAULT_DELTA_WINDOW = timedelta(days=7)
+# Re-read this much before the last high-water mark to absorb clock skew and
+# late commits; upserts make the overlap harmless.
+DEFAULT_OVERLAP = timedelta(hours=1)
+_BATCH = 1000
+
+
+def solr_date(value: datetime) -> str:
+  return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def parse_solr_date(value: str) -> datetime:
+  return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _table(name: str) -> str:
+  if not name.replace("_", "").isalnum():
+    raise ValueError(f"Invalid collection or field name '{name}'")
+  return f'"{name}"'
+
+
+def _kind(value: Any) -> str:
+  if isinstance(value, bool):
+    return "bool"
+  if isinstance(value, (int, float)):
+    return "number"
+  if isinstance(value, str):
+    return "text"
+  if isinstance(value, list):
+    return "array"
+  return "object"
+
+
+class Mirror:
+  """
+  Local SQLite copy of selected collections kept current by date_modified deltas.
+
+  Each collection is a table of (key, date_modified, doc JSON) keyed by the
+  resource's unique key, with optional json_extract indexes per field
+  (`index_fields={"genome": ["genome_id", "taxon_id"]}`). `full_sync` pulls
+  every doc with stream_all_solr and drops local rows it did not see;
+  `delta_sync` re-pulls docs modified since the last sync in `window`-sized
+  date ranges, upserting them and committing the high-water mark after
+  each window. Remote deletions never show up in a delta, so
+  `reconcile` (or delta_sync(reconcile=True)) streams the remote unique
+  keys and deletes local rows that are gone.
+  """
+
+  def __init__(self, path: str, *, index_fields: Dict[str, Sequence[str]] | None = None):
+    self.path = path
+    self.index_fields = {collection: list(fields) for collection, fields in (index_fields or {}).items()}
+    self.db = sqlite3.connect(path)
+    self.db.row_factory = sqlite3.Row
+    self.db.execute("PRAGMA journal_mode=WAL")
+    self.db.execute("PRAGMA synchronous=NORMAL")
+    self.db.execute(
+      "CREATE TABLE IF NOT EXISTS mirror_state ("
+      " collection TEXT PRIMARY KEY, unique_key TEXT, modified_field TEXT, fq TEXT,"
+      " fields TEXT, high_water TEXT, generation INTEGER, last_full_sync REAL, last_delta_sync REAL)"
+    )
+    # JSON value kinds (text, number, bool, array, object) seen per indexed field, for MirrorRouter.
+    self.db.execute(
+      "CREATE TABLE IF NOT EXISTS mirror_fields (collection TEXT, field TEXT, kinds TEXT, PRIMARY KEY (collection, field))"
+    )
+    self.db.commit()
+
+  def _ensure_table(self, collection: str) -> str:
+    table = _table(collection)
+    self.db.execute(
+      f"CREATE TABLE IF NOT EXISTS {table} ("
+      " key TEXT PRIMARY KEY, date_modified TEXT, doc TEXT NOT NULL, generation INTEGER NOT NULL)"
+    )
+    self.db.execute(f'CREATE INDEX IF NOT EXISTS "ix_{collection}__date_modified" ON {table}(date_modified)')
+    for field in self.index_fields.get(collection, []):
+      _table(field)
+      # Index expressions cannot take bound parameters; the name is validated above.
+      self.db.execute(f"CREATE INDEX IF NOT EXISTS \"ix_{collection}_{field}\" ON {table}(json_extract(doc, '$.{field}'))")
+    return table
+
+  def _tracked(self, collection: str, key: str, modified_field: str) -> Dict[str, set]:
+    return {field: set() for field in [key, modified_field, *self.index_fields.get(collection, [])]}
+
+  def state(self, collection: str) -> Dict[str, Any] | None:
+    row = self.db.execute("SELECT * FROM mirror_state WHERE collection = ?", (collection,)).fetchone()
+    if row is None:
+      return None
+    state = dict(row)
+    state["fq"] = json.loads(state["fq"]) if state["fq"] else None
+    state["fields"] = json.loads(state["fields"]) if state["fields"] else None
+    return state
+
+  def _save_state(self, collection: str, **values: Any) -> None:
+    for key in ("fq", "fields"):
+      if key in values:
+        values[key] = json.dumps(values[key]) if values[key] else None
+    current = self.state(collection)
+    if current is None:
+      values["collection"] = collection
+      columns = ", ".join(values)
+      self.db.execute(f"INSERT INTO mirror_state ({columns}) VALUES ({', '.join('?' for _ in values)})", tuple(values.values()))
+    else:
+      assignments = ", ".join(f"{key} = ?" for key in values)
+      self.db.execute(f"UPDATE mirror_state SET {assignments} WHERE collection = ?", (*values.values(), collection))
+
+  def field_kinds(self, collection: str) -> Dict[str, set]:
+    """Value kinds seen per indexed field since the last full sync; fields without a row were never tracked."""
+    rows = self.db.execute("SELECT field, kinds FROM mirror_fields WHERE collection = ?", (collection,)).fetchall()
+    return {row["field"]: set(filter(None, row["kinds"].split(","))) for row in rows}
+
+  def _save_kinds(self, collection: str, kinds: Dict[str, set], reset: bool) -> None:
+    if reset:
+      self.db.execute("DELETE FROM mirror_fields WHERE collection = ?", (collection,))
+    else:
+      for field, seen in self.field_kinds(collection).items():
+        kinds.setdefault(field, set()).update(seen)
+    self.db.executemany(
+      "INSERT OR REPLACE INTO mirror_fields (collection, field, kinds) VALUES (?, ?, ?)",
+      [(collection, field, ",".join(sorted(seen))) for field, seen in kinds.items()],
+    )
+
+  def _upsert(
+    self,
+    table: str,
+    docs: Iterable[Dict[str, Any]],
+    key: str,
+    modified_field: str,
+    generation: int,
+    kinds: Dict[str, set] | None = None,
+  ) -> int:
+    count = 0
+    batch: List[tuple] = []
+    sql = (
+      f"INSERT INTO {table} (key, date_modified, doc, generation) VALUES (?, ?, ?, ?) "
+      "ON CONFLICT(key) DO UPDATE SET date_modified = excluded.date_modified, doc = excluded.doc, generation = excluded.generation"
+    )
+    for doc in docs:
+      batch.append((str(doc[key]), doc.get(modified_field), json.dumps(doc, separators=(",", ":")), generation))
+      if kinds is not None:
+        for field, seen in kinds.items():
+          value = doc.get(field)
+          if value is not None:
+            seen.add(_kind(value))
+      if len(batch) >= _BATCH:
+        self.db.executemany(sql, batch)
+        count += len(batch)
+        batch = []
+    if batch:
+      self.db.executemany(sql, batch)
+      count += len(batch)
+    return count
+
+  def full_sync(
+    self,
+    resource: BaseResource,
+    *,
+    fields: List[str] | None = None,
+    profile: str = "full",
+    fq: List[str] | None = None,
+    rows: int = 1000,
+    modified_field: str = DEFAULT_MODIFIED_FIELD,
+    overlap: timedelta = DEFAULT_OVERLAP,
+  ) -> Dict[str, Any]:
+    """Pull every doc (matching `fq`), replace the local table's contents and reset the high-water mark."""
+    collection = resource.collection
+    key = resource.unique_key
+    if not key:
+      raise ValueError(f"{collection} has no unique key to mirror by")
+    started = time.time()
+    table = self._ensure_table(collection)
+    previous = self.state(collection)
+    generation = (previous["generation"] if previous else 0) + 1
+    fields = resource._fields(fields, profile)
+    if fields and key not in fields:
+      fields = [*fields, key]
+    if fields and modified_field not in fields:
+      fields = [*fields, modified_field]
+    pager = resource.stream_all_solr(rows=rows, fields=fields, profile=profile, fq=fq)
+    kinds = self._tracked(collection, key, modified_field)
+    upserted = self._upsert(table, pager, key, modified_field, generation, kinds)
+    self._save_kinds(collection, kinds, reset=True)
+    deleted = self.db.execute(f"DELETE FROM {table} WHERE generation < ?", (generation,)).rowcount
+    self._save_state(
+      collection,
+      unique_key=key,
+      modified_field=modified_field,
+      fq=fq,
+      fields=fields,
+      high_water=solr_date(datetime.fromtimestamp(started, timezone.utc) - overlap),
+      generation=generation,
+      last_full_sync=started,
+    )
+    self.db.commit()
+    return {"collection": collection, "mode": "full", "upserted": upserted, "deleted": deleted, "seconds": round(time.time() - started, 3)}
+
+  def delta_sync(
+    self,
+    resource: BaseResource,
+    *,
+    window: timedelta = DEFAULT_DELTA_WINDOW,
+    rows: int = 1000,
+    overlap: timedelta = DEFAULT_OVERLAP,
+    reconcile: bool = False,
+  ) -> Dict[str, Any]:
+    """Upsert docs modified since the last sync, one committed date window at a time."""
+    collection = resource.collection
+    state = self.state(collection)
+    if state is None:
+      raise ValueError(f"{collection} has not been mirrored yet; run full_sync first")
+    started = time.time()
+    table = self._ensure_table(collection)
+    modified_field = state["modified_field"]
+    now = datetime.fromtimestamp(started, timezone.utc)
+    window_start = parse_solr_date(state["high_water"])
+    upserted = 0
+    windows = 0
+    while True:
+      window_end = window_start + window
+      last = window_end >= now
+      # Half-open windows; the last one is open-ended so nothing newer than `now` is skipped.
+      bound = solrqb.gt(modified_field, solr_date(window_start), inclusive=True) if last else solrqb.between(
+        modified_field, solr_date(window_start), solr_date(window_end), include_end=False
+      )
+      pager = resource.stream_all_solr(rows=rows, fields=state["fields"], profile="full", fq=[*(state["fq"] or []), bound])
+      kinds = self._tracked(collection, state["unique_key"], modified_field)
+      upserted += self._upsert(table, pager, state["unique_key"], modified_field, state["generation"], kinds)
+      self._save_kinds(collection, kinds, reset=False)
+      windows += 1
+      high_water = now - overlap if last else window_end
+      self._save_state(collection, high_water=solr_date(high_water), last_delta_sync=started)
+      self.db.commit()
+      if last:
+        break
+      window_start = window_end
+    deleted = self.reconcile(resource) if reconcile else 0
+    return {
+      "collection": collection,
+      "mode": "delta",
+      "windows": windows,
+      "upserted": upserted,
+      "deleted": deleted,
+      "seconds": round(time.time() - started, 3),
+    }
+
+  def sync(self, resource: BaseResource, **kwargs: Any) -> Dict[str, Any]:
+    """full_sync the first time a collection is seen, delta_sync afterwards."""
+    if self.state(resource.collection) is None:
+      return self.full_sync(resource, **kwargs)
+    return self.delta_sync(resource, **kwargs)
+
+  def reconcile(self, resource: BaseResource, *, rows: int = 10000) -> int:
+    """Delete local rows whose key no longer exists remotely; returns the number removed."""
+    collection = resource.collection
+    state = self.state(collection)
+    if state is None:
+      return 0
+    table = self._ensure_table(collection)
+    self.db.execute("CREATE TEMP TABLE IF NOT EXISTS mirror_remote_keys (key TEXT PRIMARY KEY)")
+    self.db.execute("DELETE FROM mirror_remote_keys")
+    pager = resource.stream_all_solr(rows=rows, profile="ids", fq=state["fq"], export=True)
+    key = state["unique_key"]
+    batch: List[tuple] = []
+    for doc in pager:
+      batch.append((str(doc[key]),))
+      if len(batch) >= _BATCH:
+        self.db.executemany("INSERT OR IGNORE INTO mirror_remote_keys (key) VALUES (?)", batch)
+        batch = []
+    if batch:
+      self.db.executemany("INSERT OR IGNORE INTO mirror_remote_keys (key) VALUES (?)", batch)
+    deleted = self.db.execute(f"DELETE FROM {table} WHERE key NOT IN (SELECT key FROM mirror_remote_keys)").rowcount
+    self.db.execute("DELETE FROM mirror_remote_keys")
+    self.db.commit()
+    return deleted
+
+  def get(self, collection: str, key: Any) -> Dict[str, Any] | None:
+    row = self.db.execute(f"SELECT doc FROM {_table(collection)} WHERE key = ?", (str(key),)).fetchone()
+    return json.loads(row["doc"]) if row else None
+
+  def iter_docs(self, collection: str, where: str = "", params: Sequence[Any] = ()) -> Generator[Dict[str, Any], None, None]:
+    """
+    Yield mirrored docs, optionally filtered by an SQL condition over the
+    row, e.g. where="json_extract(doc, '$.genome_id') = ?".
+    """
+    sql = f"SELECT doc FROM {_table(collection)}" + (f" WHERE {where}" if where else "") + " ORDER BY key"
+    for row in self.db.execute(sql, tuple(params)):
+      yield json.loads(row["doc"])
+
+  def count(self, collection: str, where: str = "", params: Sequence[Any] = ()) -> int:
+    sql = f"SELECT COUNT(*) FROM {_table(collection)}" + (f" WHERE {where}" if where else "")
+    return int(self.db.execute(sql, tuple(params)).fetchone()[0])
+
+  def close(self) -> None:
+    self.db.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    self.close()
+    return False
+
+
+__all__ = ["Mirror", "parse_solr_date", "solr_date"]
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+
+DEFAULT_TARGET_LATENCY = 2.0
+DEFAULT_MAX_PAGE_BYTES = 8 * 1024 * 1024
+DEFAULT_MIN_ROWS = 10
+DEFAULT_MAX_ROWS = 10000
+# Bounds on how far one page may move the size, so a single outlier cannot swing it.
+_MAX_GROWTH = 2.0
+_MAX_SHRINK = 0.25
+
+
+class PageSizer:
+  """
+  Chooses `rows` for each cursor page and records what each page cost.
+
+  Fixed by default. With `adaptive=True` the next size is the largest that
+  should keep a page within `target_latency` seconds and `max_page_bytes`
+  (decoded body), extrapolated from the last page's per-document cost,
+  and moves at most 2x up or 4x down per page within [min_rows, max_rows].
+  Changing rows between requests is safe for cursorMark paging.
+  """
+
+  def __init__(
+    self,
+    rows: int = 1000,
+    *,
+    adaptive: bool = False,
+    target_latency: float | None = DEFAULT_TARGET_LATENCY,
+    max_page_bytes: int | None = DEFAULT_MAX_PAGE_BYTES,
+    min_rows: int = DEFAULT_MIN_ROWS,
+    max_rows: int = DEFAULT_MAX_ROWS,
+  ) -> None:
+    self.adaptive = adaptive
+    self.target_latency = target_latency
+    self.max_page_bytes = max_page_bytes
+    self.min_rows = max(1, int(min_rows))
+    self.max_rows = max(self.min_rows, int(max_rows))
+    self.rows = int(rows) if not adaptive else min(self.max_rows, max(self.min_rows, int(rows)))
+    self.page_rows: List[int] = []
+    self._docs = 0
+    self._bytes = 0
+    self._elapsed = 0.0
+
+  def observe(self, rows: int, docs: int, nbytes: int | None, elapsed: float) -> None:
+    """Record a page fetched with `rows` that returned `docs` documents."""
+    self.page_rows.append(rows)
+    self._docs += docs
+    self._bytes += nbytes or 0
+    self._elapsed += elapsed
+    if not self.adaptive or not docs:
+      return
+    candidates = []
+    if self.target_latency and elapsed > 0:
+      candidates.append(self.target_latency * docs / elapsed)
+    if self.max_page_bytes and nbytes:
+      candidates.append(self.max_page_bytes * docs / nbytes)
+    if not candidates:
+      return
+    proposed = min(candidates)
+    proposed = min(rows * _MAX_GROWTH, max(rows * _MAX_SHRINK, proposed))
+    self.rows = int(min(self.max_rows, max(self.min_rows, proposed)))
+
+  @property
+  def stats(self) -> Dict[str, Any]:
+    pages = len(self.page_rows)
+    return {
+      "pages": pages,
+      "docs": self._docs,
+      "bytes": self._bytes,
+      "seconds": round(self._elapsed, 3),
+      "rows": self.rows,
+      "min_rows": min(self.page_rows) if pages else None,
+      "max_rows": max(self.page_rows) if pages else None,
+      "page_rows": list(self.page_rows),
+      "avg_page_seconds": round(self._elapsed / pages, 3) if pages else None,
+      "avg_page_bytes": self._bytes // pages if pages else None,
+    }
+
+
+__all__ = ["PageSizer"]
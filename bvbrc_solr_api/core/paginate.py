@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncGenerator, Dict, Generator, List, Tuple
+
+import httpx
+
+from .cache import ResponseCache
+from .http_client import async_fetch_page, fetch_page
+from .transport import Transport
+
+
+DEFAULT_PAGE_SIZE = 1000
+# Options read by the paginator itself; never sent to the server.
+PAGINATE_OPTION_KEYS = ("paginate", "page_size", "max_workers")
+
+
+def _page_options(options: Dict[str, Any], offset: int, size: int) -> Dict[str, Any]:
+  page_options = {k: v for k, v in options.items() if k not in PAGINATE_OPTION_KEYS}
+  page_options["limit"] = size
+  page_options["offset"] = offset
+  return page_options
+
+
+def _bounds(options: Dict[str, Any], page_size: int) -> Tuple[int, int | None, int]:
+  """(start offset, row cap or None, first page size) for paginated options."""
+  start = options.get("offset")
+  start = start if isinstance(start, int) else 0
+  cap = options.get("limit")
+  cap = cap if isinstance(cap, int) else None
+  first = page_size if cap is None else min(page_size, cap)
+  return start, cap, first
+
+
+def _remaining_pages(start: int, first: int, total: int, cap: int | None, page_size: int) -> List[Tuple[int, int]]:
+  end = total if cap is None else min(total, start + cap)
+  return [(offset, min(page_size, end - offset)) for offset in range(start + first, end, page_size)]
+
+
+def paginate(
+  core_name: str,
+  filter: str,
+  options: Dict[str, Any] | None,
+  base_url: str | None,
+  headers: Dict[str, str] | None,
+  transport: Transport | None = None,
+  *,
+  page_size: int = DEFAULT_PAGE_SIZE,
+  max_workers: int = 1,
+  cache: ResponseCache | None = None,
+  router: Any = None,
+) -> Generator[Any, None, None]:
+  """
+  Yield every row matching `filter` by issuing limit(n,offset) pages.
+
+  `options["limit"]` caps the total rows (all rows when absent) and
+  `options["offset"]` sets the starting row. With `max_workers > 1` and a
+  total known from the first page's Content-Range header, later pages are
+  fetched concurrently; rows are still yielded in order. Offsets are only
+  stable under a deterministic sort. Each page goes through `router` and
+  `cache` like a single run() call; a page served locally reports no total,
+  so paging then continues sequentially until a short page.
+  """
+  options = options or {}
+  page_size = max(1, int(page_size))
+  start, cap, first = _bounds(options, page_size)
+  if first <= 0:
+    return
+
+  def fetch(offset: int, size: int) -> Tuple[List[Any], int | None]:
+    return fetch_page(core_name, filter, _page_options(options, offset, size), base_url, headers, transport, cache=cache, router=router)
+
+  rows, total = fetch(start, first)
+  yield from rows
+
+  if total is not None and max_workers > 1:
+    pages = iter(_remaining_pages(start, first, total, cap, page_size))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+      in_flight: deque = deque(executor.submit(fetch, *page) for _, page in zip(range(max_workers), pages))
+      try:
+        while in_flight:
+          rows, _ = in_flight.popleft().result()
+          page = next(pages, None)
+          if page is not None:
+            in_flight.append(executor.submit(fetch, *page))
+          yield from rows
+      finally:
+        for future in in_flight:
+          future.cancel()
+    return
+
+  fetched = len(rows)
+  size = first
+  # A short page marks the end when the server does not report a total.
+  while len(rows) == size and (cap is None or fetched < cap) and (total is None or start + fetched < total):
+    size = page_size if cap is None else min(page_size, cap - fetched)
+    rows, _ = fetch(start + fetched, size)
+    yield from rows
+    fetched += len(rows)
+
+
+async def async_paginate(
+  core_name: str,
+  filter: str,
+  options: Dict[str, Any] | None,
+  base_url: str | None,
+  headers: Dict[str, str] | None,
+  transport: Transport | None = None,
+  client: httpx.AsyncClient | None = None,
+  *,
+  page_size: int = DEFAULT_PAGE_SIZE,
+  max_workers: int = 1,
+  cache: ResponseCache | None = None,
+  router: Any = None,
+) -> AsyncGenerator[Any, None]:
+  """Async counterpart of paginate; concurrent pages run as tasks on the shared client."""
+  options = options or {}
+  page_size = max(1, int(page_size))
+  start, cap, first = _bounds(options, page_size)
+  if first <= 0:
+    return
+
+  def fetch(offset: int, size: int):
+    return async_fetch_page(
+      core_name, filter, _page_options(options, offset, size), base_url, headers, transport, client, cache=cache, router=router
+    )
+
+  rows, total = await fetch(start, first)
+  for row in rows:
+    yield row
+
+  if total is not None and max_workers > 1:
+    pages = iter(_remaining_pages(start, first, total, cap, page_size))
+    in_flight: deque = deque(asyncio.ensure_future(fetch(*page)) for _, page in zip(range(max_workers), pages))
+    try:
+      while in_flight:
+        rows, _ = await in_flight.popleft()
+        page = next(pages, None)
+        if page is not None:
+          in_flight.append(asyncio.ensure_future(fetch(*page)))
+        for row in rows:
+          yield row
+    finally:
+      for task in in_flight:
+        task.cancel()
+      await asyncio.gather(*in_flight, return_exceptions=True)
+    return
+
+  fetched = len(rows)
+  size = first
+  while len(rows) == size and (cap is None or fetched < cap) and (total is None or start + fetched < total):
+    size = page_size if cap is None else min(page_size, cap - fetched)
+    rows, _ = await fetch(start + fetched, size)
+    for row in rows:
+      yield row
+    fetched += len(rows)
+
+
+__all__ = [
+  "DEFAULT_PAGE_SIZE",
+  "async_paginate",
+  "paginate",
+]
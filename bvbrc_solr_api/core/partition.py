@@ -0,0 +1,460 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncGenerator, Callable, Dict, Generator, List, Tuple
+
+import httpx
+
+from .cursor import AsyncCursorPager, CursorPager
+from .solr_http_client import async_select, select
+from .solr_query_builder import qb as solrqb
+from .transport import Transport
+
+
+SPLIT_STRATEGIES = ("sample", "facet")
+# Most distinct values the "facet" strategy lists; beyond that it plans like "sample".
+MAX_FACET_SPLIT_VALUES = 10000
+# Histogram buckets per partition when splitting a numeric or date range.
+_BUCKETS_PER_PARTITION = 32
+# Rounds of range counts spent narrowing string split points.
+_MAX_BISECT_ROUNDS = 24
+_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z$")
+_DONE = object()
+
+
+def _rows0(base_params: Dict[str, Any], **params: Any) -> Dict[str, Any]:
+  result = dict(base_params)
+  result["rows"] = 0
+  result.update(params)
+  return result
+
+
+def _facet_params(base_params: Dict[str, Any], field: str) -> Dict[str, Any]:
+  return _rows0(base_params, **{
+    "facet": "true",
+    "facet.field": field,
+    "facet.limit": MAX_FACET_SPLIT_VALUES,
+    "facet.mincount": 1,
+    "facet.sort": "index",
+  })
+
+
+def _stats_params(base_params: Dict[str, Any], field: str) -> Dict[str, Any]:
+  return _rows0(base_params, **{"stats": "true", "stats.field": field})
+
+
+def _range_params(base_params: Dict[str, Any], field: str, start: Any, end: Any, gap: str) -> Dict[str, Any]:
+  return _rows0(base_params, **{
+    "facet": "true",
+    "facet.range": field,
+    "facet.range.start": start,
+    "facet.range.end": end,
+    "facet.range.gap": gap,
+    "facet.mincount": 0,
+  })
+
+
+def _below_params(base_params: Dict[str, Any], field: str, bounds: List[str]) -> Dict[str, Any]:
+  return _rows0(base_params, **{"facet": "true", "facet.query": [solrqb.lt(field, bound) for bound in bounds]})
+
+
+def _parse_date(value: str) -> datetime:
+  return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _format_date(value: datetime) -> str:
+  return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def _balanced_splits(buckets: List[Tuple[Any, int]], partitions: int) -> List[Any]:
+  # Bucket values where a new partition starts, given (value, count) in value order.
+  total = sum(count for _, count in buckets)
+  if not total:
+    return []
+  target = total / partitions
+  splits: List[Any] = []
+  running = 0
+  for value, count in buckets:
+    # Start a new partition at this bucket once the current one is full.
+    if running >= target * (len(splits) + 1) and len(splits) < partitions - 1:
+      splits.append(value)
+    running += count
+  return splits
+
+
+def _midpoint(low: str, high: str) -> str | None:
+  """
+  A string roughly halfway between `low` and `high` in code point order, or
+  None when none fits between them. Strings are read as digits over the
+  smallest alphabet covering both (printable ASCII for typical IDs).
+  """
+  codes = [ord(ch) for ch in low + high]
+  first, last = min(codes + [0x20]), max(codes + [0x7E])
+  if last >= 0xD800:
+    return None
+  base = last - first + 1
+  size = max(len(low), len(high)) + 1
+
+  def number(text: str) -> int:
+    value = 0
+    for ch in text.ljust(size, chr(first)):
+      value = value * base + ord(ch) - first
+    return value
+
+  value = (number(low) + number(high)) // 2
+  digits = []
+  for _ in range(size):
+    value, digit = divmod(value, base)
+    digits.append(chr(first + digit))
+  middle = "".join(reversed(digits))
+  # Prefer the shortest prefix that still fits: readable, stable split values.
+  return next((middle[:n] for n in range(1, size + 1) if low < middle[:n] < high), None)
+
+
+def _dedupe_sorted(values: List[Any]) -> List[Any]:
+  splits: List[Any] = []
+  for value in values:
+    if value is not None and (not splits or value != splits[-1]):
+      splits.append(value)
+  return splits
+
+
+def partition_filters(field: str, splits: List[Any], include_missing: bool = False) -> List[str]:
+  """
+  Build disjoint fq ranges over `field` that together cover every value.
+
+  Ranges are half-open ([a TO b}) so a boundary value lands in exactly one
+  partition; the first and last ranges are open-ended.
+  """
+  if not splits:
+    filters = [f"{field}:[* TO *]"]
+  else:
+    filters = [solrqb.lt(field, splits[0])]
+    for start, end in zip(splits, splits[1:]):
+      filters.append(solrqb.between(field, start, end, include_start=True, include_end=False))
+    filters.append(solrqb.gt(field, splits[-1], inclusive=True))
+  if include_missing:
+    # Documents without the split field are matched by no range above.
+    filters.append(f"-{field}:[* TO *]")
+  return filters
+
+
+def _sample_splits(base_params: Dict[str, Any], field: str, partitions: int) -> Generator[Dict[str, Any], Dict[str, Any], List[Any]]:
+  """
+  Plan quantile split points from `field` stats, without deep-offset queries.
+
+  Numeric and date fields take one range facet over [min, max]; other
+  (string) fields are bisected with batched `field:[* TO x}` counts. Yields
+  the params of each rows=0 request and is sent its response.
+  """
+  result = yield _stats_params(base_params, field)
+  info = ((result.get("stats") or {}).get("stats_fields") or {}).get(field) or {}
+  count = int(info.get("count") or 0)
+  low, high = info.get("min"), info.get("max")
+  if not count or low is None or low == high:
+    return []
+  if count + int(info.get("missing") or 0) > int(result.get("response", {}).get("numFound", 0)):
+    raise ValueError(f"Cannot partition on multi-valued field '{field}'")
+  buckets = partitions * _BUCKETS_PER_PARTITION
+  if isinstance(low, (int, float)) and not isinstance(low, bool):
+    if float(low).is_integer() and float(high).is_integer() and high - low >= buckets:
+      start, gap = int(low), math.ceil((int(high) - int(low) + 1) / buckets)
+    else:
+      start, gap = low, (high - low) / buckets
+    # One bucket past max, so max itself is counted.
+    bounds = [start + gap * i for i in range(buckets + 2)]
+    result = yield _range_params(base_params, field, start, bounds[-1], str(gap))
+  elif isinstance(low, str) and _DATE.match(low) and _DATE.match(str(high)):
+    first = _parse_date(low)
+    gap_ms = max(1, math.ceil(((_parse_date(high) - first) / timedelta(milliseconds=1) + 1) / buckets))
+    bounds = [_format_date(first + timedelta(milliseconds=gap_ms * i)) for i in range(buckets + 2)]
+    result = yield _range_params(base_params, field, bounds[0], bounds[-1], f"+{gap_ms}MILLISECONDS")
+  else:
+    return (yield from _bisect_splits(base_params, field, str(low), str(high), count, partitions))
+  flat = ((result.get("facet_counts") or {}).get("facet_ranges") or {}).get(field, {}).get("counts", [])
+  return _balanced_splits(list(zip(bounds, flat[1::2])), partitions)
+
+
+def _bisect_splits(
+  base_params: Dict[str, Any], field: str, low: str, high: str, count: int, partitions: int
+) -> Generator[Dict[str, Any], Dict[str, Any], List[Any]]:
+  # Each split k narrows [lower, upper] around the value with count*k/partitions docs below it.
+  targets = [count * k / partitions for k in range(1, partitions)]
+  lower, upper = [low] * len(targets), [high] * len(targets)
+  tolerance = max(1, count // (partitions * 100))
+  settled = [False] * len(targets)
+  for _ in range(_MAX_BISECT_ROUNDS):
+    probes: Dict[int, str] = {}
+    for index in range(len(targets)):
+      middle = None if settled[index] else _midpoint(lower[index], upper[index])
+      if middle is None:
+        settled[index] = True
+      else:
+        probes[index] = middle
+    if not probes:
+      break
+    result = yield _below_params(base_params, field, list(probes.values()))
+    below = (result.get("facet_counts") or {}).get("facet_queries") or {}
+    for index, middle in probes.items():
+      found = int(below.get(solrqb.lt(field, middle), 0))
+      if abs(found - targets[index]) <= tolerance:
+        upper[index], settled[index] = middle, True
+      elif found < targets[index]:
+        lower[index] = middle
+      else:
+        upper[index] = middle
+  return _dedupe_sorted(sorted(upper))
+
+
+def _facet_splits(base_params: Dict[str, Any], field: str, partitions: int) -> Generator[Dict[str, Any], Dict[str, Any], List[Any]]:
+  result = yield _facet_params(base_params, field)
+  flat = result.get("facet_counts", {}).get("facet_fields", {}).get(field, [])
+  if len(flat) // 2 >= MAX_FACET_SPLIT_VALUES:
+    # Too many distinct values to list; the buckets seen would skew the splits.
+    return (yield from _sample_splits(base_params, field, partitions))
+  return _balanced_splits(list(zip(flat[0::2], flat[1::2])), partitions)
+
+
+class PartitionedExporter:
+  """
+  Full-collection export split into N disjoint key ranges.
+
+  Split points are quantiles of `split_field` planned from its stats
+  ("sample": a range facet for numeric/date keys, bisection by range
+  counts for string keys such as feature_id) or from facet bucket counts
+  ("facet", suited to low-cardinality keys like genome_id; falls back to
+  "sample" above MAX_FACET_SPLIT_VALUES values). Each range is then read by
+  its own cursor stream, on threads (`for doc in exporter`) or on an event
+  loop (`async for doc in exporter`). Every document is emitted exactly once;
+  ordering across partitions is interleaved.
+  """
+
+  def __init__(
+    self,
+    *,
+    collection: str,
+    base_params: Dict[str, Any],
+    base_url: str,
+    headers: Dict[str, str] | None = None,
+    auth: Any = None,
+    rows: int = 1000,
+    unique_key: str = "id",
+    split_field: str | None = None,
+    partitions: int = 4,
+    strategy: str = "sample",
+    timeout: float = 60.0,
+    transport: Transport | None = None,
+    client: httpx.AsyncClient | None = None,
+    prefetch: int = 2,
+  ) -> None:
+    if strategy not in SPLIT_STRATEGIES:
+      raise ValueError(f"Invalid split strategy '{strategy}'. Supported values: {', '.join(SPLIT_STRATEGIES)}.")
+    self.collection = collection
+    self.base_params = dict(base_params)
+    self.base_url = base_url
+    self.headers = headers or {}
+    self.auth = auth
+    self.rows = int(rows)
+    self.unique_key = unique_key
+    self.split_field = split_field or unique_key
+    self.partitions = max(1, int(partitions))
+    self.strategy = strategy
+    self.timeout = timeout
+    self.transport = transport
+    self.client = client
+    self.prefetch = prefetch
+    self.filters: List[str] | None = None
+
+  def _select_kwargs(self) -> Dict[str, Any]:
+    return {
+      "base_url": self.base_url,
+      "headers": self.headers,
+      "auth": self.auth,
+      "timeout": self.timeout,
+      "transport": self.transport,
+    }
+
+  def _filters_for(self, splits: List[Any]) -> List[str]:
+    return partition_filters(self.split_field, splits, include_missing=self.split_field != self.unique_key)
+
+  def _splits(self) -> Generator[Dict[str, Any], Dict[str, Any], List[Any]]:
+    planner = _facet_splits if self.strategy == "facet" else _sample_splits
+    return planner(self.base_params, self.split_field, self.partitions)
+
+  def plan(self) -> List[str]:
+    """Compute (once) the per-partition fq ranges."""
+    if self.filters is not None:
+      return self.filters
+    splits: List[Any] = []
+    if self.partitions > 1:
+      steps = self._splits()
+      try:
+        params = next(steps)
+        while True:
+          params = steps.send(select(self.collection, params, **self._select_kwargs()))
+      except StopIteration as stop:
+        splits = stop.value
+    self.filters = self._filters_for(splits)
+    return self.filters
+
+  async def async_plan(self) -> List[str]:
+    if self.filters is not None:
+      return self.filters
+    splits: List[Any] = []
+    if self.partitions > 1:
+      kwargs = dict(self._select_kwargs(), client=self.client)
+      steps = self._splits()
+      try:
+        params = next(steps)
+        while True:
+          params = steps.send(await async_select(self.collection, params, **kwargs))
+      except StopIteration as stop:
+        splits = stop.value
+    self.filters = self._filters_for(splits)
+    return self.filters
+
+  def _params_for(self, range_fq: str) -> Dict[str, Any]:
+    params = dict(self.base_params)
+    fq = params.get("fq") or []
+    params["fq"] = (list(fq) if isinstance(fq, (list, tuple)) else [fq]) + [range_fq]
+    return params
+
+  def pagers(self) -> List[CursorPager]:
+    return [
+      CursorPager(
+        collection=self.collection,
+        base_params=self._params_for(range_fq),
+        base_url=self.base_url,
+        headers=self.headers,
+        auth=self.auth,
+        rows=self.rows,
+        unique_key=self.unique_key,
+        timeout=self.timeout,
+        transport=self.transport,
+      )
+      for range_fq in self.plan()
+    ]
+
+  async def async_pagers(self) -> List[AsyncCursorPager]:
+    return [
+      AsyncCursorPager(
+        collection=self.collection,
+        base_params=self._params_for(range_fq),
+        base_url=self.base_url,
+        headers=self.headers,
+        auth=self.auth,
+        rows=self.rows,
+        unique_key=self.unique_key,
+        timeout=self.timeout,
+        client=self.client,
+        transport=self.transport,
+        prefetch=self.prefetch,
+      )
+      for range_fq in await self.async_plan()
+    ]
+
+  def write(self, sink_factory: Callable[[int], Any]) -> int:
+    """
+    Drain every partition on its own thread into its own sink and return the rows written.
+
+    `sink_factory(index)` creates the sink for partition `index` (see
+    open_sink); each is closed when its partition completes, or aborted if
+    it fails.
+    """
+    pagers = self.pagers()
+
+    def drain(index: int, pager: CursorPager) -> int:
+      rows = 0
+      with sink_factory(index) as sink:
+        for page in pager.iter_pages():
+          sink.write(page)
+          rows += len(page)
+      return rows
+
+    with ThreadPoolExecutor(max_workers=len(pagers)) as executor:
+      return sum(executor.map(drain, range(len(pagers)), pagers))
+
+  def __iter__(self):
+    return self.iter_docs()
+
+  def __aiter__(self):
+    return self.async_iter_docs()
+
+  def iter_docs(self) -> Generator[Dict[str, Any], None, None]:
+    pagers = self.pagers()
+    pages: queue.Queue = queue.Queue(maxsize=len(pagers) * 2)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+      while not stop.is_set():
+        try:
+          pages.put(item, timeout=0.1)
+          return True
+        except queue.Full:
+          continue
+      return False
+
+    def drain(pager: CursorPager) -> None:
+      try:
+        for page in pager.iter_pages():
+          if not put(page):
+            return
+      except Exception as exc:
+        put(exc)
+      finally:
+        put(_DONE)
+
+    with ThreadPoolExecutor(max_workers=len(pagers)) as executor:
+      for pager in pagers:
+        executor.submit(drain, pager)
+      remaining = len(pagers)
+      try:
+        while remaining:
+          item = pages.get()
+          if item is _DONE:
+            remaining -= 1
+          elif isinstance(item, Exception):
+            raise item
+          else:
+            yield from item
+      finally:
+        stop.set()
+
+  async def async_iter_docs(self) -> AsyncGenerator[Dict[str, Any], None]:
+    pagers = await self.async_pagers()
+    pages: asyncio.Queue = asyncio.Queue(maxsize=len(pagers) * 2)
+
+    async def drain(pager: AsyncCursorPager) -> None:
+      try:
+        async for page in pager.iter_pages():
+          await pages.put(page)
+      except Exception as exc:
+        await pages.put(exc)
+      finally:
+        await pages.put(_DONE)
+
+    tasks = [asyncio.create_task(drain(pager)) for pager in pagers]
+    remaining = len(tasks)
+    try:
+      while remaining:
+        item = await pages.get()
+        if item is _DONE:
+          remaining -= 1
+        elif isinstance(item, Exception):
+          raise item
+        else:
+          for doc in item:
+            yield doc
+    finally:
+      for task in tasks:
+        task.cancel()
+      await asyncio.gather(*tasks, return_exceptions=True)
+
+
+__all__ = ["PartitionedExporter", "partition_filters"]
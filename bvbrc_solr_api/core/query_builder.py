@@ -23,6 +23,14 @@ def lt(field_name: str, value) -> str:
   return f"lt({field_name},{_encode(value)})"
 
 
+def ge(field_name: str, value) -> str:
+  return f"ge({field_name},{_encode(value)})"
+
+
+def le(field_name: str, value) -> str:
+  return f"le({field_name},{_encode(value)})"
+
+
 def and_filters(*parts: str) -> str:
   cleaned = [p for p in parts if p]
   return f"and({','.join(cleaned)})" if cleaned else ""
@@ -46,8 +54,10 @@ def sort(sort_expr: str) -> str:
   return f"sort({sort_expr})" if sort_expr else ""
 
 
-def limit(limit_value: int) -> str:
-  return f"limit({int(limit_value)})" if isinstance(limit_value, int) else ""
+def limit(limit_value: int, offset: int | None = None) -> str:
+  if not isinstance(limit_value, int):
+    return ""
+  return f"limit({int(limit_value)},{int(offset)})" if offset else f"limit({int(limit_value)})"
 
 
 def http_download(enable: bool = False) -> str:
@@ -67,6 +77,11 @@ qb = SimpleNamespace(
   eq=eq,
   gt=gt,
   lt=lt,
+  ge=ge,
+  le=le,
+  # Aliases used by the generated *_range methods.
+  gte=ge,
+  lte=le,
   and_=and_filters,
   or_=or_filters,
   in_=in_filters,
@@ -84,6 +99,8 @@ __all__ = [
   "eq",
   "gt",
   "lt",
+  "ge",
+  "le",
   "and_filters",
   "or_filters",
   "in_filters",
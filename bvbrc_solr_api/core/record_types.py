@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import keyword
+import sys
+from typing import Any, AsyncGenerator, AsyncIterable, Callable, Dict, Generator, Iterable, List, Sequence, Tuple
+
+
+# Numeric fields shared across collections; values are converted on load so
+# sorting and comparisons in Python are numeric.
+NUMERIC_FIELDS: Dict[str, Callable[[Any], Any]] = {
+  "start": int,
+  "end": int,
+  "na_length": int,
+  "aa_length": int,
+  "taxon_id": int,
+  "counts": float,
+  "fpkm": float,
+  "tpm": float,
+  "log2_fc": float,
+  "p_value": float,
+  "z_score": float,
+  "other_value": float,
+}
+
+_MISSING = object()
+
+
+def _convert(convert: Callable[[Any], Any], field: str) -> Callable[[Any], Any]:
+  def converter(value: Any) -> Any:
+    try:
+      if isinstance(value, list):
+        return [convert(item) for item in value]
+      return convert(value)
+    except (TypeError, ValueError):
+      raise ValueError(f"Cannot convert {field}={value!r} with {getattr(convert, '__name__', convert)}") from None
+
+  return converter
+
+
+def _intern(value: Any) -> Any:
+  if isinstance(value, str):
+    return sys.intern(value)
+  if isinstance(value, list):
+    return [sys.intern(item) if isinstance(item, str) else item for item in value]
+  return value
+
+
+class Record:
+  """
+  Base of the `__slots__` record types built by record_type().
+
+  Declared fields are attributes (None when the doc lacks them); any other
+  keys go to the `extra` dict, so `to_dict()` gives back the original doc.
+  Records also answer `record["field"]` and `record.get("field")`.
+  """
+
+  __slots__ = ("extra",)
+  fields: Tuple[str, ...] = ()
+  _layout: Tuple[Tuple[str, Callable[[Any], Any] | None], ...] = ()
+  _field_set: frozenset = frozenset()
+
+  @classmethod
+  def from_doc(cls, doc: Dict[str, Any]) -> "Record":
+    record = cls.__new__(cls)
+    matched = 0
+    for name, convert in cls._layout:
+      value = doc.get(name)
+      if value is not None:
+        matched += 1
+        if convert is not None:
+          value = convert(value)
+      setattr(record, name, value)
+    extra = None
+    if matched != len(doc):
+      extra = {key: value for key, value in doc.items() if key not in cls._field_set} or None
+    record.extra = extra
+    return record
+
+  @classmethod
+  def from_docs(cls, docs: Iterable[Dict[str, Any]]) -> List["Record"]:
+    from_doc = cls.from_doc
+    return [from_doc(doc) for doc in docs]
+
+  def get(self, name: str, default: Any = None) -> Any:
+    value = self._value(name)
+    return default if value is _MISSING else value
+
+  def _value(self, name: str) -> Any:
+    if name in self._field_set:
+      value = getattr(self, name)
+      return _MISSING if value is None else value
+    return self.extra.get(name, _MISSING) if self.extra else _MISSING
+
+  def __getitem__(self, name: str) -> Any:
+    value = self._value(name)
+    if value is _MISSING:
+      raise KeyError(name)
+    return value
+
+  def __contains__(self, name: str) -> bool:
+    return self._value(name) is not _MISSING
+
+  def to_dict(self) -> Dict[str, Any]:
+    doc = {name: getattr(self, name) for name in self.fields if getattr(self, name) is not None}
+    if self.extra:
+      doc.update(self.extra)
+    return doc
+
+  def __eq__(self, other: Any) -> bool:
+    if type(other) is not type(self):
+      return NotImplemented
+    return self.to_dict() == other.to_dict()
+
+  __hash__ = None
+
+  def __repr__(self) -> str:
+    values = ", ".join(f"{key}={value!r}" for key, value in self.to_dict().items())
+    return f"{type(self).__name__}({values})"
+
+
+def record_type(
+  name: str,
+  fields: Sequence[str],
+  *,
+  types: Dict[str, Callable[[Any], Any]] | None = None,
+  interned: Sequence[str] = (),
+) -> type:
+  """
+  Build a Record subclass with one slot per field.
+
+  Fields named in NUMERIC_FIELDS (or `types`, which takes precedence) are
+  converted on load; string values of `interned` fields are sys.intern'ed
+  so repeated categories share one object.
+  """
+  fields = tuple(dict.fromkeys(fields))
+  reserved = set(dir(Record))
+  for field in fields:
+    if not field.isidentifier() or keyword.iskeyword(field) or field.startswith("__") or field in reserved:
+      raise ValueError(f"Field '{field}' cannot be a record attribute")
+  converters = {field: NUMERIC_FIELDS[field] for field in fields if field in NUMERIC_FIELDS}
+  converters.update({field: convert for field, convert in (types or {}).items() if field in fields})
+  layout = []
+  for field in fields:
+    if field in converters:
+      layout.append((field, _convert(converters[field], field)))
+    elif field in interned:
+      layout.append((field, _intern))
+    else:
+      layout.append((field, None))
+  return type(name, (Record,), {
+    "__slots__": fields,
+    "__module__": __name__,
+    "fields": fields,
+    "_layout": tuple(layout),
+    "_field_set": frozenset(fields),
+  })
+
+
+def resolve_record_type(record_type: type | None, default: type | None) -> type:
+  record_type = record_type or default
+  if record_type is None:
+    raise ValueError("No record type: pass one to iter_typed() or create the pager with record_type=")
+  return record_type
+
+
+def as_typed(docs: Iterable[Dict[str, Any]], cls: type) -> Generator[Record, None, None]:
+  """Lazily convert docs to records of `cls`."""
+  from_doc = cls.from_doc
+  for doc in docs:
+    yield from_doc(doc)
+
+
+async def async_as_typed(docs: AsyncIterable[Dict[str, Any]], cls: type) -> AsyncGenerator[Record, None]:
+  from_doc = cls.from_doc
+  async for doc in docs:
+    yield from_doc(doc)
+
+
+__all__ = ["NUMERIC_FIELDS", "Record", "as_typed", "async_as_typed", "record_type", "resolve_record_type"]
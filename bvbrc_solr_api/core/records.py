@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import codecs
+import csv
+from typing import Any, AsyncGenerator, AsyncIterable, Dict, Generator, Iterable, List
+
+from .json_stream import JsonItemParser
+
+
+RECORD_FORMATS = ("json", "csv", "tsv", "fasta")
+
+
+def record_format(content_type: str | None) -> str:
+  """Map an Accept / Content-Type value onto one of RECORD_FORMATS."""
+  media = (content_type or "").split(";", 1)[0].strip().lower()
+  if media.endswith("fasta"):
+    return "fasta"
+  if media in ("text/csv", "application/csv"):
+    return "csv"
+  if media in ("text/tsv", "text/tab-separated-values"):
+    return "tsv"
+  if media.endswith("json") or not media:
+    return "json"
+  raise ValueError(f"Cannot stream records for content type '{content_type}'. Supported formats: {', '.join(RECORD_FORMATS)}.")
+
+
+class _LineParser:
+  """Splits decoded text into complete lines, keeping line endings."""
+
+  def __init__(self):
+    self._text = codecs.getincrementaldecoder("utf-8")()
+    self._tail = ""
+
+  def _lines(self, data: bytes, final: bool = False) -> List[str]:
+    # Split on "\n" only; str.splitlines would also break on \x1c,  , etc.
+    parts = (self._tail + self._text.decode(data, final=final)).split("\n")
+    tail = parts.pop()
+    lines = [part + "\n" for part in parts]
+    if final:
+      if tail:
+        lines.append(tail)
+      tail = ""
+    self._tail = tail
+    return lines
+
+
+class DelimitedParser(_LineParser):
+  """
+  Push parser yielding CSV/TSV rows as dicts keyed by the header row.
+
+  Rows match csv.DictReader: a quote opens a quoted field only at the start
+  of a field (so `5" disk` is literal text), quoted fields may span lines,
+  short rows are padded with None and extra values go under the None key.
+  """
+
+  def __init__(self, delimiter: str = ","):
+    super().__init__()
+    self.delimiter = delimiter
+    self.fieldnames: List[str] | None = None
+    self._pending: List[str] = []
+    self._in_quotes = False
+
+  def feed(self, data: bytes) -> List[Dict[str, Any]]:
+    return self._rows(self._lines(data))
+
+  def close(self) -> List[Dict[str, Any]]:
+    rows = self._rows(self._lines(b"", final=True))
+    if self._pending:
+      raise ValueError("Truncated delimited response: unterminated quoted field")
+    return rows
+
+  def _ends_quoted(self, line: str, in_quotes: bool) -> bool:
+    # Whether `line` leaves a quoted field open, following the csv module's rules.
+    if not in_quotes and '"' not in line:
+      return False
+    delimiter = self.delimiter
+    size = len(line)
+    pos = 0
+    at_start = not in_quotes
+    while pos < size:
+      if in_quotes:
+        end = line.find('"', pos)
+        if end < 0:
+          return True
+        if end + 1 < size and line[end + 1] == '"':
+          pos = end + 2
+          continue
+        in_quotes = False
+        at_start = False
+        pos = end + 1
+      elif at_start and line[pos] == '"':
+        in_quotes = True
+        pos += 1
+      else:
+        end = line.find(delimiter, pos)
+        if end < 0:
+          return False
+        pos = end + 1
+        at_start = True
+    return in_quotes
+
+  def _rows(self, lines: List[str]) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    for line in lines:
+      self._pending.append(line)
+      self._in_quotes = self._ends_quoted(line, self._in_quotes)
+      if self._in_quotes:
+        # Quoted field continues on the next line.
+        continue
+      records = list(csv.reader(self._pending, delimiter=self.delimiter))
+      self._pending = []
+      for record in records:
+        if not record:
+          continue
+        if self.fieldnames is None:
+          self.fieldnames = record
+          continue
+        row: Dict[Any, Any] = dict(zip(self.fieldnames, record))
+        if len(record) > len(self.fieldnames):
+          row[None] = record[len(self.fieldnames):]
+        elif len(record) < len(self.fieldnames):
+          for field in self.fieldnames[len(record):]:
+            row[field] = None
+        rows.append(row)
+    return rows
+
+
+class FastaParser(_LineParser):
+  """Push parser yielding one FASTA record (header line plus sequence lines) at a time."""
+
+  def __init__(self):
+    super().__init__()
+    self._record: List[str] = []
+
+  def feed(self, data: bytes) -> List[str]:
+    return self._records(self._lines(data))
+
+  def close(self) -> List[str]:
+    records = self._records(self._lines(b"", final=True))
+    if self._record:
+      records.append("".join(self._record))
+      self._record = []
+    return records
+
+  def _records(self, lines: List[str]) -> List[str]:
+    records: List[str] = []
+    for line in lines:
+      if line.startswith(">") and self._record:
+        records.append("".join(self._record))
+        self._record = []
+      if self._record or line.strip():
+        self._record.append(line)
+    return records
+
+
+def record_parser(fmt: str):
+  if fmt == "json":
+    return JsonItemParser(())
+  if fmt == "csv":
+    return DelimitedParser(",")
+  if fmt == "tsv":
+    return DelimitedParser("\t")
+  if fmt == "fasta":
+    return FastaParser()
+  raise ValueError(f"Invalid record format '{fmt}'. Supported values: {', '.join(RECORD_FORMATS)}.")
+
+
+def iter_records(chunks: Iterable[bytes], fmt: str = "json") -> Generator[Any, None, None]:
+  """
+  Yield records from a byte stream as they complete.
+
+  JSON arrays and CSV/TSV rows yield dicts; FASTA yields each record's text
+  unchanged, so it can be written straight to a file.
+  """
+  parser = record_parser(fmt)
+  for chunk in chunks:
+    yield from parser.feed(chunk)
+  yield from parser.close()
+
+
+async def aiter_records(chunks: AsyncIterable[bytes], fmt: str = "json") -> AsyncGenerator[Any, None]:
+  """Async counterpart of iter_records."""
+  parser = record_parser(fmt)
+  async for chunk in chunks:
+    for record in parser.feed(chunk):
+      yield record
+  for record in parser.close():
+    yield record
+
+
+__all__ = [
+  "DelimitedParser",
+  "FastaParser",
+  "RECORD_FORMATS",
+  "aiter_records",
+  "iter_records",
+  "record_format",
+  "record_parser",
+]
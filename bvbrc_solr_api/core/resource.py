@@ -0,0 +1,629 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Iterable, List
+
+from .arrow import ArrowBuilder, arrow_builder
+from .batch import DEFAULT_CHUNK_SIZE, DEFAULT_MAX_WORKERS, async_get_many, async_solr_get_many, get_many, solr_get_many
+from .checkpoint import CheckpointedExport
+from .count import DEFAULT_COUNT_WORKERS, async_count, async_count_many, async_exists, count, count_many, exists
+from .cursor import AsyncCursorPager, CursorPager
+from .http_client import async_iter_run, async_run, iter_run, run
+from .export import AsyncExportStream, ExportStream
+from .facets import DEFAULT_FACET_LIMIT, DEFAULT_FACET_MINCOUNT, FacetResult, RangeSpec, build_facet_params
+from .loader import DEFAULT_COALESCE_MAX_BATCH, DEFAULT_COALESCE_WINDOW, BatchLoader
+from .page_size import PageSizer
+from .paginate import DEFAULT_PAGE_SIZE, async_paginate, paginate
+from .partition import PartitionedExporter
+from .query_builder import qb
+from .record_types import as_typed, async_as_typed, record_type as build_record_type
+from .sinks import SINK_FORMATS, open_sink
+from .solr_http_client import async_select, create_solr_context, select
+from .solr_query_builder import DEFAULT_TERMS_CHUNK_SIZE, qb as solrqb
+
+
+class BaseResource:
+  """
+  Shared plumbing for collection resources.
+
+  Subclasses set `collection` and `unique_key`; every query method goes
+  through `_run` so the context (transport, etc.) is honoured uniformly.
+  When the context carries an `async_client` (see AsyncBVBRCClient) query
+  methods return awaitables served by that shared client, and with a
+  `loaders` registry concurrent unique-key lookups are coalesced.
+
+  `field_profiles` names field lists selectable with options {"profile": name}
+  (or `profile=` on the Solr streaming methods). "ids" (unique key only) and
+  "full" (all stored fields) always exist. The Solr bulk exports
+  (stream_all_solr, stream_partitioned, dump) default to `bulk_profile` when
+  no fields are given; set the context's "bulk_profile" to "full" to opt out.
+
+  With options {"arrow": True} `_run` returns a pyarrow.Table instead of a
+  list; string columns in `dictionary_fields` are dictionary-encoded there
+  and in the pagers' `to_arrow()`.
+
+  With options {"record_type": True} results are compact `__slots__`
+  records (see record_type()) instead of dicts; pagers offer the same
+  through `iter_typed()`. Record attributes are `record_fields`, else the
+  "summary" profile (a subclass with neither cannot build records);
+  numeric fields are typed and `dictionary_fields` strings interned.
+  """
+
+  collection: str = ""
+  unique_key: str | None = "id"
+  field_profiles: Dict[str, List[str]] = {}
+  bulk_profile: str | None = None
+  dictionary_fields: tuple = ()
+  record_fields: List[str] | None = None
+  _record_types: Dict[type, type] = {}
+
+  def __init__(self, context: Dict[str, Any]):
+    self._ctx = context
+
+  def profile_fields(self, profile: str) -> List[str] | None:
+    """Fields of a named profile; None means all stored fields."""
+    if profile == "full":
+      return None
+    if profile == "ids":
+      return [self.unique_key] if self.unique_key else None
+    if profile not in self.field_profiles:
+      available = ", ".join(["ids", "full", *sorted(self.field_profiles)])
+      raise ValueError(f"Unknown field profile '{profile}' for {self.collection}; available: {available}")
+    return list(self.field_profiles[profile])
+
+  def _fields(self, fields: List[str] | None, profile: str | None, bulk: bool = False) -> List[str] | None:
+    # Explicit fields win, then the requested profile, then the bulk default.
+    if fields:
+      return list(fields)
+    if profile is None and bulk:
+      profile = self._ctx.get("bulk_profile") or self.bulk_profile
+    return self.profile_fields(profile) if profile else None
+
+  def _options(self, options: Dict[str, Any] | None, bulk: bool = False) -> Dict[str, Any]:
+    options = dict(options or {})
+    select_fields = self._fields(options.get("select"), options.pop("profile", None), bulk)
+    if select_fields:
+      options["select"] = select_fields
+    return options
+
+  @classmethod
+  def record_type(cls) -> type:
+    """The collection's Record class (built once per resource class)."""
+    record_cls = BaseResource._record_types.get(cls)
+    if record_cls is None:
+      fields = cls.record_fields or cls.field_profiles.get("summary")
+      if not fields:
+        # A key-only class would push every other field into `extra`, costing more than the dict.
+        raise ValueError(f"{cls.__name__} declares no record_fields or summary profile; typed records are unavailable")
+      record_cls = build_record_type(f"{cls.__name__}Record", fields, interned=cls.dictionary_fields)
+      BaseResource._record_types[cls] = record_cls
+    return record_cls
+
+  def _typed(self, options: Dict[str, Any]) -> type | None:
+    # options["record_type"]: True for the collection's Record class, or a class to use.
+    requested = options.pop("record_type", None)
+    if not requested:
+      return None
+    return requested if isinstance(requested, type) else self.record_type()
+
+  async def _async_typed(self, awaitable, record_cls: type):
+    return record_cls.from_docs(await awaitable)
+
+  async def _async_arrow(self, docs, builder: ArrowBuilder):
+    await builder.aextend(docs)
+    return builder.to_table()
+
+  def _run_paginated(self, filter: str, options: Dict[str, Any]):
+    options = dict(options)
+    arrow = options.pop("arrow", False)
+    if arrow and options.get("record_type"):
+      raise ValueError("record_type and arrow are mutually exclusive")
+    docs = self.iter_all(
+      filter,
+      options,
+      page_size=options.get("page_size", DEFAULT_PAGE_SIZE),
+      max_workers=options.get("max_workers", 1),
+    )
+    if not arrow:
+      return docs
+    # One table over every page rather than a generator of rows.
+    builder = arrow_builder(arrow, self.dictionary_fields)
+    if self._ctx.get("async_client") is not None:
+      return self._async_arrow(docs, builder)
+    return builder.extend(docs).to_table()
+
+  def _run(self, filter: str, options: Dict[str, Any] | None = None):
+    if options and options.get("paginate"):
+      return self._run_paginated(filter, options)
+    options = self._options(options)
+    record_cls = self._typed(options)
+    arrow = options.pop("arrow", False)
+    if arrow and record_cls is not None:
+      raise ValueError("record_type and arrow are mutually exclusive")
+    if arrow:
+      arrow = arrow_builder(arrow, self.dictionary_fields)
+    async_client = self._ctx.get("async_client")
+    if async_client is not None:
+      result = async_run(
+        self.collection,
+        filter,
+        options,
+        self._ctx["base_url"],
+        self._ctx["headers"],
+        self._ctx.get("transport"),
+        async_client,
+        cache=self._ctx.get("cache"),
+        router=self._ctx.get("router"),
+        arrow=arrow,
+      )
+      return self._async_typed(result, record_cls) if record_cls is not None else result
+    result = run(
+      self.collection,
+      filter,
+      options,
+      self._ctx["base_url"],
+      self._ctx["headers"],
+      self._ctx.get("transport"),
+      cache=self._ctx.get("cache"),
+      router=self._ctx.get("router"),
+      arrow=arrow,
+    )
+    return record_cls.from_docs(result) if record_cls is not None else result
+
+  def iter_all(
+    self,
+    filter: str = "",
+    options: Dict[str, Any] | None = None,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_workers: int = 1,
+  ):
+    """
+    Yield every matching row via limit(n,offset) pages instead of one capped request.
+
+    Any query method does the same when passed options {"paginate": True}
+    (plus optional "page_size" / "max_workers"; "arrow" then returns one
+    table over every page). Without an explicit sort the unique key is used
+    so offsets stay stable. Pages go through the context's router and cache.
+    Under the async client this is an async generator.
+    """
+    options = self._options(options)
+    record_cls = self._typed(options)
+    if not options.get("sort") and self.unique_key:
+      options["sort"] = f"+{self.unique_key}"
+    args = (self.collection, filter, options, self._ctx["base_url"], self._ctx["headers"], self._ctx.get("transport"))
+    kwargs = {"page_size": page_size, "max_workers": max_workers, "cache": self._ctx.get("cache"), "router": self._ctx.get("router")}
+    async_client = self._ctx.get("async_client")
+    if async_client is not None:
+      docs = async_paginate(*args, async_client, **kwargs)
+      return async_as_typed(docs, record_cls) if record_cls is not None else docs
+    docs = paginate(*args, **kwargs)
+    return as_typed(docs, record_cls) if record_cls is not None else docs
+
+  def _rql(self, filter: str | Dict[str, Any] | None) -> str:
+    # Count/exists accept an RQL string or a query_by-style {field: value} dict.
+    if isinstance(filter, dict):
+      return qb.build_and_from(filter)
+    return filter or ""
+
+  def count(self, filter: str | Dict[str, Any] | None = "", *, max_scan: int | None = None):
+    """
+    Number of matching rows from a limit(1) query's Content-Range total.
+
+    e.g. genome_amr.count({"genome_id": "83332.12"}) or
+    genome_amr.count(qb.eq("genome_id", "83332.12")). None when the server
+    sends no total; `max_scan=N` then counts up to N rows by paging instead.
+    """
+    args = (self.collection, self._rql(filter), self._ctx["base_url"], self._ctx["headers"], self._ctx.get("transport"))
+    async_client = self._ctx.get("async_client")
+    if async_client is not None:
+      return async_count(*args, async_client, key=self.unique_key, max_scan=max_scan)
+    return count(*args, key=self.unique_key, max_scan=max_scan)
+
+  def exists(self, filter: str | Dict[str, Any] | None = ""):
+    """True when at least one row matches; same filter forms as count."""
+    args = (self.collection, self._rql(filter), self._ctx["base_url"], self._ctx["headers"], self._ctx.get("transport"))
+    async_client = self._ctx.get("async_client")
+    if async_client is not None:
+      return async_exists(*args, async_client, key=self.unique_key)
+    return exists(*args, key=self.unique_key)
+
+  def count_many(self, filters: Iterable[str | Dict[str, Any]], *, max_workers: int = DEFAULT_COUNT_WORKERS, max_scan: int | None = None):
+    """
+    Count many filter sets concurrently; returns counts in input order.
+
+    e.g. genome_amr.count_many({"genome_id": gid} for gid in genome_ids).
+    """
+    args = (self.collection, [self._rql(filter) for filter in filters], self._ctx["base_url"], self._ctx["headers"], self._ctx.get("transport"))
+    async_client = self._ctx.get("async_client")
+    if async_client is not None:
+      return async_count_many(*args, async_client, key=self.unique_key, max_workers=max_workers, max_scan=max_scan)
+    return count_many(*args, key=self.unique_key, max_workers=max_workers, max_scan=max_scan)
+
+  def iter_query(self, filter: str = "", options: Dict[str, Any] | None = None, *, accept: str | None = None):
+    """
+    Stream records for an RQL filter as the response arrives.
+
+    `accept` picks the format (e.g. "text/tsv", "application/dna+fasta");
+    JSON and CSV/TSV rows are dicts, FASTA records are text. Under the async
+    client this is an async generator.
+    """
+    headers = dict(self._ctx["headers"])
+    if accept:
+      headers["Accept"] = accept
+    args = (self.collection, filter, self._options(options), self._ctx["base_url"], headers, self._ctx.get("transport"))
+    async_client = self._ctx.get("async_client")
+    if async_client is not None:
+      return async_iter_run(*args, async_client)
+    return iter_run(*args)
+
+  def iter_by(self, filters: Dict[str, Any] | None = None, options: Dict[str, Any] | None = None, *, accept: str | None = None):
+    """Streaming counterpart of query_by."""
+    return self.iter_query(qb.build_and_from(filters or {}), options, accept=accept)
+
+  def _get_by_key(self, value: Any, options: Dict[str, Any] | None = None):
+    loaders = self._ctx.get("loaders")
+    if loaders is not None and self._ctx.get("async_client") is not None and not options:
+      loader = loaders.get(self.collection)
+      if loader is None:
+        loader = loaders[self.collection] = BatchLoader(
+          self._load_many,
+          window=self._ctx.get("coalesce_window", DEFAULT_COALESCE_WINDOW),
+          max_batch=self._ctx.get("coalesce_max_batch", DEFAULT_COALESCE_MAX_BATCH),
+        )
+      return self._load_one(loader, value)
+    return self._run(qb.eq(self.unique_key, value), options)
+
+  async def _load_one(self, loader: BatchLoader, value: Any):
+    # Same shape as an un-coalesced get_by_id: a list of matching docs.
+    doc = await loader.load(value)
+    return [doc] if doc is not None else []
+
+  async def _load_many(self, keys: list):
+    return await async_get_many(
+      self.collection,
+      self.unique_key,
+      keys,
+      {},
+      self._ctx["base_url"],
+      self._ctx["headers"],
+      self._ctx.get("transport"),
+      self._ctx.get("async_client"),
+      chunk_size=self._ctx.get("coalesce_max_batch", DEFAULT_COALESCE_MAX_BATCH),
+      cache=self._ctx.get("cache"),
+    )
+
+  def get_many(
+    self,
+    ids: Iterable[Any],
+    options: Dict[str, Any] | None = None,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+  ):
+    """
+    Fetch many records by unique key in chunked in() queries.
+
+    Returns a dict keyed by requested ID; IDs with no match are listed in
+    the result's `missing` attribute.
+    """
+    args = (self.collection, self.unique_key, ids, self._options(options), self._ctx["base_url"], self._ctx["headers"], self._ctx.get("transport"))
+    kwargs = {"chunk_size": chunk_size, "max_workers": max_workers, "cache": self._ctx.get("cache")}
+    async_client = self._ctx.get("async_client")
+    if async_client is not None:
+      return async_get_many(*args, async_client, **kwargs)
+    return get_many(*args, **kwargs)
+
+  def solr_get_many(
+    self,
+    ids: Iterable[Any],
+    *,
+    fields: list[str] | None = None,
+    profile: str | None = None,
+    chunk_size: int = DEFAULT_TERMS_CHUNK_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    context_overrides: Dict[str, Any] | None = None,
+  ):
+    """
+    get_many over Solr `{!terms}` filters; suited to very large ID sets
+    (thousands per request) where RQL in() bodies would be split finely.
+    """
+    solr_ctx = self._solr_context(context_overrides)
+    kwargs = {
+      "fields": self._fields(fields, profile),
+      "base_url": solr_ctx["solr_base_url"],
+      "headers": solr_ctx.get("headers"),
+      "auth": solr_ctx.get("auth"),
+      "timeout": solr_ctx.get("timeout", 60.0),
+      "transport": solr_ctx.get("transport"),
+      "chunk_size": chunk_size,
+      "max_workers": max_workers,
+    }
+    async_client = self._ctx.get("async_client")
+    if async_client is not None:
+      return async_solr_get_many(self.collection, self.unique_key, ids, client=async_client, **kwargs)
+    return solr_get_many(self.collection, self.unique_key, ids, **kwargs)
+
+  def _solr_context(self, context_overrides: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    # Combine base context with optional overrides to build Solr context
+    merged_ctx: Dict[str, Any] = {}
+    merged_ctx.update(self._ctx)
+    if context_overrides:
+      merged_ctx.update(context_overrides)
+    return create_solr_context(merged_ctx)
+
+  def facet(
+    self,
+    fields: list[str] | None = None,
+    *,
+    q_expr: str | None = None,
+    fq: list[str] | None = None,
+    ranges: list[RangeSpec | tuple] | None = None,
+    pivots: list[list[str] | str] | None = None,
+    json_facet: Dict[str, Any] | None = None,
+    stats: list[str] | None = None,
+    limit: int = DEFAULT_FACET_LIMIT,
+    mincount: int = DEFAULT_FACET_MINCOUNT,
+    missing: bool = False,
+    sort: str = "count",
+    context_overrides: Dict[str, Any] | None = None,
+  ):
+    """
+    Aggregate on the server with one rows=0 Solr request; returns a FacetResult.
+
+    e.g. genome.facet(["isolation_country"]),
+    spike_lineage.facet(ranges=[RangeSpec("collection_date", "NOW/YEAR-3YEARS", "NOW", "+1MONTH")]),
+    genome_amr.facet(pivots=[["antibiotic", "resistant_phenotype"]]).
+    """
+    params = build_facet_params(
+      solrqb.build_params(q_expr=q_expr or "*:*", fq_list=fq or None),
+      fields=fields,
+      ranges=ranges,
+      pivots=pivots,
+      json_facet=json_facet,
+      stats=stats,
+      limit=limit,
+      mincount=mincount,
+      missing=missing,
+      sort=sort,
+    )
+    return self._solr_query(params, FacetResult, context_overrides)
+
+  def field_stats(
+    self,
+    fields: list[str],
+    *,
+    q_expr: str | None = None,
+    fq: list[str] | None = None,
+    context_overrides: Dict[str, Any] | None = None,
+  ):
+    """min/max/count/missing/sum/mean/stddev per numeric or date field, as {field: FieldStats}."""
+    params = build_facet_params(solrqb.build_params(q_expr=q_expr or "*:*", fq_list=fq or None), stats=fields)
+    return self._solr_query(params, lambda result: FacetResult(result).stats, context_overrides)
+
+  def solr_count(
+    self,
+    *,
+    q_expr: str | None = None,
+    fq: list[str] | None = None,
+    context_overrides: Dict[str, Any] | None = None,
+  ):
+    """numFound of a rows=0 Solr select."""
+    params = solrqb.build_params(q_expr=q_expr or "*:*", fq_list=fq or None, rows=0)
+    return self._solr_query(params, lambda result: int(result.get("response", {}).get("numFound", 0)), context_overrides)
+
+  def _solr_query(self, params: Dict[str, Any], parse, context_overrides: Dict[str, Any] | None = None):
+    solr_ctx = self._solr_context(context_overrides)
+    kwargs = {
+      "base_url": solr_ctx["solr_base_url"],
+      "headers": solr_ctx.get("headers"),
+      "auth": solr_ctx.get("auth"),
+      "timeout": solr_ctx.get("timeout", 60.0),
+      "transport": solr_ctx.get("transport"),
+      "cache": solr_ctx.get("cache"),
+    }
+    async_client = self._ctx.get("async_client")
+    if async_client is not None:
+      return self._async_solr_query(params, parse, async_client, kwargs)
+    return parse(select(self.collection, params, **kwargs))
+
+  async def _async_solr_query(self, params: Dict[str, Any], parse, client, kwargs: Dict[str, Any]):
+    return parse(await async_select(self.collection, params, client=client, **kwargs))
+
+  # Solr cursor-based streaming (Option B implementation)
+  def stream_all_solr(
+    self,
+    *,
+    rows: int = 1000,
+    sort: str | None = None,
+    unique_key: str | None = None,
+    fields: list[str] | None = None,
+    profile: str | None = None,
+    q_expr: str | None = None,
+    fq: list[str] | None = None,
+    start_cursor: str = "*",
+    context_overrides: Dict[str, Any] | None = None,
+    prefetch: int = 2,
+    stream: bool = False,
+    checkpoint: str | None = None,
+    adaptive: bool | PageSizer = False,
+    export: bool = False,
+  ) -> CursorPager | AsyncCursorPager | CheckpointedExport | ExportStream | AsyncExportStream:
+    """
+    Cursor-stream every matching doc.
+
+    With `checkpoint` (a file path) progress is committed after each page and
+    a rerun with the same arguments continues where the last one stopped;
+    use `.run(JsonLinesSink(path))` for exactly-once file output. With
+    `adaptive` the page size follows observed latency and payload size
+    (pass a PageSizer to set the targets); see the pager's `stats`.
+    With `export=True` the dump streams from Solr's /export handler in one
+    sorted response (requires `fields` with docValues), falling back to
+    cursor paging when the fields are not exportable.
+    """
+    unique_key = unique_key or self.unique_key
+    solr_ctx = self._solr_context(context_overrides)
+
+    base_params = solrqb.build_params(
+      q_expr=q_expr or "*:*",
+      fq_list=fq or None,
+      fields=self._fields(fields, profile, bulk=True),
+      # sort, rows, cursorMark handled by CursorPager for iteration
+    )
+
+    async_client = self._ctx.get("async_client")
+    if async_client is not None and checkpoint:
+      raise ValueError("checkpoint is only supported outside the async client")
+    if export and checkpoint:
+      raise ValueError("checkpoint requires cursor paging; it cannot be combined with export")
+    if async_client is not None:
+      # `async for` pager that reads `prefetch` pages ahead on the shared client
+      async_pager = AsyncCursorPager(
+        collection=self.collection,
+        base_params=base_params,
+        base_url=solr_ctx["solr_base_url"],
+        headers=solr_ctx.get("headers"),
+        auth=solr_ctx.get("auth"),
+        rows=rows,
+        sort=f"{unique_key} asc",
+        unique_key=unique_key,
+        start_cursor=start_cursor,
+        timeout=solr_ctx.get("timeout", 60.0),
+        client=async_client,
+        transport=solr_ctx.get("transport"),
+        prefetch=prefetch,
+        stream=stream,
+        adaptive=adaptive,
+        dictionary_fields=self.dictionary_fields,
+        record_type=self.record_type(),
+      )
+      return AsyncExportStream(async_pager) if export else async_pager
+
+    pager = CursorPager(
+      collection=self.collection,
+      base_params=base_params,
+      base_url=solr_ctx["solr_base_url"],
+      headers=solr_ctx.get("headers"),
+      auth=solr_ctx.get("auth"),
+      rows=rows,
+      sort=f"{unique_key} asc",
+      unique_key=unique_key,
+      start_cursor=start_cursor,
+      timeout=solr_ctx.get("timeout", 60.0),
+      transport=solr_ctx.get("transport"),
+      stream=stream,
+      adaptive=adaptive,
+      dictionary_fields=self.dictionary_fields,
+      record_type=self.record_type(),
+    )
+    if checkpoint:
+      return CheckpointedExport(pager, checkpoint)
+    if export:
+      return ExportStream(pager)
+    return pager
+
+  def stream_partitioned(
+    self,
+    *,
+    partitions: int = 4,
+    split_field: str | None = None,
+    strategy: str = "sample",
+    rows: int = 1000,
+    fields: list[str] | None = None,
+    profile: str | None = None,
+    q_expr: str | None = None,
+    fq: list[str] | None = None,
+    context_overrides: Dict[str, Any] | None = None,
+    prefetch: int = 2,
+  ) -> PartitionedExporter:
+    """Export via `partitions` concurrent cursor streams over disjoint `split_field` ranges."""
+    solr_ctx = self._solr_context(context_overrides)
+    base_params = solrqb.build_params(
+      q_expr=q_expr or "*:*",
+      fq_list=fq or None,
+      fields=self._fields(fields, profile, bulk=True),
+    )
+    return PartitionedExporter(
+      collection=self.collection,
+      base_params=base_params,
+      base_url=solr_ctx["solr_base_url"],
+      headers=solr_ctx.get("headers"),
+      auth=solr_ctx.get("auth"),
+      rows=rows,
+      unique_key=self.unique_key,
+      split_field=split_field,
+      partitions=partitions,
+      strategy=strategy,
+      timeout=solr_ctx.get("timeout", 60.0),
+      transport=solr_ctx.get("transport"),
+      client=self._ctx.get("async_client"),
+      prefetch=prefetch,
+    )
+
+  def dump(
+    self,
+    directory: str,
+    *,
+    format: str = "ndjson",
+    partitions: int = 1,
+    split_field: str | None = None,
+    strategy: str = "sample",
+    rows: int = 1000,
+    fields: list[str] | None = None,
+    profile: str | None = None,
+    q_expr: str | None = None,
+    fq: list[str] | None = None,
+    context_overrides: Dict[str, Any] | None = None,
+    **sink_options: Any,
+  ) -> Dict[str, Any]:
+    """
+    Export matching docs to rolling files in `directory` with constant memory.
+
+    `format` is ndjson, csv, tsv or parquet; `sink_options` (max_rows,
+    max_bytes, compression, row_group_rows, schema, ...) go to open_sink.
+    With `partitions` > 1 the collection is split as in stream_partitioned
+    and each partition writes its own `{collection}-{index}-{n}` files in
+    parallel. Blocks until done; read the files back with read_export.
+    """
+    if format not in SINK_FORMATS:
+      raise ValueError(f"Invalid sink format '{format}'. Supported values: {', '.join(SINK_FORMATS)}.")
+    if format in ("csv", "tsv"):
+      columns = sink_options.get("fields") or self._fields(fields, profile, bulk=True)
+      if not columns:
+        raise ValueError(f"{format} exports of {self.collection} need fields= or profile= to fix the columns; use ndjson or parquet to keep every field")
+      sink_options["fields"] = columns
+    started = time.time()
+    exporter = self.stream_partitioned(
+      partitions=partitions,
+      split_field=split_field,
+      strategy=strategy,
+      rows=rows,
+      fields=fields,
+      profile=profile,
+      q_expr=q_expr,
+      fq=fq,
+      context_overrides=context_overrides,
+    )
+    if format == "parquet":
+      sink_options.setdefault("dictionary_fields", self.dictionary_fields)
+    sinks: List[Any] = []
+    lock = threading.Lock()
+
+    def sink_factory(index: int):
+      sink = open_sink(directory, format, prefix=f"{self.collection}-{index:03d}", **sink_options)
+      with lock:
+        sinks.append(sink)
+      return sink
+
+    written = exporter.write(sink_factory)
+    return {
+      "collection": self.collection,
+      "format": format,
+      "rows": written,
+      "files": sorted(path for sink in sinks for path in sink.files),
+      "seconds": round(time.time() - started, 3),
+    }
+
+
+__all__ = ["BaseResource"]
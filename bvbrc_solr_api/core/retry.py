@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Tuple, Type
+
+import httpx
+
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_MAX = 30.0
+DEFAULT_RETRY_STATUSES = (429, 502, 503, 504)
+# Failures where the request may not have reached Solr; safe to resend a query.
+DEFAULT_RETRY_EXCEPTIONS: Tuple[Type[Exception], ...] = (
+  httpx.TimeoutException,
+  httpx.NetworkError,
+  httpx.RemoteProtocolError,
+)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+  """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+  if not value:
+    return None
+  value = value.strip()
+  if value.isdigit():
+    return float(value)
+  try:
+    return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+  except (TypeError, ValueError):
+    return None
+
+
+class RetryPolicy:
+  """
+  When and how long to wait before resending a query.
+
+  Every request this package sends is a read-only query, so POSTs are safe
+  to repeat. Delays use full-jitter exponential backoff
+  (uniform(0, min(backoff_max, backoff_base * 2**attempt))) unless the
+  server sends Retry-After, which is honoured up to `backoff_max`.
+  """
+
+  def __init__(
+    self,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    *,
+    backoff_base: float = DEFAULT_BACKOFF_BASE,
+    backoff_max: float = DEFAULT_BACKOFF_MAX,
+    retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+    retry_exceptions: Tuple[Type[Exception], ...] = DEFAULT_RETRY_EXCEPTIONS,
+  ) -> None:
+    self.max_retries = max(0, int(max_retries))
+    self.backoff_base = backoff_base
+    self.backoff_max = backoff_max
+    self.retry_statuses = frozenset(retry_statuses)
+    self.retry_exceptions = retry_exceptions
+
+  def retries_status(self, status_code: int) -> bool:
+    return status_code in self.retry_statuses
+
+  def retries_exception(self, exc: BaseException) -> bool:
+    return isinstance(exc, self.retry_exceptions)
+
+  def delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+    if response is not None:
+      retry_after = parse_retry_after(response.headers.get("Retry-After"))
+      if retry_after is not None:
+        return min(retry_after, self.backoff_max)
+    return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+
+class TokenBucket:
+  """
+  Client-side rate limiter: `rate` requests per second with bursts up to `burst`.
+
+  Callers reserve a token under the lock and sleep outside it, so waiting
+  threads and tasks are released in arrival order.
+  """
+
+  def __init__(self, rate: float, burst: int | None = None) -> None:
+    if rate <= 0:
+      raise ValueError("rate must be positive")
+    self.rate = float(rate)
+    self.burst = float(burst if burst is not None else max(1, int(rate)))
+    self._tokens = self.burst
+    self._updated = time.monotonic()
+    self._lock = threading.Lock()
+    self.waited = 0.0
+
+  def _reserve(self) -> float:
+    with self._lock:
+      now = time.monotonic()
+      self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+      self._updated = now
+      self._tokens -= 1
+      wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+      self.waited += wait
+      return wait
+
+  def acquire(self) -> None:
+    wait = self._reserve()
+    if wait:
+      time.sleep(wait)
+
+  async def async_acquire(self) -> None:
+    wait = self._reserve()
+    if wait:
+      await asyncio.sleep(wait)
+
+
+__all__ = [
+  "RetryPolicy",
+  "TokenBucket",
+  "parse_retry_after",
+]
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Sequence, Tuple
+from urllib.parse import unquote
+
+from .mirror import Mirror
+
+
+DEFAULT_MAX_AGE = 24 * 3600.0
+_COMPARISONS = {"eq": "=", "gt": ">", "lt": "<", "ge": ">=", "le": "<="}
+
+
+class _Unsupported(Exception):
+  pass
+
+
+def parse_rql(expr: str) -> Tuple[str, List[Any]] | None:
+  """
+  Parse a query_builder filter into nested (operator, args) tuples.
+
+  Literal arguments are URL-decoded strings. Returns None for an empty
+  filter; raises ValueError on malformed input.
+  """
+  if not expr:
+    return None
+  node, pos = _parse_call(expr, 0)
+  if pos != len(expr):
+    raise ValueError(f"Unexpected trailing input in RQL filter at {pos}: {expr[pos:pos + 20]!r}")
+  return node
+
+
+def _parse_call(expr: str, pos: int) -> Tuple[Tuple[str, List[Any]], int]:
+  start = pos
+  while pos < len(expr) and (expr[pos].isalnum() or expr[pos] == "_"):
+    pos += 1
+  name = expr[start:pos]
+  if not name or pos >= len(expr) or expr[pos] != "(":
+    raise ValueError(f"Expected an RQL call at {start}: {expr[start:start + 20]!r}")
+  pos += 1
+  args: List[Any] = []
+  while True:
+    if pos >= len(expr):
+      raise ValueError("Unbalanced parentheses in RQL filter")
+    if expr[pos] == ")":
+      return (name, args), pos + 1
+    end = pos
+    while end < len(expr) and expr[end] not in ",()":
+      end += 1
+    if end < len(expr) and expr[end] == "(":
+      arg, pos = _parse_call(expr, pos)
+    else:
+      arg, pos = unquote(expr[pos:end]), end
+    args.append(arg)
+    if pos < len(expr) and expr[pos] == ",":
+      pos += 1
+
+
+def _literal(value: str) -> str:
+  # query_builder quotes lone "+"/"-" so they are not read as sort signs.
+  if len(value) >= 2 and value[0] == value[-1] == '"':
+    return value[1:-1]
+  return value
+
+
+def _number(value: str) -> int | float | None:
+  try:
+    return int(value)
+  except ValueError:
+    pass
+  try:
+    return float(value)
+  except ValueError:
+    return None
+
+
+class MirrorRouter:
+  """
+  Answers RQL `run` calls from a Mirror when it can do so exactly.
+
+  Set as the context's "router" (e.g. create_client({"router":
+  MirrorRouter(mirror)})). A query is served locally only when its
+  collection was mirrored in full (no fq, all fields) within `max_age`
+  seconds, every filter/sort field is locally indexed (the mirror's
+  `index_fields` plus the unique key and date_modified), and the filter
+  only uses eq, gt, lt, ge, le, in, and, or without wildcards. Fields
+  that held arrays (multi-valued) or booleans during sync are refused, and
+  so are string fields not listed in `exact_fields` (e.g. {"genome":
+  ["genome_id"]}), because Solr text fields match tokenized and
+  case-insensitively. The unique key and date_modified are exact. With
+  `strict_order` the sort must include the unique key (or the result has
+  at most one row), since Solr's order among ties and for unsorted
+  queries cannot be reproduced. Anything else returns None and
+  the caller goes to the network. `stats` counts both outcomes.
+  """
+
+  def __init__(
+    self,
+    mirror: Mirror,
+    *,
+    max_age: float | None = DEFAULT_MAX_AGE,
+    strict_order: bool = True,
+    exact_fields: Dict[str, Sequence[str]] | None = None,
+  ):
+    self.mirror = mirror
+    self.exact_fields = {collection: set(fields) for collection, fields in (exact_fields or {}).items()}
+    self.max_age = max_age
+    self.strict_order = strict_order
+    # Own connection so thread-pool callers (get_many, count_many) can share it.
+    self.db = sqlite3.connect(mirror.path, check_same_thread=False)
+    self._lock = threading.Lock()
+    self.local = 0
+    self.remote: Dict[str, int] = {}
+
+  @property
+  def stats(self) -> Dict[str, Any]:
+    with self._lock:
+      return {"local": self.local, "remote": sum(self.remote.values()), "remote_reasons": dict(self.remote)}
+
+  def _miss(self, reason: str) -> None:
+    with self._lock:
+      self.remote[reason] = self.remote.get(reason, 0) + 1
+
+  def run(self, core_name: str, filter: str, options: Dict[str, Any] | None) -> List[Dict[str, Any]] | None:
+    """Local result for the query, or None when it must go to the network."""
+    options = options or {}
+    state = self.mirror_state(core_name)
+    if state is None:
+      self._miss("not mirrored")
+      return None
+    reason = self._unservable(state, options)
+    if reason:
+      self._miss(reason)
+      return None
+    fields = self._fields(core_name, state)
+    try:
+      where, params = self._where(parse_rql(filter), fields)
+      order, has_key = self._order(options.get("sort"), fields, state["unique_key"])
+    except (_Unsupported, ValueError) as exc:
+      self._miss(str(exc) or "unsupported filter")
+      return None
+
+    limit_value = options.get("limit")
+    limit_value = limit_value if isinstance(limit_value, int) else 1000
+    offset_value = options.get("offset") if isinstance(options.get("offset"), int) else 0
+    if self.strict_order and not has_key and offset_value:
+      self._miss("offset without a deterministic sort")
+      return None
+    sql = f'SELECT doc FROM "{core_name}"' + (f" WHERE {where}" if where else "") + order + " LIMIT ? OFFSET ?"
+    with self._lock:
+      rows = self.db.execute(sql, (*params, limit_value, offset_value)).fetchall()
+    if self.strict_order and not has_key and len(rows) > 1:
+      self._miss("no deterministic sort")
+      return None
+
+    docs = [json.loads(row[0]) for row in rows]
+    select_fields = options.get("select")
+    if select_fields:
+      docs = [{field: doc[field] for field in select_fields if field in doc} for doc in docs]
+    with self._lock:
+      self.local += 1
+    return docs
+
+  def _fields(self, collection: str, state: Dict[str, Any]) -> Dict[str, str | None]:
+    # Locally queryable fields mapped to None, or to the reason they must go to Solr.
+    with self._lock:
+      rows = self.db.execute("SELECT field, kinds FROM mirror_fields WHERE collection = ?", (collection,)).fetchall()
+    exact = self.exact_fields.get(collection, set()) | {state["unique_key"], state["modified_field"]}
+    fields: Dict[str, str | None] = {}
+    for field, kinds in rows:
+      kinds = set(filter(None, kinds.split(",")))
+      if kinds & {"array", "object"}:
+        fields[field] = f"field {field!r} is multi-valued"
+      elif "bool" in kinds:
+        fields[field] = f"field {field!r} is boolean"
+      elif "text" in kinds and field not in exact:
+        fields[field] = f"field {field!r} may be tokenized; list it in exact_fields"
+      else:
+        fields[field] = None
+    return fields
+
+  def _check(self, field: Any, fields: Dict[str, str | None]) -> None:
+    if not isinstance(field, str) or field not in fields:
+      raise _Unsupported(f"field {field!r} is not indexed locally")
+    if fields[field]:
+      raise _Unsupported(fields[field])
+
+  def mirror_state(self, collection: str) -> Dict[str, Any] | None:
+    with self._lock:
+      row = self.db.execute(
+        "SELECT unique_key, modified_field, fq, fields, last_full_sync, last_delta_sync FROM mirror_state WHERE collection = ?",
+        (collection,),
+      ).fetchone()
+    if row is None:
+      return None
+    keys = ("unique_key", "modified_field", "fq", "fields", "last_full_sync", "last_delta_sync")
+    return dict(zip(keys, row))
+
+  def _unservable(self, state: Dict[str, Any], options: Dict[str, Any]) -> str | None:
+    if state["fq"] or state["fields"]:
+      return "partial mirror"
+    synced = max(state["last_full_sync"] or 0, state["last_delta_sync"] or 0)
+    if self.max_age is not None and time.time() - synced > self.max_age:
+      return "mirror is stale"
+    if options.get("http_download"):
+      return "http_download"
+    return None
+
+  def _where(self, node: Tuple[str, List[Any]] | None, fields: Dict[str, str | None]) -> Tuple[str, List[Any]]:
+    if node is None:
+      return "", []
+    name, args = node
+    if name in ("and", "or"):
+      parts = [self._where(arg, fields) for arg in args if isinstance(arg, tuple)]
+      if len(parts) != len(args):
+        raise _Unsupported(f"{name}() with literal arguments")
+      joiner = " AND " if name == "and" else " OR "
+      return "(" + joiner.join(part for part, _ in parts) + ")", [param for _, params in parts for param in params]
+    if name not in _COMPARISONS and name != "in":
+      raise _Unsupported(f"{name}() is not supported locally")
+    self._check(args[0] if args else "", fields)
+    column = f"json_extract(doc, '$.{args[0]}')"
+    if any(not isinstance(value, str) for value in args[1:]):
+      raise _Unsupported("nested value")
+    values = [_literal(value) for value in args[1:]]
+    if any("*" in value for value in values):
+      raise _Unsupported("wildcard value")
+    if name == "in":
+      if not values:
+        raise _Unsupported("empty in()")
+      numbers = [number for number in (_number(value) for value in values) if number is not None]
+      params: List[Any] = [*values, *numbers]
+      return f"{column} IN ({', '.join('?' for _ in params)})", params
+    if len(values) != 1:
+      raise _Unsupported(f"{name}() takes one value")
+    operator = _COMPARISONS[name]
+    number = _number(values[0])
+    # Stored numbers compare numerically, stored strings lexically, as Solr does per field type.
+    if number is None:
+      return f"({column} {operator} ? AND json_type(doc, '$.{args[0]}') = 'text')", [values[0]]
+    return (
+      f"((json_type(doc, '$.{args[0]}') IN ('integer', 'real') AND {column} {operator} ?)"
+      f" OR (json_type(doc, '$.{args[0]}') = 'text' AND {column} {operator} ?))",
+      [number, values[0]],
+    )
+
+  def _order(self, sort_expr: str | None, fields: Dict[str, str | None], unique_key: str) -> Tuple[str, bool]:
+    if not sort_expr:
+      return "", False
+    terms: List[str] = []
+    has_key = False
+    for item in (part.strip() for part in str(sort_expr).split(",")):
+      if not item:
+        continue
+      descending = item.startswith("-")
+      field = item.lstrip("+-").strip()
+      self._check(field, fields)
+      has_key = has_key or field == unique_key
+      column = f"json_extract(doc, '$.{field}')"
+      # Missing values sort last either way (Solr's sortMissingLast).
+      terms.append(f"{column} IS NULL, {column} {'DESC' if descending else 'ASC'}")
+    return (" ORDER BY " + ", ".join(terms)) if terms else "", has_key
+
+  def close(self) -> None:
+    self.db.close()
+
+
+__all__ = ["MirrorRouter", "parse_rql"]
@@ -0,0 +1,422 @@
+from __future__ import annotations
+
+import abc
+import csv
+import gzip
+import io
+import json
+import os
+from typing import Any, Dict, Generator, Iterable, List, Sequence
+
+from .arrow import DEFAULT_BATCH_ROWS, ArrowBuilder, _require_pyarrow, pa
+
+try:
+  import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional
+  pq = None
+
+try:
+  import zstandard
+except ImportError:  # pragma: no cover - optional
+  zstandard = None
+
+
+SINK_FORMATS = ("ndjson", "csv", "tsv", "parquet")
+FILE_COMPRESSIONS = ("gzip", "zstd")
+DEFAULT_ROW_GROUP_ROWS = 64 * 1024
+_EXTENSIONS = {"ndjson": ".ndjson", "csv": ".csv", "tsv": ".tsv"}
+_COMPRESSED_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+# Written under this suffix and renamed when complete, so readers never see partial files.
+_IN_PROGRESS = ".inprogress"
+
+
+class JsonLinesSink:
+  """
+  Append-only NDJSON file sink with durable, truncatable positions.
+
+  `flush()` fsyncs and returns the byte offset reached; `truncate(offset)`
+  rolls the file back to a previously returned offset. CheckpointedExport
+  relies on both to keep the file consistent with its checkpoint.
+  """
+
+  def __init__(self, path: str):
+    self.path = path
+    self._file = open(path, "ab")
+
+  def write(self, docs: Iterable[Dict[str, Any]]) -> None:
+    self._file.write(b"".join(json.dumps(doc, separators=(",", ":")).encode("utf-8") + b"\n" for doc in docs))
+
+  def flush(self) -> int:
+    self._file.flush()
+    os.fsync(self._file.fileno())
+    return self._file.tell()
+
+  def truncate(self, position: int) -> None:
+    self._file.flush()
+    size = os.fstat(self._file.fileno()).st_size
+    if size < position:
+      # Truncating up would pad with zero bytes; the file is not the one checkpointed.
+      raise ValueError(f"{self.path} has {size} bytes, fewer than the checkpointed {position}; it was replaced or truncated")
+    self._file.truncate(position)
+    self._file.seek(position)
+
+  def close(self) -> None:
+    self._file.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    self.close()
+    return False
+
+
+class _RollingSink(abc.ABC):
+  """
+  Base for sinks writing `{prefix}-00000{ext}`, `{prefix}-00001{ext}`, ...
+  in `directory`, starting a new file once the current one holds
+  `max_rows` documents or `max_bytes` bytes.
+  """
+
+  extension = ""
+
+  def __init__(self, directory: str, *, prefix: str = "part", max_rows: int | None = None, max_bytes: int | None = None):
+    os.makedirs(directory, exist_ok=True)
+    self.directory = directory
+    self.prefix = prefix
+    self.max_rows = max_rows
+    self.max_bytes = max_bytes
+    self.files: List[str] = []
+    self.rows = 0
+    self._path: str | None = None
+    self._file_rows = 0
+
+  def _next_path(self) -> str:
+    return os.path.join(self.directory, f"{self.prefix}-{len(self.files):05d}{self.extension}")
+
+  def _full(self) -> bool:
+    if self.max_rows and self._file_rows >= self.max_rows:
+      return True
+    return bool(self.max_bytes) and self._size() >= self.max_bytes
+
+  @abc.abstractmethod
+  def _size(self) -> int:
+    """Bytes written to the current file so far."""
+
+  @abc.abstractmethod
+  def _close_file(self) -> None:
+    """Close the current file without publishing it."""
+
+  def _finish(self) -> None:
+    # Close the current file and publish it under its final name.
+    if self._path is None:
+      return
+    self._close_file()
+    os.replace(self._path + _IN_PROGRESS, self._path)
+    self.files.append(self._path)
+    self._path = None
+    self._file_rows = 0
+
+  def abort(self) -> None:
+    """Close and delete the file in progress (already rolled files are kept)."""
+    if self._path is None:
+      return
+    self._close_file()
+    os.unlink(self._path + _IN_PROGRESS)
+    self._path = None
+    self._file_rows = 0
+
+  def close(self) -> None:
+    self._finish()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    if exc_type is None:
+      self.close()
+    else:
+      self.abort()
+    return False
+
+
+class _TextSink(_RollingSink):
+  """Rolling text files, optionally gzip- or zstd-compressed as they are written."""
+
+  format = ""
+
+  def __init__(self, directory: str, *, compression: str | None = None, **kwargs: Any):
+    if compression is not None and compression not in FILE_COMPRESSIONS:
+      raise ValueError(f"Unsupported file compression '{compression}'. Supported values: {', '.join(FILE_COMPRESSIONS)}.")
+    if compression == "zstd" and zstandard is None:
+      raise ImportError("zstd files need zstandard: pip install \"bvbrc-solr-python-api[compression]\"")
+    self.compression = compression
+    self.extension = _EXTENSIONS[self.format] + _COMPRESSED_EXTENSIONS.get(compression or "", "")
+    super().__init__(directory, **kwargs)
+    self._raw: Any = None
+    self._handle: Any = None
+
+  def _open(self) -> None:
+    self._path = self._next_path()
+    self._raw = open(self._path + _IN_PROGRESS, "wb")
+    if self.compression == "gzip":
+      self._handle = gzip.GzipFile(fileobj=self._raw, mode="wb", compresslevel=6)
+    elif self.compression == "zstd":
+      self._handle = zstandard.ZstdCompressor(level=3).stream_writer(self._raw, closefd=False)
+    else:
+      self._handle = self._raw
+
+  def _size(self) -> int:
+    # Compressed bytes so far, excluding what the compressor still buffers.
+    return self._raw.tell()
+
+  def _close_file(self) -> None:
+    if self._handle is not self._raw:
+      self._handle.close()
+    self._raw.close()
+    self._raw = self._handle = None
+
+  @abc.abstractmethod
+  def _write_doc(self, doc: Dict[str, Any]) -> None:
+    """Write one doc to the open file."""
+
+  def write(self, docs: Iterable[Dict[str, Any]]) -> None:
+    for doc in docs:
+      if self._path is not None and self._full():
+        self._finish()
+      if self._path is None:
+        self._open()
+      self._write_doc(doc)
+      self._file_rows += 1
+      self.rows += 1
+
+
+class RollingJsonLinesSink(_TextSink):
+  """NDJSON files rolled by size or row count (see JsonLinesSink for a single resumable file)."""
+
+  format = "ndjson"
+
+  def _write_doc(self, doc: Dict[str, Any]) -> None:
+    self._handle.write(json.dumps(doc, separators=(",", ":")).encode("utf-8") + b"\n")
+
+
+def _cell(value: Any) -> Any:
+  if value is None:
+    return ""
+  if isinstance(value, (list, dict)):
+    return json.dumps(value, separators=(",", ":"))
+  return value
+
+
+class CsvSink(_TextSink):
+  """
+  CSV (or with `delimiter="\\t"`, TSV) files with a header row per file.
+
+  Columns are `fields`, which is required: every file shares that header
+  and other keys are dropped. Multi-valued fields are written as JSON
+  arrays and missing values as empty cells.
+  """
+
+  format = "csv"
+
+  def __init__(self, directory: str, *, fields: Sequence[str] | None = None, delimiter: str = ",", **kwargs: Any):
+    if delimiter == "\t":
+      self.format = "tsv"
+    if not fields:
+      raise ValueError("CSV/TSV sinks need the column list: pass fields=[...]")
+    super().__init__(directory, **kwargs)
+    self.fields = list(fields)
+    self.delimiter = delimiter
+    self._text: Any = None
+    self._writer: Any = None
+
+  def _open(self) -> None:
+    super()._open()
+    self._text = io.TextIOWrapper(self._handle, encoding="utf-8", newline="", write_through=True)
+    self._writer = csv.writer(self._text, delimiter=self.delimiter)
+    self._writer.writerow(self.fields)
+
+  def _close_file(self) -> None:
+    self._text.detach()
+    self._text = self._writer = None
+    super()._close_file()
+
+  def _write_doc(self, doc: Dict[str, Any]) -> None:
+    self._writer.writerow([_cell(doc.get(field)) for field in self.fields])
+
+
+def _conform(batch: Any, schema: Any) -> Any:
+  # Fit a batch to the open file's schema; raises if it would lose columns or values.
+  for name in batch.schema.names:
+    if schema.get_field_index(name) < 0:
+      raise KeyError(name)
+  columns = []
+  for field in schema:
+    index = batch.schema.get_field_index(field.name)
+    if index < 0:
+      columns.append(pa.nulls(batch.num_rows, field.type))
+    else:
+      column = batch.column(index)
+      columns.append(column if column.type == field.type else column.cast(field.type))
+  return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+class ParquetSink(_RollingSink):
+  """
+  Parquet files written one row group (`row_group_rows` docs) at a time.
+
+  Docs are assembled by an ArrowBuilder (declared `schema` or inferred,
+  `dictionary_fields` dictionary-encoded), so memory stays at one row group.
+  With an inferred schema, a row group that no longer fits the open file's
+  schema (a new field, or a type change that cannot be cast) starts a new
+  file; readers such as pyarrow.dataset unify the files' schemas.
+  """
+
+  extension = ".parquet"
+
+  def __init__(
+    self,
+    directory: str,
+    *,
+    schema: Any = None,
+    dictionary_fields: Sequence[str] = (),
+    row_group_rows: int = DEFAULT_ROW_GROUP_ROWS,
+    compression: str | None = "zstd",
+    **kwargs: Any,
+  ):
+    _require_pyarrow()
+    super().__init__(directory, **kwargs)
+    self.compression = compression or "none"
+    self._builder = ArrowBuilder(schema, dictionary_fields=dictionary_fields, batch_size=row_group_rows)
+    self._sink: Any = None
+    self._writer: Any = None
+
+  def _size(self) -> int:
+    return self._sink.tell()
+
+  def _close_file(self) -> None:
+    self._writer.close()
+    if not self._sink.closed:
+      self._sink.close()
+    self._sink = self._writer = None
+
+  def _write_batch(self, batch: Any) -> None:
+    while batch.num_rows:
+      if self._writer is not None:
+        if self._full():
+          self._finish()
+        else:
+          try:
+            batch = _conform(batch, self._writer.schema)
+          except (KeyError, pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            self._finish()
+      if self._writer is None:
+        self._path = self._next_path()
+        self._sink = pa.OSFile(self._path + _IN_PROGRESS, "wb")
+        self._writer = pq.ParquetWriter(self._sink, batch.schema, compression=self.compression)
+      room = self.max_rows - self._file_rows if self.max_rows else batch.num_rows
+      chunk = batch.slice(0, room)
+      self._writer.write_batch(chunk)
+      self._file_rows += chunk.num_rows
+      self.rows += chunk.num_rows
+      batch = batch.slice(chunk.num_rows)
+
+  def _drain(self) -> None:
+    batches, self._builder.batches = self._builder.batches, []
+    for batch in batches:
+      self._write_batch(batch)
+
+  def write(self, docs: Iterable[Dict[str, Any]]) -> None:
+    self._builder.extend(docs)
+    self._drain()
+
+  def close(self) -> None:
+    self._builder.flush()
+    self._drain()
+    self._finish()
+
+
+def open_sink(directory: str, format: str = "ndjson", **options: Any) -> RollingJsonLinesSink | CsvSink | ParquetSink:
+  """
+  Create a rolling sink for `format` (ndjson, csv, tsv or parquet).
+
+  Options go to the sink: prefix, max_rows, max_bytes, compression, plus
+  fields (csv/tsv) and schema, dictionary_fields, row_group_rows (parquet).
+  """
+  if format == "ndjson":
+    return RollingJsonLinesSink(directory, **options)
+  if format in ("csv", "tsv"):
+    return CsvSink(directory, delimiter="\t" if format == "tsv" else ",", **options)
+  if format == "parquet":
+    return ParquetSink(directory, **options)
+  raise ValueError(f"Invalid sink format '{format}'. Supported values: {', '.join(SINK_FORMATS)}.")
+
+
+def _open_text(path: str, compression: str | None) -> Any:
+  raw = open(path, "rb")
+  if compression == "gzip":
+    return gzip.GzipFile(fileobj=raw, mode="rb")
+  if compression == "zstd":
+    if zstandard is None:
+      raise ImportError("zstd files need zstandard: pip install \"bvbrc-solr-python-api[compression]\"")
+    return zstandard.ZstdDecompressor().stream_reader(raw)
+  return raw
+
+
+def _read_file(path: str, columns: Sequence[str] | None) -> Generator[Dict[str, Any], None, None]:
+  name = path
+  compression = None
+  for codec, suffix in _COMPRESSED_EXTENSIONS.items():
+    if name.endswith(suffix):
+      compression, name = codec, name[: -len(suffix)]
+  wanted = set(columns) if columns else None
+  if name.endswith(".parquet"):
+    _require_pyarrow()
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=DEFAULT_BATCH_ROWS, columns=list(columns) if columns else None):
+      for row in batch.to_pylist():
+        yield {key: value for key, value in row.items() if value is not None}
+    return
+  with io.TextIOWrapper(_open_text(path, compression), encoding="utf-8", newline="") as text:
+    if name.endswith(".ndjson"):
+      for line in text:
+        if line.strip():
+          doc = json.loads(line)
+          yield {key: value for key, value in doc.items() if key in wanted} if wanted else doc
+    else:
+      for row in csv.DictReader(text, delimiter="\t" if name.endswith(".tsv") else ","):
+        yield {key: value for key, value in row.items() if value != "" and (wanted is None or key in wanted)}
+
+
+def _readable(name: str) -> bool:
+  for suffix in _COMPRESSED_EXTENSIONS.values():
+    if name.endswith(suffix):
+      name = name[: -len(suffix)]
+  return name.endswith((".ndjson", ".csv", ".tsv", ".parquet"))
+
+
+def read_export(path: str, *, columns: Sequence[str] | None = None) -> Generator[Dict[str, Any], None, None]:
+  """
+  Lazily yield docs from an export file or a directory of them (in file name order).
+
+  Parquet is read one row group batch at a time and text files line by
+  line; empty cells and nulls are omitted like missing Solr fields. CSV/TSV
+  values come back as strings (multi-valued fields as JSON array text).
+  """
+  if os.path.isdir(path):
+    paths = sorted(os.path.join(path, name) for name in os.listdir(path) if _readable(name))
+  else:
+    paths = [path]
+  for file_path in paths:
+    yield from _read_file(file_path, columns)
+
+
+__all__ = [
+  "CsvSink",
+  "DEFAULT_ROW_GROUP_ROWS",
+  "JsonLinesSink",
+  "ParquetSink",
+  "RollingJsonLinesSink",
+  "SINK_FORMATS",
+  "open_sink",
+  "read_export",
+]
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, AsyncGenerator, AsyncIterable, AsyncIterator, Dict, Generator, Iterable, Iterator, Optional, Tuple
 
 import httpx
 
+from .arrow import ArrowBuilder, arrow_builder
+from .cache import ResponseCache, request_scope
+from .compression import ACCEPT_ENCODING
+from .json_stream import SOLR_DOCS_PATH, aiter_json_items, iter_json_items
+from .transport import Transport, get_default_transport
 
 # Default Solr base URL; should point at the Solr root, not the generic API root
 DEFAULT_SOLR_BASE_URL = "https://www.bv-brc.org/api-bulk/"
@@ -41,6 +46,8 @@ def create_solr_context(overrides: Dict[str, Any] | None = None) -> Dict[str, An
     "auth": auth,
     "timeout": timeout,
     "request_format": request_format,
+    "transport": overrides.get("transport"),
+    "cache": overrides.get("cache"),
   }
 
 
@@ -90,11 +97,12 @@ def _prepare_request(
   base_url: Optional[str],
   headers: Optional[Dict[str, str]],
   request_format: Optional[str] = None,
+  handler: str = "",
 ) -> Tuple[str, Dict[str, Any], Dict[str, str], bool]:
   # Solr select endpoint
   # Direct collection access like the working curl example
   solr_base = (base_url or DEFAULT_SOLR_BASE_URL).rstrip("/")
-  url = f"{solr_base}/{collection}/"
+  url = f"{solr_base}/{collection}/{handler}"
   req_params = dict(params or {})
   final_headers = dict(headers or {})
 
@@ -106,6 +114,7 @@ def _prepare_request(
 
   # Add BV-BRC specific headers for Solr queries.
   final_headers["Accept"] = "application/solr+json"
+  final_headers.setdefault("Accept-Encoding", ACCEPT_ENCODING)
   if resolved_format == "json":
     final_headers["Content-Type"] = "application/json"
     return url, {"params": req_params}, final_headers, True
@@ -122,22 +131,46 @@ def select(
   auth: Any = None,
   timeout: float = 60.0,
   request_format: Optional[str] = None,
+  transport: Optional[Transport] = None,
+  cache: Optional[ResponseCache] = None,
+  info: Optional[Dict[str, Any]] = None,
+  arrow: bool | ArrowBuilder = False,
 ) -> Dict[str, Any]:
-  """Synchronous Solr select helper kept for backward compatibility."""
+  """
+  Synchronous Solr select helper kept for backward compatibility.
+
+  `info`, if given, receives the decoded response size as info["bytes"].
+  With `arrow` the docs stream into Arrow batches and a pyarrow.Table is
+  returned; numFound and the other response keys are copied into `info`.
+  """
+  if arrow:
+    builder = arrow_builder(arrow)
+    builder.extend(iter_select(collection, params, base_url, headers, auth, timeout, request_format, transport, meta=info, info=info))
+    return builder.to_table()
   url, req_payload, final_headers, send_json = _prepare_request(collection, params, base_url, headers, request_format)
   logger.info("Executing Solr query: collection=%s url=%s payload=%s", collection, url, req_payload)
 
-  with httpx.Client() as client:
-    response = client.post(
-      url,
-      json=req_payload if send_json else None,
-      data=None if send_json else req_payload,
-      headers=final_headers,
-      auth=auth,
-      timeout=timeout,
-    )
-    response.raise_for_status()
-    return response.json()
+  scope = request_scope(url, final_headers, auth) if cache is not None else ""
+  if cache is not None:
+    cached = cache.get(collection, req_payload, final_headers.get("Content-Type"), scope)
+    if cached is not None:
+      return cached
+
+  response = (transport or get_default_transport()).post(
+    url,
+    json=req_payload if send_json else None,
+    data=None if send_json else req_payload,
+    headers=final_headers,
+    auth=auth,
+    timeout=timeout,
+  )
+  response.raise_for_status()
+  if info is not None:
+    info["bytes"] = len(response.content)
+  result = response.json()
+  if cache is not None:
+    cache.set(collection, req_payload, final_headers.get("Content-Type"), result, scope)
+  return result
 
 
 async def async_select(
@@ -150,40 +183,244 @@ async def async_select(
   auth: Any = None,
   timeout: float = 60.0,
   request_format: Optional[str] = None,
+  transport: Optional[Transport] = None,
+  cache: Optional[ResponseCache] = None,
+  info: Optional[Dict[str, Any]] = None,
+  arrow: bool | ArrowBuilder = False,
 ) -> Dict[str, Any]:
-  """Async Solr select helper supporting optional shared AsyncClient."""
+  """Async Solr select; without `client` or `transport` it uses the default transport's pool."""
+  if arrow:
+    builder = arrow_builder(arrow)
+    await builder.aextend(async_iter_select(
+      collection,
+      params,
+      client=client,
+      base_url=base_url,
+      headers=headers,
+      auth=auth,
+      timeout=timeout,
+      request_format=request_format,
+      transport=transport,
+      meta=info,
+      info=info,
+    ))
+    return builder.to_table()
   url, req_payload, final_headers, send_json = _prepare_request(collection, params, base_url, headers, request_format)
   logger.info("Executing Solr query: collection=%s url=%s payload=%s", collection, url, req_payload)
 
-  if client is not None:
-    response = await client.post(
-      url,
-      json=req_payload if send_json else None,
-      data=None if send_json else req_payload,
-      headers=final_headers,
-      auth=auth,
-      timeout=timeout,
-    )
+  scope = request_scope(url, final_headers, auth) if cache is not None else ""
+  if cache is not None:
+    cached = cache.get(collection, req_payload, final_headers.get("Content-Type"), scope)
+    if cached is not None:
+      return cached
+
+  request_kwargs = {
+    "json": req_payload if send_json else None,
+    "data": None if send_json else req_payload,
+    "headers": final_headers,
+    "auth": auth,
+    "timeout": timeout,
+  }
+  if transport is not None:
+    response = await transport.async_post(url, client=client, **request_kwargs)
+  elif client is not None:
+    response = await client.post(url, **request_kwargs)
+  else:
+    response = await get_default_transport().async_post(url, **request_kwargs)
+  response.raise_for_status()
+  if info is not None:
+    info["bytes"] = len(response.content)
+  result = response.json()
+  if cache is not None:
+    cache.set(collection, req_payload, final_headers.get("Content-Type"), result, scope)
+  return result
+
+
+def _counted(chunks: Iterable[bytes], info: Optional[Dict[str, Any]]) -> Iterator[bytes]:
+  if info is None:
+    yield from chunks
+    return
+  info["bytes"] = 0
+  for chunk in chunks:
+    info["bytes"] += len(chunk)
+    yield chunk
+
+
+async def _acounted(chunks: AsyncIterable[bytes], info: Optional[Dict[str, Any]]) -> AsyncIterator[bytes]:
+  if info is not None:
+    info["bytes"] = 0
+  async for chunk in chunks:
+    if info is not None:
+      info["bytes"] += len(chunk)
+    yield chunk
+
+
+def iter_select(
+  collection: str,
+  params: Dict[str, Any],
+  base_url: Optional[str] = None,
+  headers: Optional[Dict[str, str]] = None,
+  auth: Any = None,
+  timeout: float = 60.0,
+  request_format: Optional[str] = None,
+  transport: Optional[Transport] = None,
+  meta: Optional[Dict[str, Any]] = None,
+  info: Optional[Dict[str, Any]] = None,
+) -> Generator[Dict[str, Any], None, None]:
+  """
+  Streaming select: yields docs as the response body arrives.
+
+  Peak memory is one document rather than the whole page. Everything
+  except response.docs (numFound, nextCursorMark, ...) is copied into
+  `meta` once the docs are exhausted, and the body size into info["bytes"].
+  """
+  url, req_payload, final_headers, send_json = _prepare_request(collection, params, base_url, headers, request_format)
+  logger.info("Streaming Solr query: collection=%s url=%s payload=%s", collection, url, req_payload)
+
+  with (transport or get_default_transport()).stream(
+    url,
+    json=req_payload if send_json else None,
+    data=None if send_json else req_payload,
+    headers=final_headers,
+    auth=auth,
+    timeout=timeout,
+  ) as response:
     response.raise_for_status()
-    return response.json()
-
-  async with httpx.AsyncClient() as local_client:
-    response = await local_client.post(
-      url,
-      json=req_payload if send_json else None,
-      data=None if send_json else req_payload,
-      headers=final_headers,
-      auth=auth,
-      timeout=timeout,
-    )
+    yield from iter_json_items(_counted(response.iter_bytes(), info), SOLR_DOCS_PATH, meta)
+
+
+async def async_iter_select(
+  collection: str,
+  params: Dict[str, Any],
+  *,
+  client: Optional[httpx.AsyncClient] = None,
+  base_url: Optional[str] = None,
+  headers: Optional[Dict[str, str]] = None,
+  auth: Any = None,
+  timeout: float = 60.0,
+  request_format: Optional[str] = None,
+  transport: Optional[Transport] = None,
+  meta: Optional[Dict[str, Any]] = None,
+  info: Optional[Dict[str, Any]] = None,
+) -> AsyncGenerator[Dict[str, Any], None]:
+  """Async counterpart of iter_select."""
+  url, req_payload, final_headers, send_json = _prepare_request(collection, params, base_url, headers, request_format)
+  logger.info("Streaming Solr query: collection=%s url=%s payload=%s", collection, url, req_payload)
+
+  request_kwargs = {
+    "json": req_payload if send_json else None,
+    "data": None if send_json else req_payload,
+    "headers": final_headers,
+    "auth": auth,
+    "timeout": timeout,
+  }
+  if transport is not None:
+    stream = transport.async_stream(url, client=client, **request_kwargs)
+  elif client is not None:
+    stream = client.stream("POST", url, **request_kwargs)
+  else:
+    stream = get_default_transport().async_stream(url, **request_kwargs)
+
+  async with stream as response:
+    response.raise_for_status()
+    async for doc in aiter_json_items(_acounted(response.aiter_bytes(), info), SOLR_DOCS_PATH, meta):
+      yield doc
+
+
+def _checked_export(docs: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+  # /export reports failures after the 200 header as an {"EXCEPTION": ...} tuple.
+  for doc in docs:
+    if "EXCEPTION" in doc:
+      raise ValueError(f"Solr export failed: {doc['EXCEPTION']}")
+    yield doc
+
+
+async def _achecked_export(docs: AsyncIterable[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+  async for doc in docs:
+    if "EXCEPTION" in doc:
+      raise ValueError(f"Solr export failed: {doc['EXCEPTION']}")
+    yield doc
+
+
+def iter_export(
+  collection: str,
+  params: Dict[str, Any],
+  base_url: Optional[str] = None,
+  headers: Optional[Dict[str, str]] = None,
+  auth: Any = None,
+  timeout: float = 60.0,
+  request_format: Optional[str] = None,
+  transport: Optional[Transport] = None,
+  meta: Optional[Dict[str, Any]] = None,
+  info: Optional[Dict[str, Any]] = None,
+) -> Generator[Dict[str, Any], None, None]:
+  """
+  Stream the tuples of Solr's /export handler as they arrive.
+
+  `params` must carry `fl` and `sort`, both limited to docValues fields; the
+  whole result set comes back in one sorted response with no rows/paging.
+  """
+  url, req_payload, final_headers, send_json = _prepare_request(collection, params, base_url, headers, request_format, "export")
+  logger.info("Exporting Solr collection: collection=%s url=%s payload=%s", collection, url, req_payload)
+
+  with (transport or get_default_transport()).stream(
+    url,
+    json=req_payload if send_json else None,
+    data=None if send_json else req_payload,
+    headers=final_headers,
+    auth=auth,
+    timeout=timeout,
+  ) as response:
+    response.raise_for_status()
+    yield from _checked_export(iter_json_items(_counted(response.iter_bytes(), info), SOLR_DOCS_PATH, meta))
+
+
+async def async_iter_export(
+  collection: str,
+  params: Dict[str, Any],
+  *,
+  client: Optional[httpx.AsyncClient] = None,
+  base_url: Optional[str] = None,
+  headers: Optional[Dict[str, str]] = None,
+  auth: Any = None,
+  timeout: float = 60.0,
+  request_format: Optional[str] = None,
+  transport: Optional[Transport] = None,
+  meta: Optional[Dict[str, Any]] = None,
+  info: Optional[Dict[str, Any]] = None,
+) -> AsyncGenerator[Dict[str, Any], None]:
+  """Async counterpart of iter_export."""
+  url, req_payload, final_headers, send_json = _prepare_request(collection, params, base_url, headers, request_format, "export")
+  logger.info("Exporting Solr collection: collection=%s url=%s payload=%s", collection, url, req_payload)
+
+  request_kwargs = {
+    "json": req_payload if send_json else None,
+    "data": None if send_json else req_payload,
+    "headers": final_headers,
+    "auth": auth,
+    "timeout": timeout,
+  }
+  if transport is not None:
+    stream = transport.async_stream(url, client=client, **request_kwargs)
+  elif client is not None:
+    stream = client.stream("POST", url, **request_kwargs)
+  else:
+    stream = get_default_transport().async_stream(url, **request_kwargs)
+
+  async with stream as response:
     response.raise_for_status()
-    return response.json()
+    async for doc in _achecked_export(aiter_json_items(_acounted(response.aiter_bytes(), info), SOLR_DOCS_PATH, meta)):
+      yield doc
 
 
 __all__ = [
   "create_solr_context",
   "resolve_request_format",
+  "async_iter_export",
+  "async_iter_select",
   "async_select",
+  "iter_export",
+  "iter_select",
   "select",
 ]
 
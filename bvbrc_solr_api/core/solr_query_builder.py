@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from types import SimpleNamespace
 from typing import Any, Dict, Iterable, List, Sequence
 
@@ -56,8 +57,45 @@ def between(field_name: str, start: Any, end: Any, include_start: bool = True, i
   return f"{field_name}:{left}{_quote_if_needed(start)} TO {_quote_if_needed(end)}{right}"
 
 
-def in_filters(field_name: str, values: Iterable[Any]) -> str:
-  vals = [ _quote_if_needed(v) for v in list(values) ]
+# Solr's default maxBooleanClauses; larger OR lists are rejected outright.
+MAX_BOOLEAN_CLAUSES = 1024
+DEFAULT_TERMS_CHUNK_SIZE = 5000
+_TERMS_SEPARATORS = (",", "|", "\t", "\u001f")
+
+
+def terms(field_name: str, values: Iterable[Any]) -> str:
+  """
+  `{!terms f=field}a,b,c` filter: a single set lookup instead of one scored
+  clause per value. It must be a whole q/fq, not part of a boolean expression.
+  """
+  vals = ["true" if v is True else "false" if v is False else str(v) for v in values]
+  if not vals:
+    return "*:*"
+  separator = next((sep for sep in _TERMS_SEPARATORS if not any(sep in v for v in vals)), None)
+  if separator is None:
+    raise ValueError("Values contain every supported terms separator")
+  if separator == ",":
+    return f"{{!terms f={field_name}}}" + ",".join(vals)
+  return f"{{!terms f={field_name} separator={json.dumps(separator)}}}" + separator.join(vals)
+
+
+def terms_chunks(field_name: str, values: Iterable[Any], chunk_size: int = DEFAULT_TERMS_CHUNK_SIZE) -> List[str]:
+  """Split a large value list into several terms filters, one per request."""
+  vals = list(dict.fromkeys(values))
+  size = max(1, int(chunk_size))
+  return [terms(field_name, vals[i:i + size]) for i in range(0, len(vals), size)]
+
+
+def in_filters(field_name: str, values: Iterable[Any], terms_threshold: int | None = None) -> str:
+  """
+  `field:(a OR b ...)`. With `terms_threshold` (e.g. MAX_BOOLEAN_CLAUSES), lists
+  longer than that become a terms filter instead; only opt in when the result
+  is used as a whole fq, since it cannot be combined with and_/or_.
+  """
+  values = list(values)
+  if terms_threshold is not None and len(values) > terms_threshold:
+    return terms(field_name, values)
+  vals = [ _quote_if_needed(v) for v in values ]
   if not vals:
     return "*:*"  # empty means match all; caller can AND with others
   return f"{field_name}:(" + " OR ".join(vals) + ")"
@@ -127,6 +165,8 @@ qb = SimpleNamespace(
   lt=lt,
   between=between,
   in_=in_filters,
+  terms=terms,
+  terms_chunks=terms_chunks,
   and_=and_filters,
   or_=or_filters,
   fl=fl,
@@ -142,6 +182,8 @@ __all__ = [
   "lt",
   "between",
   "in_filters",
+  "terms",
+  "terms_chunks",
   "and_filters",
   "or_filters",
   "fl",
@@ -0,0 +1,457 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Tuple
+
+import httpx
+
+from .compression import ACCEPT_ENCODING, encode_request
+from .concurrency import AdaptiveConcurrencyLimiter, RequestSlot
+from .retry import RetryPolicy, TokenBucket
+
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_TIMEOUT = 60.0
+
+# httpcore trace events emitted only when a brand new connection is opened.
+_NEW_CONNECTION_EVENTS = {
+  "connection.connect_tcp.complete",
+  "connection.connect_unix_socket.complete",
+}
+# Sentinel: "use the default RetryPolicy" (None disables retries).
+_DEFAULT_RETRY: Any = object()
+
+
+def _sync_tracer() -> Tuple[List[str], Callable]:
+  opened: List[str] = []
+
+  def trace(event_name: str, info: Dict[str, Any]) -> None:
+    if event_name in _NEW_CONNECTION_EVENTS:
+      opened.append(event_name)
+
+  return opened, trace
+
+
+def _async_tracer() -> Tuple[List[str], Callable]:
+  opened: List[str] = []
+
+  async def trace(event_name: str, info: Dict[str, Any]) -> None:
+    if event_name in _NEW_CONNECTION_EVENTS:
+      opened.append(event_name)
+
+  return opened, trace
+
+
+def _count_decoded(response: httpx.Response) -> List[int]:
+  # Streamed bodies are never held in full; tally decoded chunk sizes as the caller reads.
+  decoded = [0]
+  iter_bytes = response.iter_bytes
+  aiter_bytes = response.aiter_bytes
+
+  def counted(*args: Any, **kwargs: Any) -> Iterator[bytes]:
+    for chunk in iter_bytes(*args, **kwargs):
+      decoded[0] += len(chunk)
+      yield chunk
+
+  async def acounted(*args: Any, **kwargs: Any) -> AsyncIterator[bytes]:
+    async for chunk in aiter_bytes(*args, **kwargs):
+      decoded[0] += len(chunk)
+      yield chunk
+
+  response.iter_bytes = counted
+  response.aiter_bytes = acounted
+  return decoded
+
+
+class Transport:
+  """
+  Connection-pooled HTTP transport shared by RQL and Solr requests.
+
+  Keeps one httpx.Client (and lazily one httpx.AsyncClient) open so repeated
+  queries reuse keep-alive connections instead of paying a TLS handshake each.
+  Requests are retried per `retry` (429/5xx gateway errors and dropped
+  connections by default; pass None to disable) and, when `rate_limit` is
+  set, paced by a token bucket shared by every caller of this transport.
+  An optional AdaptiveConcurrencyLimiter caps in-flight async requests.
+
+  Responses are negotiated compressed (gzip/deflate, plus br/zstd when
+  brotli/zstandard are installed) and decoded while streaming. Request
+  bodies of at least `compress_requests` bytes are sent with
+  `request_encoding`; this is off by default because the server must accept
+  Content-Encoding on requests. `stats` compares bytes on the wire with
+  decoded bytes in both directions.
+  """
+
+  def __init__(
+    self,
+    *,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+    http2: bool = False,
+    timeout: float = DEFAULT_TIMEOUT,
+    retry: RetryPolicy | None = _DEFAULT_RETRY,
+    rate_limit: float | None = None,
+    rate_burst: int | None = None,
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+    compress_requests: int | None = None,
+    request_encoding: str = "gzip",
+  ) -> None:
+    self.limits = httpx.Limits(
+      max_connections=max_connections,
+      max_keepalive_connections=max_keepalive_connections,
+      keepalive_expiry=keepalive_expiry,
+    )
+    self.http2 = bool(http2)
+    self.timeout = timeout
+    self.retry = RetryPolicy() if retry is _DEFAULT_RETRY else retry
+    self.rate_limiter = TokenBucket(rate_limit, rate_burst) if rate_limit else None
+    self.concurrency_limiter = concurrency_limiter
+    self.compress_requests = compress_requests
+    self.request_encoding = request_encoding
+    self._client: httpx.Client | None = None
+    self._async_client: httpx.AsyncClient | None = None
+    self._async_loop: asyncio.AbstractEventLoop | None = None
+    self._closing: set[asyncio.Task] = set()
+    self._lock = threading.Lock()
+    self._requests = 0
+    self._new_connections = 0
+    self._pool_hits = 0
+    self._retries = 0
+    self._bytes = dict.fromkeys(("sent_raw", "sent", "received", "decoded"), 0)
+
+  def get_client(self) -> httpx.Client:
+    with self._lock:
+      if self._client is None or self._client.is_closed:
+        self._client = httpx.Client(
+          limits=self.limits,
+          http2=self.http2,
+          timeout=self.timeout,
+          headers={"Accept-Encoding": ACCEPT_ENCODING},
+        )
+      return self._client
+
+  def get_async_client(self) -> httpx.AsyncClient:
+    """
+    The pooled AsyncClient for the running event loop.
+
+    Pooled connections belong to the loop that opened them, so a new loop
+    (e.g. a later asyncio.run) gets a fresh client instead of the old pool.
+    """
+    try:
+      loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+    except RuntimeError:
+      loop = None
+    with self._lock:
+      stale = loop is not None and self._async_loop is not None and self._async_loop is not loop
+      if stale and self._async_client is not None and not self._async_client.is_closed:
+        self._discard_async_client(self._async_client, self._async_loop)
+      if self._async_client is None or self._async_client.is_closed or stale:
+        self._async_loop = loop
+        self._async_client = httpx.AsyncClient(
+          limits=self.limits,
+          http2=self.http2,
+          timeout=self.timeout,
+          headers={"Accept-Encoding": ACCEPT_ENCODING},
+        )
+      return self._async_client
+
+  def _discard_async_client(self, client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+    """Close a client left behind by another event loop so its pool and sockets are released."""
+    if not loop.is_closed():
+      try:
+        # Still usable (e.g. a loop on another thread): close it where its connections live.
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        return
+      except RuntimeError:
+        pass
+    # The old loop is gone (e.g. a finished asyncio.run); closing from this loop
+    # still drops the pool, and socket teardown errors are expected and ignored.
+    task = asyncio.get_running_loop().create_task(client.aclose())
+    self._closing.add(task)
+    task.add_done_callback(self._closed)
+
+  def _closed(self, task: asyncio.Task) -> None:
+    self._closing.discard(task)
+    if not task.cancelled():
+      task.exception()
+
+  def _throttle(self) -> None:
+    if self.rate_limiter is not None:
+      self.rate_limiter.acquire()
+
+  async def _async_throttle(self) -> None:
+    if self.rate_limiter is not None:
+      await self.rate_limiter.async_acquire()
+
+  def _retry_delay(self, attempt: int, response: httpx.Response | None = None, exc: BaseException | None = None) -> float | None:
+    """Backoff before the next attempt, or None when the result should be returned/raised."""
+    policy = self.retry
+    if policy is None or attempt >= policy.max_retries:
+      return None
+    if exc is not None and not policy.retries_exception(exc):
+      return None
+    if response is not None and not policy.retries_status(response.status_code):
+      return None
+    with self._lock:
+      self._retries += 1
+    return policy.delay(attempt, response)
+
+  def _encode(self, kwargs: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
+    """Pre-encode (and maybe compress) the body once so retries resend the same bytes."""
+    kwargs, raw_size, _ = encode_request(kwargs, self.compress_requests, self.request_encoding)
+    return kwargs, raw_size
+
+  def _record_bytes(self, response: httpx.Response, raw_size: int, decoded: int) -> None:
+    try:
+      sent = len(response.request.content)
+    except httpx.RequestNotRead:
+      sent = 0
+    with self._lock:
+      self._bytes["sent"] += sent
+      self._bytes["sent_raw"] += raw_size or sent
+      self._bytes["received"] += response.num_bytes_downloaded
+      self._bytes["decoded"] += decoded
+
+  def post(self, url: str, **kwargs: Any) -> httpx.Response:
+    kwargs, raw_size = self._encode(kwargs)
+    attempt = 0
+    while True:
+      self._throttle()
+      opened, trace = _sync_tracer()
+      try:
+        response = self.get_client().post(url, extensions={"trace": trace}, **kwargs)
+      except Exception as exc:
+        delay = self._retry_delay(attempt, exc=exc)
+        if delay is None:
+          raise
+      else:
+        self._record(len(opened))
+        self._record_bytes(response, raw_size, len(response.content))
+        delay = self._retry_delay(attempt, response)
+        if delay is None:
+          return response
+      time.sleep(delay)
+      attempt += 1
+
+  async def async_post(self, url: str, *, client: httpx.AsyncClient | None = None, **kwargs: Any) -> httpx.Response:
+    http_client = client or self.get_async_client()
+    kwargs, raw_size = self._encode(kwargs)
+    attempt = 0
+    while True:
+      await self._async_throttle()
+      opened, trace = _async_tracer()
+      async with RequestSlot(self.concurrency_limiter) as slot:
+        try:
+          response = await http_client.post(url, extensions={"trace": trace}, **kwargs)
+        except Exception as exc:
+          slot.exception(exc)
+          delay = self._retry_delay(attempt, exc=exc)
+          if delay is None:
+            raise
+        else:
+          slot.response(response)
+          self._record(len(opened))
+          self._record_bytes(response, raw_size, len(response.content))
+          delay = self._retry_delay(attempt, response)
+          if delay is None:
+            return response
+      await asyncio.sleep(delay)
+      attempt += 1
+
+  @contextmanager
+  def stream(self, url: str, **kwargs: Any) -> Iterator[httpx.Response]:
+    """
+    POST and expose the response before its body is read (see Response.iter_bytes).
+
+    Retries happen only before the body is handed to the caller; a failure
+    mid-body propagates.
+    """
+    kwargs, raw_size = self._encode(kwargs)
+    attempt = 0
+    while True:
+      self._throttle()
+      opened, trace = _sync_tracer()
+      stack = ExitStack()
+      try:
+        response = stack.enter_context(self.get_client().stream("POST", url, extensions={"trace": trace}, **kwargs))
+      except Exception as exc:
+        stack.close()
+        delay = self._retry_delay(attempt, exc=exc)
+        if delay is None:
+          raise
+      else:
+        self._record(len(opened))
+        delay = self._retry_delay(attempt, response)
+        if delay is None:
+          decoded = _count_decoded(response)
+          try:
+            with stack:
+              yield response
+          finally:
+            self._record_bytes(response, raw_size, decoded[0])
+          return
+        # Drain the (small) error body so the connection returns to the pool.
+        self._record_bytes(response, raw_size, len(response.read()))
+        stack.close()
+      time.sleep(delay)
+      attempt += 1
+
+  @asynccontextmanager
+  async def async_stream(self, url: str, *, client: httpx.AsyncClient | None = None, **kwargs: Any) -> AsyncIterator[httpx.Response]:
+    http_client = client or self.get_async_client()
+    kwargs, raw_size = self._encode(kwargs)
+    attempt = 0
+    while True:
+      await self._async_throttle()
+      opened, trace = _async_tracer()
+      stack = AsyncExitStack()
+      # The concurrency slot is held until the body has been consumed.
+      async with RequestSlot(self.concurrency_limiter) as slot:
+        try:
+          response = await stack.enter_async_context(http_client.stream("POST", url, extensions={"trace": trace}, **kwargs))
+        except Exception as exc:
+          slot.exception(exc)
+          await stack.aclose()
+          delay = self._retry_delay(attempt, exc=exc)
+          if delay is None:
+            raise
+        else:
+          slot.response(response)
+          self._record(len(opened))
+          delay = self._retry_delay(attempt, response)
+          if delay is None:
+            decoded = _count_decoded(response)
+            try:
+              async with stack:
+                yield response
+            finally:
+              self._record_bytes(response, raw_size, decoded[0])
+            return
+          self._record_bytes(response, raw_size, len(await response.aread()))
+          await stack.aclose()
+      await asyncio.sleep(delay)
+      attempt += 1
+
+  def _record(self, opened: int) -> None:
+    with self._lock:
+      self._requests += 1
+      self._new_connections += opened
+      if not opened:
+        self._pool_hits += 1
+
+  @property
+  def stats(self) -> Dict[str, Any]:
+    """Request counters: pool hits are requests served on a reused connection."""
+    with self._lock:
+      return {
+        "requests": self._requests,
+        "new_connections": self._new_connections,
+        "pool_hits": self._pool_hits,
+        "retries": self._retries,
+        "throttled_seconds": round(self.rate_limiter.waited, 3) if self.rate_limiter is not None else 0.0,
+        "concurrency_limit": self.concurrency_limiter.limit if self.concurrency_limiter is not None else None,
+        "queue_depth": self.concurrency_limiter.queue_depth if self.concurrency_limiter is not None else 0,
+        "bytes_sent": self._bytes["sent"],
+        "bytes_sent_raw": self._bytes["sent_raw"],
+        "bytes_received": self._bytes["received"],
+        "bytes_decoded": self._bytes["decoded"],
+        "compression_ratio": round(self._bytes["decoded"] / self._bytes["received"], 2) if self._bytes["received"] else None,
+      }
+
+  def reset_stats(self) -> None:
+    with self._lock:
+      self._requests = 0
+      self._new_connections = 0
+      self._pool_hits = 0
+      self._retries = 0
+      self._bytes = dict.fromkeys(self._bytes, 0)
+
+  def close(self) -> None:
+    if self._client is not None:
+      self._client.close()
+      self._client = None
+
+  async def aclose(self) -> None:
+    if self._async_client is not None:
+      await self._async_client.aclose()
+      self._async_client = None
+    self.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    self.close()
+    return False
+
+
+_default_transport: Transport | None = None
+_default_lock = threading.Lock()
+
+
+def create_transport(overrides: Dict[str, Any] | None = None) -> Transport:
+  """Build a Transport from context-style overrides (pool, keep-alive, http2, timeout, retry, rate limit, compression)."""
+  overrides = overrides or {}
+  retry = overrides.get("retry", _DEFAULT_RETRY)
+  if retry is _DEFAULT_RETRY and "max_retries" in overrides:
+    retry = RetryPolicy(overrides["max_retries"])
+  limiter = overrides.get("concurrency_limiter")
+  if limiter is None and overrides.get("adaptive_concurrency"):
+    options = overrides["adaptive_concurrency"]
+    limiter = AdaptiveConcurrencyLimiter(**(options if isinstance(options, dict) else {}))
+  return Transport(
+    max_connections=overrides.get("max_connections", DEFAULT_MAX_CONNECTIONS),
+    max_keepalive_connections=overrides.get("max_keepalive_connections", DEFAULT_MAX_KEEPALIVE_CONNECTIONS),
+    keepalive_expiry=overrides.get("keepalive_expiry", DEFAULT_KEEPALIVE_EXPIRY),
+    http2=overrides.get("http2", False),
+    timeout=overrides.get("timeout", DEFAULT_TIMEOUT),
+    retry=retry,
+    rate_limit=overrides.get("rate_limit"),
+    rate_burst=overrides.get("rate_burst"),
+    concurrency_limiter=limiter,
+    compress_requests=overrides.get("compress_requests"),
+    request_encoding=overrides.get("request_encoding", "gzip"),
+  )
+
+
+def get_default_transport() -> Transport:
+  """Return the process-wide transport, creating it on first use."""
+  global _default_transport
+  with _default_lock:
+    if _default_transport is None:
+      _default_transport = Transport()
+    return _default_transport
+
+
+def set_default_transport(transport: Transport | None) -> None:
+  """Replace the process-wide transport; None resets to a fresh default on next use."""
+  global _default_transport
+  with _default_lock:
+    _default_transport = transport
+
+
+def configure_transport(**kwargs: Any) -> Transport:
+  """Create and install a new process-wide transport. Call once at startup."""
+  global _default_transport
+  transport = create_transport(kwargs)
+  with _default_lock:
+    previous = _default_transport
+    _default_transport = transport
+  if previous is not None:
+    previous.close()
+  return transport
+
+
+__all__ = [
+  "Transport",
+  "create_transport",
+  "get_default_transport",
+  "set_default_transport",
+  "configure_transport",
+]
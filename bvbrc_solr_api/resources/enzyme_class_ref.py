@@ -3,85 +3,50 @@ from __future__ import annotations
 from typing import Any, Dict
 from urllib.parse import quote
 
-from ..core.http_client import run
 from ..core.query_builder import qb
-from ..core.solr_query_builder import qb as solrqb
-from ..core.solr_http_client import create_solr_context
-from ..core.cursor import CursorPager
+from ..core.resource import BaseResource
 
 
-class EnzymeClassRef:
-  def __init__(self, context: Dict[str, Any]):
-    self._ctx = context
+class EnzymeClassRef(BaseResource):
+  collection = "enzyme_class_ref"
+  unique_key = "ec_number"
+  record_fields = [
+    "ec_number",
+    "ec_description",
+    "go",
+    "_version_",
+    "date_inserted",
+    "date_modified",
+  ]
 
   def get_by_id(self, ec_number: str, options: Dict[str, Any] | None = None):
-    return run("enzyme_class_ref", qb.eq("ec_number", ec_number), options or {}, self._ctx["base_url"], self._ctx["headers"])
+    return self._get_by_key(ec_number, options)
 
   def query_by(self, filters: Dict[str, Any] | None = None, options: Dict[str, Any] | None = None):
-    return run("enzyme_class_ref", qb.build_and_from(filters or {}), options or {}, self._ctx["base_url"], self._ctx["headers"])
+    return self._run(qb.build_and_from(filters or {}), options)
 
   def get_by_ec_description(self, ec_description: str, options: Dict[str, Any] | None = None):
-    return run("enzyme_class_ref", qb.eq("ec_description", ec_description), options or {}, self._ctx["base_url"], self._ctx["headers"])
+    return self._run(qb.eq("ec_description", ec_description), options)
 
   def get_by_go(self, go_term: str, options: Dict[str, Any] | None = None):
-    return run("enzyme_class_ref", qb.eq("go", go_term), options or {}, self._ctx["base_url"], self._ctx["headers"])
+    return self._run(qb.eq("go", go_term), options)
 
   def get_by_version(self, version: int, options: Dict[str, Any] | None = None):
-    return run("enzyme_class_ref", qb.eq("_version_", version), options or {}, self._ctx["base_url"], self._ctx["headers"])
+    return self._run(qb.eq("_version_", version), options)
 
   def get_by_date_inserted_range(self, start_date: str, end_date: str, options: Dict[str, Any] | None = None):
     filters = [qb.gt("date_inserted", start_date), qb.lt("date_inserted", end_date)]
-    return run("enzyme_class_ref", qb.and_(*filters), options or {}, self._ctx["base_url"], self._ctx["headers"])
+    return self._run(qb.and_(*filters), options)
 
   def get_by_date_modified_range(self, start_date: str, end_date: str, options: Dict[str, Any] | None = None):
     filters = [qb.gt("date_modified", start_date), qb.lt("date_modified", end_date)]
-    return run("enzyme_class_ref", qb.and_(*filters), options or {}, self._ctx["base_url"], self._ctx["headers"])
+    return self._run(qb.and_(*filters), options)
 
   def search_by_keyword(self, keyword: str, options: Dict[str, Any] | None = None):
-    return run("enzyme_class_ref", f"keyword({quote(keyword)})", options or {}, self._ctx["base_url"], self._ctx["headers"])
+    return self._run(f"keyword({quote(keyword)})", options)
 
   def get_all(self, options: Dict[str, Any] | None = None):
-    return run("enzyme_class_ref", "", options or {}, self._ctx["base_url"], self._ctx["headers"])
-
-  # Solr cursor-based streaming (Option B implementation)
-  def stream_all_solr(
-    self,
-    *,
-    rows: int = 1000,
-    sort: str | None = None,
-    unique_key: str | None = "ec_number",
-    fields: list[str] | None = None,
-    q_expr: str | None = None,
-    fq: list[str] | None = None,
-    start_cursor: str = "*",
-    context_overrides: Dict[str, Any] | None = None,
-  ) -> CursorPager:
-    # Combine base context with optional overrides to build Solr context
-    merged_ctx: Dict[str, Any] = {}
-    merged_ctx.update(self._ctx)
-    if context_overrides:
-      merged_ctx.update(context_overrides)
-    solr_ctx = create_solr_context(merged_ctx)
-
-    base_params = solrqb.build_params(
-      q_expr=q_expr or "*:*",
-      fq_list=fq or None,
-      fields=fields or None,
-      # sort, rows, cursorMark handled by CursorPager for iteration
-    )
-
-    return CursorPager(
-      collection="enzyme_class_ref",
-      base_params=base_params,
-      base_url=solr_ctx["solr_base_url"],
-      headers=solr_ctx.get("headers"),
-      auth=solr_ctx.get("auth"),
-      rows=rows,
-      sort=f"{unique_key} asc",
-      unique_key=unique_key,
-      start_cursor=start_cursor,
-      timeout=solr_ctx.get("timeout", 60.0),
-    )
+    return self._run("", options)
 
 
 __all__ = ["EnzymeClassRef"]
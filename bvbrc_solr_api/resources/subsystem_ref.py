@@ -3,97 +3,62 @@ from __future__ import annotations
 from typing import Any, Dict
 from urllib.parse import quote
 
-from ..core.http_client import run
 from ..core.query_builder import qb
-from ..core.solr_query_builder import qb as solrqb
-from ..core.solr_http_client import create_solr_context
-from ..core.cursor import CursorPager
-
-
-class SubsystemRef:
-  def __init__(self, context: Dict[str, Any]):
-    self._ctx = context
+from ..core.resource import BaseResource
+
+
+class SubsystemRef(BaseResource):
+  collection = "subsystem_ref"
+  unique_key = "id"
+  record_fields = [
+    "id",
+    "description",
+    "role",
+    "role_id",
+    "subsystem_id",
+    "subsystem_name",
+    "superclass",
+  ]
+  dictionary_fields = ("superclass",)
 
   def get_by_id(self, id: str, options: Dict[str, Any] | None = None):
-    return run("subsystem_ref", qb.eq("id", id), options or {}, self._ctx["base_url"], self._ctx["headers"])
+    return self._get_by_key(id, options)
 
   def query_by(self, filters: Dict[str, Any] | None = None, options: Dict[str, Any] | None = None):
-    return run("subsystem_ref", qb.build_and_from(filters or {}), options or {}, self._ctx["base_url"], self._ctx["headers"])
+    return self._run(qb.build_and_from(filters or {}), options)
 
   def get_by_class(self, class_name: str, options: Dict[str, Any] | None = None):
-    return run("subsystem_ref", qb.eq("class", class_name), options or {}, self._ctx["base_url"], self._ctx["headers"])
+    return self._run(qb.eq("class", class_name), options)
 
   def get_by_description(self, description: str, options: Dict[str, Any] | None = None):
-    return run("subsystem_ref", qb.eq("description", description), options or {}, self._ctx["base_url"], self._ctx["headers"])
+    return self._run(qb.eq("description", description), options)
 
   def get_by_role(self, role: str, options: Dict[str, Any] | None = None):
-    return run("subsystem_ref", qb.eq("role", role), options or {}, self._ctx["base_url"], self._ctx["headers"])
+    return self._run(qb.eq("role", role), options)
 
   def get_by_role_id(self, role_id: str, options: Dict[str, Any] | None = None):
-    return run("subsystem_ref", qb.eq("role_id", role_id), options or {}, self._ctx["base_url"], self._ctx["headers"])
+    return self._run(qb.eq("role_id", role_id), options)
 
   def get_by_subsystem_id(self, subsystem_id: str, options: Dict[str, Any] | None = None):
-    return run("subsystem_ref", qb.eq("subsystem_id", subsystem_id), options or {}, self._ctx["base_url"], self._ctx["headers"])
+    return self._run(qb.eq("subsystem_id", subsystem_id), options)
 
   def get_by_subsystem_name(self, subsystem_name: str, options: Dict[str, Any] | None = None):
-    return run("subsystem_ref", qb.eq("subsystem_name", subsystem_name), options or {}, self._ctx["base_url"], self._ctx["headers"])
+    return self._run(qb.eq("subsystem_name", subsystem_name), options)
 
   def get_by_superclass(self, superclass: str, options: Dict[str, Any] | None = None):
-    return run("subsystem_ref", qb.eq("superclass", superclass), options or {}, self._ctx["base_url"], self._ctx["headers"])
+    return self._run(qb.eq("superclass", superclass), options)
 
   def get_by_date_inserted_range(self, start_date: str, end_date: str, options: Dict[str, Any] | None = None):
-    return run("subsystem_ref", qb.and_(qb.gte("date_inserted", start_date), qb.lte("date_inserted", end_date)), options or {}, self._ctx["base_url"], self._ctx["headers"])
+    return self._run(qb.and_(qb.gte("date_inserted", start_date), qb.lte("date_inserted", end_date)), options)
 
   def get_by_date_modified_range(self, start_date: str, end_date: str, options: Dict[str, Any] | None = None):
-    return run("subsystem_ref", qb.and_(qb.gte("date_modified", start_date), qb.lte("date_modified", end_date)), options or {}, self._ctx["base_url"], self._ctx["headers"])
+    return self._run(qb.and_(qb.gte("date_modified", start_date), qb.lte("date_modified", end_date)), options)
 
   def search_by_keyword(self, keyword: str, options: Dict[str, Any] | None = None):
-    return run("subsystem_ref", f"keyword({quote(keyword)})", options or {}, self._ctx["base_url"], self._ctx["headers"])
+    return self._run(f"keyword({quote(keyword)})", options)
 
   def get_all(self, options: Dict[str, Any] | None = None):
-    return run("subsystem_ref", "", options or {}, self._ctx["base_url"], self._ctx["headers"])
-
-  # Solr cursor-based streaming (Option B implementation)
-  def stream_all_solr(
-    self,
-    *,
-    rows: int = 1000,
-    sort: str | None = None,
-    unique_key: str | None = "id",
-    fields: list[str] | None = None,
-    q_expr: str | None = None,
-    fq: list[str] | None = None,
-    start_cursor: str = "*",
-    context_overrides: Dict[str, Any] | None = None,
-  ) -> CursorPager:
-    # Combine base context with optional overrides to build Solr context
-    merged_ctx: Dict[str, Any] = {}
-    merged_ctx.update(self._ctx)
-    if context_overrides:
-      merged_ctx.update(context_overrides)
-    solr_ctx = create_solr_context(merged_ctx)
-
-    base_params = solrqb.build_params(
-      q_expr=q_expr or "*:*",
-      fq_list=fq or None,
-      fields=fields or None,
-      # sort, rows, cursorMark handled by CursorPager for iteration
-    )
-
-    return CursorPager(
-      collection="subsystem_ref",
-      base_params=base_params,
-      base_url=solr_ctx["solr_base_url"],
-      headers=solr_ctx.get("headers"),
-      auth=solr_ctx.get("auth"),
-      rows=rows,
-      sort=f"{unique_key} asc",
-      unique_key=unique_key,
-      start_cursor=start_cursor,
-      timeout=solr_ctx.get("timeout", 60.0),
-    )
+    return self._run("", options)
 
 
 __all__ = ["SubsystemRef"]
-
-
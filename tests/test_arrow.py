@@ -0,0 +1,38 @@
+from decimal import Decimal
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from bvbrc_solr_api.core.arrow import ArrowBuilder
+
+
+def test_int_column_that_later_holds_floats_is_promoted_not_truncated():
+  table = ArrowBuilder(batch_size=2).extend([{"a": 1}, {"a": 2}, {"a": 1.5}, {"a": 2}]).to_table()
+  assert table.column("a").type == pa.float64()
+  assert table.column("a").to_pylist() == [1, 2, 1.5, 2]
+
+
+def test_null_only_batch_and_missing_columns_are_unified():
+  table = ArrowBuilder(batch_size=2).extend([{"a": None}, {"a": None}, {"a": "x", "b": 1}, {"a": "y"}]).to_table()
+  assert table.column("a").to_pylist() == [None, None, "x", "y"]
+  assert table.column("b").to_pylist() == [None, None, 1, None]
+
+
+def test_integers_beyond_int64_use_decimal():
+  table = ArrowBuilder().extend([{"a": 2 ** 70}, {"a": 1}]).to_table()
+  assert table.column("a").to_pylist() == [Decimal(2 ** 70), Decimal(1)]
+
+
+def test_dictionary_fields_survive_batches():
+  builder = ArrowBuilder(dictionary_fields=["strand"], batch_size=2)
+  table = builder.extend([{"strand": "+"}, {"strand": "-"}, {"strand": "+"}]).to_table()
+  assert pa.types.is_dictionary(table.column("strand").type)
+  assert table.column("strand").to_pylist() == ["+", "-", "+"]
+
+
+def test_declared_schema_rejects_values_that_would_truncate():
+  schema = pa.schema([("a", pa.int64())])
+  assert ArrowBuilder(schema).extend([{"a": 1}, {"a": 2.0}]).to_table().column("a").to_pylist() == [1, 2]
+  with pytest.raises(ValueError):
+    ArrowBuilder(schema).extend([{"a": 1.5}]).to_table()
@@ -0,0 +1,102 @@
+import asyncio
+
+from bvbrc_solr_api.core import batch as batch_module
+from bvbrc_solr_api.core.batch import BatchResult, async_get_many, chunk_ids, get_many
+from bvbrc_solr_api.core.query_builder import _encode, in_filters
+
+
+def _ids_in(filter_str):
+  # in(field,a,b,c) -> ["a", "b", "c"]
+  return filter_str[filter_str.index(",") + 1:-1].split(",")
+
+
+class FakeRun:
+  """Stands in for run/async_run; answers each in() chunk from `docs`, recording calls."""
+
+  def __init__(self, docs):
+    self.docs = {doc["genome_id"]: doc for doc in docs}
+    self.calls = []
+
+  def __call__(self, core_name, filter_str, options, *args, **kwargs):
+    self.calls.append((filter_str, options))
+    return [self.docs[key] for key in _ids_in(filter_str) if key in self.docs]
+
+
+def test_chunk_ids_respects_chunk_size():
+  chunks = chunk_ids("genome_id", [str(i) for i in range(7)], chunk_size=3)
+  assert chunks == [["0", "1", "2"], ["3", "4", "5"], ["6"]]
+
+
+def test_chunk_ids_respects_body_bytes():
+  ids = [f"{i:03d}.{i:03d}" for i in range(100)]
+  limit = 400
+  chunks = chunk_ids("genome_id", ids, chunk_size=1000, max_body_bytes=limit)
+  assert len(chunks) > 1
+  assert [value for chunk in chunks for value in chunk] == ids
+  for chunk in chunks:
+    # The 64-byte reserve for limit()/select() suffixes must still fit.
+    assert len(in_filters("genome_id", chunk)) + 64 <= limit
+
+
+def test_chunk_ids_counts_encoded_length():
+  ids = ["a b c d", "e f g h"]
+  encoded = len(in_filters("genome_id", [""])) + 64 + len(_encode(ids[0])) + 1
+  assert chunk_ids("genome_id", ids, max_body_bytes=encoded) == [[ids[0]], [ids[1]]]
+  assert chunk_ids("genome_id", ids, max_body_bytes=encoded + len(_encode(ids[1])) + 1) == [ids]
+
+
+def test_chunk_ids_keeps_oversized_value_alone():
+  assert chunk_ids("genome_id", ["x" * 200, "y"], max_body_bytes=10) == [["x" * 200], ["y"]]
+
+
+def test_chunk_ids_drops_duplicates():
+  assert chunk_ids("genome_id", ["1", "2", "1", 2]) == [["1", "2"]]
+
+
+def test_get_many_reports_missing_in_request_order(monkeypatch):
+  fake = FakeRun([{"genome_id": "3"}, {"genome_id": "1"}])
+  monkeypatch.setattr(batch_module, "run", fake)
+
+  result = get_many("genome", "genome_id", ["1", "2", "3", "1", "4"], {}, None, None, chunk_size=2)
+
+  assert isinstance(result, BatchResult)
+  assert list(result) == ["1", "3"]
+  assert result["3"] == {"genome_id": "3"}
+  assert result.missing == ["2", "4"]
+  assert sorted(_ids_in(filter_str) for filter_str, _ in fake.calls) == [["1", "2"], ["3", "4"]]
+
+
+def test_get_many_widens_limit_and_select(monkeypatch):
+  fake = FakeRun([])
+  monkeypatch.setattr(batch_module, "run", fake)
+
+  get_many("genome", "genome_id", ["1", "2", "3"], {"select": ["genome_name"], "limit": 1}, None, None)
+
+  (_, options), = fake.calls
+  assert options["limit"] == 3
+  assert options["select"] == ["genome_name", "genome_id"]
+
+
+def test_get_many_with_no_ids_makes_no_requests(monkeypatch):
+  fake = FakeRun([])
+  monkeypatch.setattr(batch_module, "run", fake)
+
+  result = get_many("genome", "genome_id", [], {}, None, None)
+
+  assert result == {} and result.missing == []
+  assert fake.calls == []
+
+
+def test_async_get_many_matches_numeric_ids_by_string(monkeypatch):
+  fake = FakeRun([{"genome_id": "2"}])
+
+  async def fake_async_run(*args, **kwargs):
+    return fake(*args, **kwargs)
+
+  monkeypatch.setattr(batch_module, "async_run", fake_async_run)
+
+  result = asyncio.run(async_get_many("genome", "genome_id", [1, 2], {}, None, None, chunk_size=1))
+
+  assert dict(result) == {2: {"genome_id": "2"}}
+  assert result.missing == [1]
+  assert len(fake.calls) == 2
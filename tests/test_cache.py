@@ -0,0 +1,65 @@
+import httpx
+
+from bvbrc_solr_api.core.cache import DiskCache, MemoryCache, ResponseCache, request_scope
+from bvbrc_solr_api.core.solr_http_client import select
+from bvbrc_solr_api.core.transport import Transport
+
+
+URL = "https://www.bv-brc.org/api/genome/"
+
+
+def test_entries_are_not_shared_across_endpoints_or_credentials(tmp_path):
+  cache = ResponseCache(DiskCache(str(tmp_path / "cache.db")))
+  private = request_scope(URL, {"Authorization": "token-a"})
+  cache.set("genome", "eq(genome_id,1)", "application/json", [{"private": True}], private)
+
+  assert cache.get("genome", "eq(genome_id,1)", "application/json", private) == [{"private": True}]
+  assert cache.get("genome", "eq(genome_id,1)", "application/json", request_scope(URL, {})) is None
+  assert cache.get("genome", "eq(genome_id,1)", "application/json", request_scope(URL, {"Authorization": "token-b"})) is None
+  other = request_scope("https://mirror.example.org/api/genome/", {"Authorization": "token-a"})
+  assert cache.get("genome", "eq(genome_id,1)", "application/json", other) is None
+
+
+def test_auth_objects_scope_entries():
+  basic = request_scope(URL, {}, httpx.BasicAuth("user", "secret"))
+  assert basic == request_scope(URL, {}, httpx.BasicAuth("user", "secret"))
+  assert basic != request_scope(URL, {}, httpx.BasicAuth("user", "other"))
+  assert basic != request_scope(URL, {})
+  assert request_scope(URL, {}, ("user", "secret")) != request_scope(URL, {}, ("user", "other"))
+
+
+def test_rql_term_order_does_not_matter_within_a_scope():
+  cache = ResponseCache(MemoryCache())
+  scope = request_scope(URL, {})
+  cache.set("genome", "eq(a,1)&limit(5)", "application/json", [1], scope)
+  assert cache.get("genome", "limit(5)&eq(a,1)", "application/json", scope) == [1]
+
+
+def test_fq_order_does_not_matter_for_form_or_json_payloads():
+  key = ResponseCache.make_key
+  assert key("genome", {"q": "*:*", "fq": ["a:1", "b:2"]}, "form") == key("genome", {"q": "*:*", "fq": ["b:2", "a:1"]}, "form")
+  json_fmt = "application/json"
+  assert key("genome", {"params": {"q": "*:*", "fq": ["a:1", "b:2"]}}, json_fmt) == key(
+    "genome", {"params": {"q": "*:*", "fq": ["b:2", "a:1"]}}, json_fmt
+  )
+  assert key("genome", {"query": "*:*", "filter": ["a:1", "b:2"]}, json_fmt) == key(
+    "genome", {"query": "*:*", "filter": ["b:2", "a:1"]}, json_fmt
+  )
+  assert key("genome", {"params": {"fq": ["a:1"]}}, json_fmt) != key("genome", {"params": {"fq": ["a:2"]}}, json_fmt)
+
+
+def test_json_format_select_hits_cache_with_reordered_fq():
+  sent = []
+
+  def handler(request):
+    sent.append(request)
+    return httpx.Response(200, json={"response": {"numFound": 0, "docs": []}})
+
+  transport = Transport()
+  transport._client = httpx.Client(transport=httpx.MockTransport(handler))
+  cache = ResponseCache(MemoryCache())
+  base_url = "https://example.org/solr"
+  for fq in (["genome_id:(1 2)", "public:true"], ["public:true", "genome_id:(1 2)"]):
+    select("genome", {"q": "*:*", "fq": fq}, base_url=base_url, request_format="json", transport=transport, cache=cache)
+  assert len(sent) == 1
+  assert cache.stats["hits"] == 1
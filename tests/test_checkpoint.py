@@ -0,0 +1,102 @@
+import json
+
+import pytest
+
+from bvbrc_solr_api.core.checkpoint import CheckpointedExport
+from bvbrc_solr_api.core.sinks import JsonLinesSink
+
+
+DOCS = [{"genome_id": f"g{i:02d}"} for i in range(10)]
+
+
+class FakePager:
+  """Serves DOCS three at a time; cursors are the next offset as a string."""
+
+  collection = "genome"
+  base_params = {"q": "*:*"}
+  base_url = "https://example.org/solr"
+  rows = 3
+  sort = "genome_id asc"
+  unique_key = "genome_id"
+
+  def __init__(self, fail_at=None):
+    self.cursor = "*"
+    self.fail_at = fail_at
+
+  def fetch_page(self, cursor):
+    start = 0 if cursor == "*" else int(cursor)
+    if start == self.fail_at:
+      raise ConnectionError("connection reset")
+    return DOCS[start:start + self.rows], str(min(start + self.rows, len(DOCS)))
+
+
+class CrashingSink(JsonLinesSink):
+  """Writes the page but dies before flushing it, like a process killed mid-page."""
+
+  def __init__(self, path, crash_after):
+    super().__init__(path)
+    self.crash_after = crash_after
+
+  def write(self, docs):
+    super().write(docs)
+    self.crash_after -= 1
+    if self.crash_after < 0:
+      self._file.flush()
+      raise KeyboardInterrupt
+
+
+def _lines(path):
+  with open(path) as handle:
+    return [json.loads(line) for line in handle]
+
+
+def test_run_resumes_after_a_crash_without_duplicates_or_gaps(tmp_path):
+  out, checkpoint = str(tmp_path / "out.ndjson"), str(tmp_path / "export.json")
+  with pytest.raises(KeyboardInterrupt):
+    with CrashingSink(out, crash_after=2) as sink:
+      CheckpointedExport(FakePager(), checkpoint).run(sink)
+  assert len(_lines(out)) == 9  # the third page reached the file but was never committed
+
+  export = CheckpointedExport(FakePager(), checkpoint)
+  assert export.rows_emitted == 6
+  with JsonLinesSink(out) as sink:
+    assert export.run(sink) == 10
+  assert _lines(out) == DOCS
+
+
+def test_iteration_resumes_from_the_last_committed_page(tmp_path):
+  checkpoint = str(tmp_path / "export.json")
+  seen = []
+  with pytest.raises(ConnectionError):
+    for doc in CheckpointedExport(FakePager(fail_at=6), checkpoint):
+      seen.append(doc)
+  assert seen == DOCS[:6]
+  assert list(CheckpointedExport(FakePager(), checkpoint)) == DOCS[6:]
+
+
+def test_a_checkpoint_cannot_switch_between_iteration_and_run(tmp_path):
+  checkpoint = str(tmp_path / "export.json")
+  pages = CheckpointedExport(FakePager(), checkpoint).iter_pages()
+  next(pages)
+  next(pages)
+  with JsonLinesSink(str(tmp_path / "out.ndjson")) as sink:
+    with pytest.raises(ValueError, match="iteration"):
+      CheckpointedExport(FakePager(), checkpoint).run(sink)
+
+  other = str(tmp_path / "other.json")
+  with pytest.raises(ConnectionError), JsonLinesSink(str(tmp_path / "other.ndjson")) as sink:
+    CheckpointedExport(FakePager(fail_at=3), other).run(sink)
+  with pytest.raises(ValueError, match="run"):
+    list(CheckpointedExport(FakePager(), other))
+
+
+def test_truncate_refuses_to_extend_a_shorter_file(tmp_path):
+  out = tmp_path / "out.ndjson"
+  with JsonLinesSink(str(out)) as sink:
+    sink.write(DOCS[:2])
+    position = sink.flush()
+  out.write_bytes(b"")
+  with JsonLinesSink(str(out)) as sink:
+    with pytest.raises(ValueError, match="fewer than the checkpointed"):
+      sink.truncate(position)
+  assert out.read_bytes() == b""
@@ -0,0 +1,107 @@
+import gzip
+import json
+import zlib
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from bvbrc_solr_api.core import compression as compression_module
+from bvbrc_solr_api.core.compression import ACCEPT_ENCODING, compress, encode_request, supported_encodings
+from bvbrc_solr_api.core.transport import Transport
+
+
+BIG_JSON = {"query": "*:*", "params": {"fq": [f"genome_id:{i}" for i in range(2000)]}}
+
+
+def test_none_threshold_leaves_request_untouched():
+  kwargs = {"json": BIG_JSON, "headers": {"X-Test": "1"}}
+  assert encode_request(kwargs, None) == (kwargs, 0, 0)
+
+
+def test_no_body_is_left_untouched():
+  kwargs = {"headers": {"X-Test": "1"}}
+  assert encode_request(kwargs, 0) == (kwargs, 0, 0)
+
+
+def test_small_json_body_is_serialized_but_not_compressed():
+  encoded, raw, wire = encode_request({"json": {"q": "*:*"}, "headers": {"X-Test": "1"}}, 1024)
+
+  assert "json" not in encoded
+  assert json.loads(encoded["content"]) == {"q": "*:*"}
+  assert raw == wire == len(encoded["content"])
+  assert encoded["headers"] == {"X-Test": "1", "Content-Type": "application/json"}
+
+
+def test_json_body_at_threshold_is_gzipped():
+  body = json.dumps(BIG_JSON, separators=(",", ":")).encode("utf-8")
+  encoded, raw, wire = encode_request({"json": BIG_JSON}, len(body))
+
+  assert raw == len(body)
+  assert wire == len(encoded["content"]) < raw
+  assert encoded["headers"]["Content-Encoding"] == "gzip"
+  assert encoded["headers"]["Content-Type"] == "application/json"
+  assert json.loads(gzip.decompress(encoded["content"])) == BIG_JSON
+
+
+def test_one_byte_below_threshold_is_not_compressed():
+  body = json.dumps(BIG_JSON, separators=(",", ":")).encode("utf-8")
+  encoded, _, _ = encode_request({"json": BIG_JSON}, len(body) + 1)
+  assert "Content-Encoding" not in encoded["headers"]
+  assert encoded["content"] == body
+
+
+def test_form_body_matches_httpx_encoding():
+  data = {"q": "*:*", "fq": ["a:1", "b:2"], "wt": None, "indent": False, "facet": True}
+  encoded, _, _ = encode_request({"data": data}, 0, "deflate")
+
+  assert encoded["headers"]["Content-Type"] == "application/x-www-form-urlencoded"
+  assert encoded["headers"]["Content-Encoding"] == "deflate"
+  form = parse_qs(zlib.decompress(encoded["content"]).decode("utf-8"), keep_blank_values=True)
+  assert form == {"q": ["*:*"], "fq": ["a:1", "b:2"], "wt": [""], "indent": ["false"], "facet": ["true"]}
+
+
+def test_caller_content_type_is_kept():
+  encoded, _, _ = encode_request({"json": {"q": "*:*"}, "headers": {"Content-Type": "application/vnd+json"}}, 0)
+  assert encoded["headers"]["Content-Type"] == "application/vnd+json"
+
+
+def test_caller_headers_are_not_mutated():
+  headers = {"X-Test": "1"}
+  encode_request({"json": BIG_JSON, "headers": headers}, 0)
+  assert headers == {"X-Test": "1"}
+
+
+def test_unknown_encoding_raises():
+  with pytest.raises(ValueError, match="Unsupported request encoding"):
+    compress(b"x", "lzma")
+
+
+def test_optional_codecs_are_advertised_only_when_installed(monkeypatch):
+  monkeypatch.setattr(compression_module, "brotli", None)
+  monkeypatch.setattr(compression_module, "zstandard", None)
+  assert supported_encodings() == ["gzip", "deflate"]
+  with pytest.raises(ValueError):
+    compress(b"x", "br")
+  assert ACCEPT_ENCODING.startswith("gzip, deflate")
+
+
+def test_transport_sends_compressed_body_and_counts_bytes():
+  sent = []
+
+  def handler(request):
+    sent.append(request)
+    return httpx.Response(200, json={})
+
+  transport = Transport(compress_requests=1024)
+  transport._client = httpx.Client(transport=httpx.MockTransport(handler))
+  transport.post("https://example.org/solr/genome/select", json=BIG_JSON)
+  transport.post("https://example.org/solr/genome/select", json={"q": "*:*"})
+
+  big, small = sent
+  assert big.headers["Content-Encoding"] == "gzip"
+  assert json.loads(gzip.decompress(big.content)) == BIG_JSON
+  assert "Content-Encoding" not in small.headers
+  stats = transport.stats
+  assert stats["bytes_sent"] == len(big.content) + len(small.content)
+  assert stats["bytes_sent_raw"] > stats["bytes_sent"]
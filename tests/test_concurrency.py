@@ -0,0 +1,162 @@
+import asyncio
+
+import httpx
+import pytest
+
+from bvbrc_solr_api.core import concurrency as concurrency_module
+from bvbrc_solr_api.core.concurrency import AdaptiveConcurrencyLimiter, RequestSlot
+
+
+class Clock:
+  def __init__(self):
+    self.now = 1000.0
+
+  def __call__(self):
+    return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+  clock = Clock()
+  monkeypatch.setattr(concurrency_module.time, "monotonic", clock)
+  return clock
+
+
+def _busy(limiter, count):
+  # Mark `count` requests in flight without an event loop.
+  limiter._in_flight += count
+
+
+def test_limit_grows_additively_while_busy_and_fast(clock):
+  limiter = AdaptiveConcurrencyLimiter(4, max_limit=100)
+
+  def succeed(times):
+    for _ in range(times):
+      limiter._in_flight = limiter.limit
+      limiter.release(latency=0.1)
+
+  # +1/limit per success: about one slot per round trip of `limit` requests.
+  succeed(4)
+  assert 4.9 < limiter._limit < 5.0
+  succeed(36)
+  assert limiter.limit == 9
+  assert limiter.stats["increases"] == 40 and limiter.stats["decreases"] == 0
+
+
+def test_idle_limit_does_not_grow(clock):
+  limiter = AdaptiveConcurrencyLimiter(8)
+  for _ in range(20):
+    _busy(limiter, 1)
+    limiter.release(latency=0.1)
+  assert limiter.limit == 8
+
+
+@pytest.mark.parametrize("status", [429, 500, 503])
+def test_overload_responses_cut_the_limit_multiplicatively(clock, status):
+  limiter = AdaptiveConcurrencyLimiter(16, backoff=0.5)
+
+  async def request():
+    async with RequestSlot(limiter) as slot:
+      slot.response(httpx.Response(status))
+
+  asyncio.run(request())
+  assert limiter.limit == 8
+  clock.now += 1
+  asyncio.run(request())
+  assert limiter.limit == 4
+
+
+def test_timeouts_cut_but_other_errors_and_4xx_do_not(clock):
+  limiter = AdaptiveConcurrencyLimiter(16)
+
+  async def request(outcome):
+    async with RequestSlot(limiter) as slot:
+      if isinstance(outcome, Exception):
+        slot.exception(outcome)
+        raise outcome
+      slot.response(httpx.Response(outcome))
+
+  for outcome in (httpx.ReadTimeout("slow"), ValueError("bad json")):
+    clock.now += 1
+    with pytest.raises(type(outcome)):
+      asyncio.run(request(outcome))
+  assert limiter.limit == 8
+  clock.now += 1
+  asyncio.run(request(404))
+  assert limiter.limit == 8 and limiter.stats["errors"] == 1
+
+
+def test_a_burst_of_failures_counts_once(clock):
+  limiter = AdaptiveConcurrencyLimiter(16)
+  _busy(limiter, 4)
+  limiter.release(latency=1.0)
+  for _ in range(3):
+    limiter.release(error=True)
+  assert limiter.limit == 8
+
+
+def test_limit_stays_within_bounds(clock):
+  limiter = AdaptiveConcurrencyLimiter(100, min_limit=2, max_limit=10)
+  assert limiter.limit == 10
+  for _ in range(200):
+    _busy(limiter, 10)
+    limiter.release(latency=0.1)
+  assert limiter.limit == 10
+  for _ in range(10):
+    clock.now += 1
+    _busy(limiter, 1)
+    limiter.release(error=True)
+  assert limiter.limit == 2
+
+
+def test_high_latency_trims_the_limit(clock):
+  limiter = AdaptiveConcurrencyLimiter(10, latency_tolerance=2.0)
+  _busy(limiter, 10)
+  limiter.release(latency=0.1)
+  clock.now += 1
+  for _ in range(10):
+    limiter.release(latency=5.0)
+  assert limiter.limit < 10
+
+
+def test_slot_is_released_when_the_request_raises():
+  limiter = AdaptiveConcurrencyLimiter(1)
+
+  async def failing():
+    async with RequestSlot(limiter):
+      raise RuntimeError("boom")
+
+  async def main():
+    with pytest.raises(RuntimeError):
+      await failing()
+    assert limiter.in_flight == 0
+    async with limiter.slot():
+      assert limiter.in_flight == 1
+    assert limiter.in_flight == 0
+
+  asyncio.run(main())
+
+
+def test_waiters_queue_in_order_and_cancelled_waiters_leave(clock):
+  limiter = AdaptiveConcurrencyLimiter(1)
+  order = []
+
+  async def worker(name, hold):
+    async with RequestSlot(limiter):
+      order.append(name)
+      await hold.wait()
+
+  async def main():
+    hold = asyncio.Event()
+    tasks = [asyncio.create_task(worker(name, hold)) for name in "abc"]
+    await asyncio.sleep(0)
+    assert limiter.in_flight == 1 and limiter.queue_depth == 2
+    tasks[1].cancel()
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 1
+    hold.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    assert limiter.in_flight == 0
+
+  asyncio.run(main())
+  assert order == ["a", "c"]
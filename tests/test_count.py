@@ -0,0 +1,47 @@
+import asyncio
+
+from bvbrc_solr_api.core import count as count_module
+
+
+ROWS = [{"genome_id": str(i)} for i in range(12)]
+
+
+def _no_total(monkeypatch):
+  scans = []
+
+  def fetch_page(core_name, filter, options, *args):
+    return ROWS[:options["limit"]], None
+
+  def paginate(core_name, filter, options, *args, page_size):
+    scans.append(options)
+    return iter(ROWS[:options["limit"]])
+
+  async def async_fetch_page(core_name, filter, options, *args):
+    return fetch_page(core_name, filter, options)
+
+  async def async_paginate(core_name, filter, options, *args, page_size):
+    for row in paginate(core_name, filter, options, page_size=page_size):
+      yield row
+
+  monkeypatch.setattr(count_module, "fetch_page", fetch_page)
+  monkeypatch.setattr(count_module, "paginate", paginate)
+  monkeypatch.setattr(count_module, "async_fetch_page", async_fetch_page)
+  monkeypatch.setattr(count_module, "async_paginate", async_paginate)
+  return scans
+
+
+def test_count_without_a_total_is_unknown_instead_of_a_full_scan(monkeypatch):
+  scans = _no_total(monkeypatch)
+  assert count_module.count("genome", "", None, None, key="genome_id") is None
+  assert asyncio.run(count_module.async_count("genome", "", None, None, key="genome_id")) is None
+  assert scans == []
+
+
+def test_count_scans_at_most_max_scan_rows(monkeypatch):
+  scans = _no_total(monkeypatch)
+  assert count_module.count("genome", "", None, None, key="genome_id", max_scan=20) == 12
+  assert count_module.count("genome", "", None, None, key="genome_id", max_scan=12) == 12
+  assert count_module.count("genome", "", None, None, key="genome_id", max_scan=5) is None
+  assert asyncio.run(count_module.async_count("genome", "", None, None, key="genome_id", max_scan=5)) is None
+  assert [scan["limit"] for scan in scans] == [21, 13, 6, 6]
+  assert all(scan["select"] == ["genome_id"] for scan in scans)
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from bvbrc_solr_api.core import cursor as cursor_module
+from bvbrc_solr_api.core.cursor import AsyncCursorPager
+
+
+DOCS = [{"id": f"d{i:02d}"} for i in range(10)]
+
+
+class FakeSolr:
+  """Cursor pages of `rows` docs; cursors are offsets. `gate` pauses the fetch of one cursor."""
+
+  def __init__(self, fail_at=None):
+    self.cursors = []
+    self.fail_at = fail_at
+    self.cancelled = False
+    self.gate = None
+
+  async def __call__(self, collection, params, **kwargs):
+    cursor = params["cursorMark"]
+    self.cursors.append(cursor)
+    start = 0 if cursor == "*" else int(cursor)
+    if start == self.fail_at:
+      raise RuntimeError("solr down")
+    if self.gate is not None and start >= 6:
+      try:
+        await self.gate.wait()
+      except asyncio.CancelledError:
+        self.cancelled = True
+        raise
+    page = DOCS[start:start + params["rows"]]
+    return {"response": {"docs": page}, "nextCursorMark": str(start + len(page))}
+
+
+def _pager(monkeypatch, solr, prefetch=2):
+  monkeypatch.setattr(cursor_module, "async_select", solr)
+  return AsyncCursorPager(collection="genome", base_params={"q": "*:*"}, base_url="https://example.org/solr", rows=2, prefetch=prefetch)
+
+
+def test_pages_arrive_in_cursor_order(monkeypatch):
+  solr = FakeSolr()
+  pager = _pager(monkeypatch, solr)
+
+  async def collect():
+    return [doc async for doc in pager]
+
+  assert asyncio.run(collect()) == DOCS
+  assert solr.cursors == ["*", "2", "4", "6", "8", "10"]
+  assert pager.cursor == "8"
+
+
+def test_prefetch_bounds_the_read_ahead(monkeypatch):
+  solr = FakeSolr()
+  pager = _pager(monkeypatch, solr, prefetch=2)
+
+  async def first_page():
+    pages = pager.iter_pages()
+    page = await pages.__anext__()
+    for _ in range(20):
+      await asyncio.sleep(0)
+    fetched = list(solr.cursors)
+    await pages.aclose()
+    return page, fetched
+
+  page, fetched = asyncio.run(first_page())
+  assert page == DOCS[:2]
+  # One page handed out, `prefetch` queued, and one more fetched while waiting for room.
+  assert fetched == ["*", "2", "4", "6"]
+
+
+def test_breaking_early_cancels_the_producer(monkeypatch):
+  solr = FakeSolr()
+  pager = _pager(monkeypatch, solr, prefetch=1)
+
+  async def consume():
+    solr.gate = asyncio.Event()
+    seen = []
+    async for doc in pager:
+      seen.append(doc)
+      if len(seen) == 3:
+        break
+    return seen
+
+  assert asyncio.run(consume()) == DOCS[:3]
+  assert solr.cancelled
+  assert pager.cursor == "2"
+
+
+def test_producer_errors_reach_the_consumer(monkeypatch):
+  pager = _pager(monkeypatch, FakeSolr(fail_at=4))
+
+  async def collect(seen):
+    async for doc in pager:
+      seen.append(doc)
+
+  seen = []
+  with pytest.raises(RuntimeError, match="solr down"):
+    asyncio.run(collect(seen))
+  assert seen == DOCS[:4]
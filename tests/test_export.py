@@ -0,0 +1,148 @@
+import asyncio
+
+import httpx
+import pytest
+
+from bvbrc_solr_api.core import cursor as cursor_module
+from bvbrc_solr_api.core import export as export_module
+from bvbrc_solr_api.core.cursor import AsyncCursorPager, CursorPager
+from bvbrc_solr_api.core.export import AsyncExportStream, ExportStream
+
+
+DOCS = [{"genome_id": f"g{i}"} for i in range(5)]
+URL = "https://example.org/solr"
+
+
+def _status_error(status):
+  request = httpx.Request("POST", f"{URL}/genome/export")
+  return httpx.HTTPStatusError("rejected", request=request, response=httpx.Response(status, request=request))
+
+
+class FakeExport:
+  """Stands in for iter_export: yields `docs`, raising `error` after `fail_after` tuples."""
+
+  def __init__(self, docs=DOCS, error=None, fail_after=0):
+    self.docs = docs
+    self.error = error
+    self.fail_after = fail_after
+    self.params = []
+
+  def __call__(self, collection, params, **kwargs):
+    self.params.append(params)
+    for index, doc in enumerate(self.docs):
+      if self.error is not None and index == self.fail_after:
+        raise self.error
+      yield doc
+    if self.error is not None and self.fail_after >= len(self.docs):
+      raise self.error
+
+
+class FakeSelect:
+  """Cursor pages of two docs from DOCS; cursors are offsets."""
+
+  def __init__(self):
+    self.cursors = []
+
+  def __call__(self, collection, params, **kwargs):
+    cursor = params["cursorMark"]
+    self.cursors.append(cursor)
+    start = 0 if cursor == "*" else int(cursor)
+    page = DOCS[start:start + params["rows"]]
+    return {"response": {"docs": page}, "nextCursorMark": str(start + len(page))}
+
+
+def _stream(monkeypatch, export, fl="genome_id"):
+  select = FakeSelect()
+  monkeypatch.setattr(export_module, "iter_export", export)
+  monkeypatch.setattr(cursor_module, "select", select)
+  params = {"q": "*:*", "fl": fl} if fl is not None else {"q": "*:*"}
+  pager = CursorPager(collection="genome", base_params=params, base_url=URL, rows=2, unique_key="genome_id")
+  return ExportStream(pager), select
+
+
+def test_exportable_query_uses_export_handler(monkeypatch):
+  export = FakeExport()
+  stream, select = _stream(monkeypatch, export)
+
+  assert list(stream) == DOCS
+  assert stream.mode == "export"
+  assert stream.fallback_reason is None
+  assert stream.stats["docs"] == len(DOCS)
+  assert select.cursors == []
+  (params,) = export.params
+  assert params["sort"] == "genome_id asc"
+  assert "rows" not in params and "cursorMark" not in params
+
+
+@pytest.mark.parametrize("fl", ["*", "genome_id,score", "genome_*", None])
+def test_wildcard_or_missing_fl_falls_back_without_calling_export(monkeypatch, fl):
+  export = FakeExport()
+  stream, select = _stream(monkeypatch, export, fl=fl)
+
+  assert list(stream) == DOCS
+  assert stream.mode == "cursor"
+  assert stream.fallback_reason
+  assert export.params == []
+  assert select.cursors[0] == "*"
+  assert stream.stats["mode"] == "cursor"
+
+
+@pytest.mark.parametrize("status", [400, 404])
+def test_export_rejection_before_first_tuple_falls_back(monkeypatch, status):
+  stream, select = _stream(monkeypatch, FakeExport(error=_status_error(status)))
+
+  assert list(stream) == DOCS
+  assert stream.mode == "cursor"
+  assert stream.fallback_reason == f"/export returned HTTP {status}"
+  assert select.cursors[0] == "*"
+
+
+def test_export_error_payload_falls_back(monkeypatch):
+  stream, _ = _stream(monkeypatch, FakeExport(error=ValueError("field genome_id has no docValues")))
+
+  assert list(stream) == DOCS
+  assert stream.fallback_reason == "field genome_id has no docValues"
+
+
+def test_server_error_is_not_masked_by_fallback(monkeypatch):
+  stream, select = _stream(monkeypatch, FakeExport(error=_status_error(500)))
+
+  with pytest.raises(httpx.HTTPStatusError):
+    list(stream)
+  assert select.cursors == []
+
+
+def test_failure_after_first_tuple_is_raised(monkeypatch):
+  # Falling back mid-stream would duplicate the tuples already yielded.
+  stream, select = _stream(monkeypatch, FakeExport(error=_status_error(400), fail_after=2))
+
+  with pytest.raises(httpx.HTTPStatusError):
+    list(stream)
+  assert select.cursors == []
+
+
+def test_async_export_rejection_falls_back(monkeypatch):
+  exported = []
+
+  async def fake_export(collection, params, **kwargs):
+    exported.append(params)
+    raise _status_error(400)
+    yield  # pragma: no cover
+
+  async def fake_select(collection, params, **kwargs):
+    start = 0 if params["cursorMark"] == "*" else int(params["cursorMark"])
+    page = DOCS[start:start + params["rows"]]
+    return {"response": {"docs": page}, "nextCursorMark": str(start + len(page))}
+
+  monkeypatch.setattr(export_module, "async_iter_export", fake_export)
+  monkeypatch.setattr(cursor_module, "async_select", fake_select)
+  pager = AsyncCursorPager(collection="genome", base_params={"q": "*:*", "fl": "genome_id"}, base_url=URL, rows=2, unique_key="genome_id")
+  stream = AsyncExportStream(pager)
+
+  async def collect():
+    return [doc async for doc in stream]
+
+  assert asyncio.run(collect()) == DOCS
+  assert len(exported) == 1
+  assert stream.mode == "cursor"
+  assert stream.fallback_reason == "/export returned HTTP 400"
@@ -0,0 +1,125 @@
+import json
+
+from bvbrc_solr_api.core.facets import (
+  FacetBucket,
+  FacetResult,
+  FieldStats,
+  PivotBucket,
+  RangeSpec,
+  build_facet_params,
+)
+
+
+def test_build_facet_params_field_and_range():
+  params = build_facet_params(
+    {"q": "*:*", "rows": 25, "fq": ["public:true"]},
+    fields=["genome_status", "host_name"],
+    ranges=[RangeSpec("collection_date", "NOW/YEAR-5YEARS", "NOW", "+1YEAR", other="all"), ("genome_length", 0, 10_000_000, 1_000_000)],
+    limit=10,
+    mincount=2,
+    missing=True,
+    sort="index",
+  )
+
+  assert params["q"] == "*:*" and params["fq"] == ["public:true"]
+  assert params["rows"] == 0
+  assert params["facet"] == "true"
+  assert params["facet.limit"] == 10
+  assert params["facet.mincount"] == 2
+  assert params["facet.sort"] == "index"
+  assert params["facet.missing"] == "true"
+  assert params["facet.field"] == ["genome_status", "host_name"]
+  assert params["facet.range"] == ["collection_date", "genome_length"]
+  assert params["f.collection_date.facet.range.gap"] == "+1YEAR"
+  assert params["f.collection_date.facet.range.other"] == "all"
+  assert "f.genome_length.facet.range.other" not in params
+  assert params["f.genome_length.facet.range.end"] == 10_000_000
+  assert params["f.genome_length.facet.mincount"] == 0
+
+
+def test_build_facet_params_pivot_json_and_stats():
+  base = {"q": "*:*"}
+  params = build_facet_params(
+    base,
+    pivots=[["genome_status", "host_name"], "isolation_country,host_name"],
+    json_facet={"avg_gc": "avg(gc_content)"},
+    stats=["genome_length"],
+  )
+
+  assert base == {"q": "*:*"}
+  assert params["facet.pivot"] == ["genome_status,host_name", "isolation_country,host_name"]
+  assert json.loads(params["json.facet"]) == {"avg_gc": "avg(gc_content)"}
+  assert params["stats"] == "true"
+  assert params["stats.field"] == ["genome_length"]
+
+
+def test_build_facet_params_stats_only_skips_facet_switch():
+  params = build_facet_params({"q": "*:*"}, stats=["genome_length"])
+  assert "facet" not in params and "facet.limit" not in params
+  assert params["rows"] == 0
+
+
+CANNED = {
+  "responseHeader": {"status": 0},
+  "response": {"numFound": 42, "start": 0, "docs": []},
+  "facet_counts": {
+    "facet_fields": {"genome_status": ["Complete", 30, "WGS", 10, "Plasmid", 2]},
+    "facet_ranges": {
+      "genome_length": {
+        "counts": ["0", 12, "1000000", 30],
+        "gap": 1000000,
+        "start": 0,
+        "end": 2000000,
+        "before": 0,
+        "after": 0,
+        "between": 42,
+      },
+    },
+    "facet_pivot": {
+      "genome_status,host_name": [
+        {
+          "field": "genome_status",
+          "value": "Complete",
+          "count": 30,
+          "pivot": [{"field": "host_name", "value": "Human", "count": 25}],
+        },
+      ],
+    },
+  },
+  "stats": {
+    "stats_fields": {
+      "genome_length": {"min": 1200.0, "max": 1990000.0, "count": 40, "missing": 2, "sum": 4.0e7, "sumOfSquares": 5.0e13, "mean": 1.0e6, "stddev": 2.0e5},
+      "gc_content": None,
+    },
+  },
+  "facets": {"count": 42, "avg_gc": 51.2},
+}
+
+
+def test_facet_result_parses_canned_response():
+  result = FacetResult(CANNED)
+
+  assert result.num_found == 42
+  assert result.fields["genome_status"] == [FacetBucket("Complete", 30), FacetBucket("WGS", 10), FacetBucket("Plasmid", 2)]
+  assert result.counts("genome_status") == {"Complete": 30, "WGS": 10, "Plasmid": 2}
+  assert result.counts("host_name") == {}
+
+  length = result.ranges["genome_length"]
+  assert length.buckets == [FacetBucket("0", 12), FacetBucket("1000000", 30)]
+  assert (length.start, length.end, length.gap) == (0, 2000000, 1000000)
+  assert (length.before, length.after, length.between) == (0, 0, 42)
+
+  (complete,) = result.pivots["genome_status,host_name"]
+  assert complete == PivotBucket("genome_status", "Complete", 30, [PivotBucket("host_name", "Human", 25, [])])
+
+  assert result.stats == {
+    "genome_length": FieldStats("genome_length", 40, 2, 1200.0, 1990000.0, 4.0e7, 1.0e6, 2.0e5, 5.0e13),
+  }
+  assert result.json == {"count": 42, "avg_gc": 51.2}
+  assert result.raw is CANNED
+
+
+def test_facet_result_tolerates_plain_select_response():
+  result = FacetResult({"response": {"numFound": 3, "docs": [{}, {}, {}]}})
+  assert result.num_found == 3
+  assert (result.fields, result.ranges, result.pivots, result.stats, result.json) == ({}, {}, {}, {}, {})
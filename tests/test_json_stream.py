@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from bvbrc_solr_api.core.json_stream import SOLR_DOCS_PATH, JsonItemParser, iter_json_items
+
+
+SOLR_PAYLOAD = json.dumps({
+  "responseHeader": {"status": 0, "QTime": 3},
+  "response": {
+    "numFound": 3,
+    "start": 0,
+    "maxScore": 1.5,
+    "docs": [
+      {"id": "a", "score": 1.25e-3, "n": -12, "ok": True, "tags": ["x", "y"]},
+      {"id": "b", "score": 2.0, "n": 0, "ok": False, "missing": None},
+      {"id": "cé", "score": 1e5, "n": 123456789012, "nested": {"v": [1, 2.5, None]}},
+    ],
+  },
+  "nextCursorMark": "AoE",
+}).encode("utf-8")
+
+ARRAY_PAYLOAD = b'[1e5, 2.5, -3, true, false, null, "s", {"k": 1.0}, [0.5]]'
+
+
+def _split_at_every_offset(payload):
+  for offset in range(len(payload) + 1):
+    yield [payload[:offset], payload[offset:]]
+
+
+@pytest.mark.parametrize("chunks", list(_split_at_every_offset(SOLR_PAYLOAD)))
+def test_solr_docs_match_json_loads_at_every_split(chunks):
+  expected = json.loads(SOLR_PAYLOAD)
+  meta = {}
+  docs = list(iter_json_items(chunks, SOLR_DOCS_PATH, meta))
+  assert docs == expected["response"]["docs"]
+  assert meta["response"]["maxScore"] == expected["response"]["maxScore"]
+  assert meta["nextCursorMark"] == expected["nextCursorMark"]
+
+
+@pytest.mark.parametrize("chunks", list(_split_at_every_offset(ARRAY_PAYLOAD)))
+def test_top_level_array_matches_json_loads_at_every_split(chunks):
+  assert list(iter_json_items(chunks)) == json.loads(ARRAY_PAYLOAD)
+
+
+@pytest.mark.parametrize("payload", [SOLR_PAYLOAD, ARRAY_PAYLOAD])
+def test_single_byte_chunks(payload):
+  chunks = [payload[i:i + 1] for i in range(len(payload))]
+  path = SOLR_DOCS_PATH if payload is SOLR_PAYLOAD else ()
+  expected = json.loads(payload)
+  assert list(iter_json_items(chunks, path)) == (expected["response"]["docs"] if path else expected)
+
+
+def test_number_split_at_decimal_point_or_exponent():
+  chunks = [b'{"response":{"maxScore":1.', b'5,"docs":[{"id":"a"}]}}']
+  assert list(iter_json_items(chunks, SOLR_DOCS_PATH)) == [{"id": "a"}]
+  assert list(iter_json_items([b"[1e", b"5]"])) == [1e5]
+
+
+def test_malformed_and_truncated_input_raise():
+  with pytest.raises(ValueError):
+    list(iter_json_items([b"[1.x]"]))
+  parser = JsonItemParser()
+  parser.feed(b'[{"id": 1}, ')
+  with pytest.raises(ValueError):
+    parser.close()
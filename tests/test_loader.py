@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+from bvbrc_solr_api.core.loader import BatchLoader
+
+
+class Recorder:
+  """batch_fn that records each batch and echoes keys back upper-cased."""
+
+  def __init__(self, error=None):
+    self.batches = []
+    self.error = error
+
+  async def __call__(self, keys):
+    self.batches.append(list(keys))
+    await asyncio.sleep(0)
+    if self.error is not None:
+      raise self.error
+    return {key: key.upper() for key in keys if key != "missing"}
+
+
+def test_loads_within_window_share_one_batch():
+  fetch = Recorder()
+
+  async def main():
+    loader = BatchLoader(fetch, window=0.01)
+    return await asyncio.gather(*[loader.load(key) for key in ["a", "b", "c"]])
+
+  assert asyncio.run(main()) == ["A", "B", "C"]
+  assert fetch.batches == [["a", "b", "c"]]
+
+
+def test_max_batch_dispatches_without_waiting_for_window():
+  fetch = Recorder()
+
+  async def main():
+    # A window this long would time out the test if max_batch did not flush.
+    loader = BatchLoader(fetch, window=60, max_batch=2)
+    return await asyncio.wait_for(asyncio.gather(*[loader.load(key) for key in ["a", "b", "c", "d"]]), 1)
+
+  assert asyncio.run(main()) == ["A", "B", "C", "D"]
+  assert fetch.batches == [["a", "b"], ["c", "d"]]
+
+
+def test_duplicate_keys_share_one_future():
+  fetch = Recorder()
+
+  async def main():
+    loader = BatchLoader(fetch, window=0.01)
+    first = asyncio.ensure_future(loader.load("a"))
+    await asyncio.sleep(0)
+    in_flight = loader._futures["a"]
+    results = await asyncio.gather(first, loader.load("a"), loader.load("b"), loader.load("a"))
+    return in_flight, loader._futures, results
+
+  in_flight, futures, results = asyncio.run(main())
+  assert results == ["A", "A", "B", "A"]
+  assert fetch.batches == [["a", "b"]]
+  assert in_flight.result() == "A"
+  assert futures == {}
+
+
+def test_key_after_completion_is_fetched_again():
+  fetch = Recorder()
+
+  async def main():
+    loader = BatchLoader(fetch, window=0)
+    await loader.load("a")
+    await loader.load("a")
+
+  asyncio.run(main())
+  assert fetch.batches == [["a"], ["a"]]
+
+
+def test_missing_key_resolves_to_none():
+  fetch = Recorder()
+
+  async def main():
+    loader = BatchLoader(fetch, window=0)
+    return await asyncio.gather(loader.load("a"), loader.load("missing"))
+
+  assert asyncio.run(main()) == ["A", None]
+
+
+def test_batch_error_fans_out_to_every_caller():
+  fetch = Recorder(error=RuntimeError("solr down"))
+
+  async def main():
+    loader = BatchLoader(fetch, window=0.01)
+    results = await asyncio.gather(*[loader.load(key) for key in ["a", "b", "a"]], return_exceptions=True)
+    return loader, results
+
+  loader, results = asyncio.run(main())
+  assert fetch.batches == [["a", "b"]]
+  assert all(isinstance(result, RuntimeError) for result in results)
+  assert loader._futures == {}
+
+
+def test_cancelled_caller_does_not_cancel_shared_load():
+  fetch = Recorder()
+
+  async def main():
+    loader = BatchLoader(fetch, window=0.01)
+    doomed = asyncio.ensure_future(loader.load("a"))
+    survivor = asyncio.ensure_future(loader.load("a"))
+    await asyncio.sleep(0)
+    doomed.cancel()
+    with pytest.raises(asyncio.CancelledError):
+      await doomed
+    return await survivor
+
+  assert asyncio.run(main()) == "A"
+
+
+def test_cancelled_fetch_cancels_waiters_and_forgets_keys():
+  started = None
+
+  async def slow(keys):
+    started.set()
+    await asyncio.sleep(60)
+
+  async def main():
+    nonlocal started
+    started = asyncio.Event()
+    loader = BatchLoader(slow, window=0)
+    waiters = [asyncio.ensure_future(loader.load(key)) for key in ["a", "b"]]
+    await started.wait()
+    for task in list(loader._tasks):
+      task.cancel()
+    results = await asyncio.wait_for(asyncio.gather(*waiters, return_exceptions=True), 1)
+    return loader, results
+
+  loader, results = asyncio.run(main())
+  assert all(isinstance(result, asyncio.CancelledError) for result in results)
+  assert loader._futures == {}
@@ -0,0 +1,179 @@
+import re
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from bvbrc_solr_api.core import mirror as mirror_module
+from bvbrc_solr_api.core.mirror import Mirror, parse_solr_date, solr_date
+
+
+NOW = datetime(2024, 3, 1, tzinfo=timezone.utc)
+BOUND = re.compile(r'^date_modified:\["(?P<start>[^"]+)" TO (?:\*|"(?P<end>[^"]+)")(?P<close>[\]}])$')
+
+
+def _day(offset):
+  return solr_date(NOW + timedelta(days=offset))
+
+
+def _unescape(value):
+  return value.replace("\\", "")
+
+
+class FakeGenome:
+  """Serves `docs` to stream_all_solr, honouring date_modified range filters, and records each call."""
+
+  collection = "genome"
+  unique_key = "genome_id"
+
+  def __init__(self, docs):
+    self.docs = {doc["genome_id"]: doc for doc in docs}
+    self.calls = []
+    self.fail_on_call = None
+
+  def _fields(self, fields, profile, bulk=False):
+    return fields
+
+  def stream_all_solr(self, **kwargs):
+    self.calls.append(kwargs)
+    if self.fail_on_call == len(self.calls):
+      raise RuntimeError("solr down")
+    bounds = [BOUND.match(fq) for fq in kwargs.get("fq") or []]
+    bound = next((match for match in bounds if match), None)
+    for doc in self.docs.values():
+      if bound is not None:
+        modified = parse_solr_date(doc["date_modified"])
+        if modified < parse_solr_date(_unescape(bound["start"])):
+          continue
+        if bound["end"] is not None and modified >= parse_solr_date(_unescape(bound["end"])):
+          continue
+      yield dict(doc)
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+  now = {"value": NOW.timestamp()}
+  monkeypatch.setattr(mirror_module.time, "time", lambda: now["value"])
+  return now
+
+
+@pytest.fixture()
+def mirror(tmp_path):
+  mirror = Mirror(str(tmp_path / "mirror.db"))
+  yield mirror
+  mirror.close()
+
+
+def _genomes(*items):
+  return [{"genome_id": genome_id, "genome_name": name, "date_modified": modified} for genome_id, name, modified in items]
+
+
+def test_full_sync_copies_docs_and_sets_high_water(mirror, clock):
+  resource = FakeGenome(_genomes(("1.1", "E. coli", _day(-30)), ("2.1", "Salmonella", _day(-10))))
+
+  result = mirror.full_sync(resource, fields=["genome_id", "genome_name"], overlap=timedelta(hours=2))
+
+  assert (result["upserted"], result["deleted"]) == (2, 0)
+  assert mirror.count("genome") == 2
+  assert mirror.get("genome", "2.1")["genome_name"] == "Salmonella"
+  state = mirror.state("genome")
+  assert state["high_water"] == solr_date(NOW - timedelta(hours=2))
+  assert state["fields"] == ["genome_id", "genome_name", "date_modified"]
+  assert resource.calls[0]["fields"] == ["genome_id", "genome_name", "date_modified"]
+
+
+def test_full_sync_drops_rows_not_seen_again(mirror, clock):
+  resource = FakeGenome(_genomes(("1.1", "E. coli", _day(-30)), ("2.1", "Salmonella", _day(-10))))
+  mirror.full_sync(resource)
+  del resource.docs["1.1"]
+
+  result = mirror.full_sync(resource)
+
+  assert result["deleted"] == 1
+  assert [doc["genome_id"] for doc in mirror.iter_docs("genome")] == ["2.1"]
+
+
+def test_delta_sync_requires_full_sync(mirror):
+  with pytest.raises(ValueError, match="full_sync first"):
+    mirror.delta_sync(FakeGenome([]))
+
+
+def test_delta_sync_walks_half_open_windows_to_now(mirror, clock):
+  resource = FakeGenome([])
+  clock["value"] = (NOW - timedelta(days=20)).timestamp()
+  mirror.full_sync(resource, overlap=timedelta(0))
+  clock["value"] = NOW.timestamp()
+
+  result = mirror.delta_sync(resource, window=timedelta(days=7), overlap=timedelta(hours=1))
+
+  assert result["windows"] == 3
+  bounds = [BOUND.match(call["fq"][-1]) for call in resource.calls[1:]]
+  assert [(_unescape(b["start"]), b["end"] and _unescape(b["end"]), b["close"]) for b in bounds] == [
+    (_day(-20), _day(-13), "}"),
+    (_day(-13), _day(-6), "}"),
+    (_day(-6), None, "]"),
+  ]
+  assert mirror.state("genome")["high_water"] == solr_date(NOW - timedelta(hours=1))
+
+
+def test_delta_sync_upserts_changed_and_new_docs_only(mirror, clock):
+  resource = FakeGenome(_genomes(("1.1", "E. coli", _day(-30)), ("2.1", "Salmonella", _day(-30))))
+  clock["value"] = (NOW - timedelta(days=5)).timestamp()
+  mirror.full_sync(resource, fq=["public:true"])
+  clock["value"] = NOW.timestamp()
+  resource.docs["2.1"] = _genomes(("2.1", "Salmonella enterica", _day(-2)))[0]
+  resource.docs["3.1"] = _genomes(("3.1", "Listeria", _day(-1)))[0]
+
+  result = mirror.delta_sync(resource)
+
+  assert (result["windows"], result["upserted"], result["deleted"]) == (1, 2, 0)
+  assert mirror.get("genome", "2.1")["genome_name"] == "Salmonella enterica"
+  assert mirror.get("genome", "1.1")["genome_name"] == "E. coli"
+  assert mirror.count("genome") == 3
+  assert resource.calls[-1]["fq"][0] == "public:true"
+
+
+def test_failed_window_keeps_high_water_of_committed_windows(mirror, clock):
+  resource = FakeGenome(_genomes(("1.1", "E. coli", _day(-18))))
+  clock["value"] = (NOW - timedelta(days=20)).timestamp()
+  mirror.full_sync(resource, overlap=timedelta(0))
+  clock["value"] = NOW.timestamp()
+  resource.docs["1.1"] = _genomes(("1.1", "E. coli K-12", _day(-18)))[0]
+  resource.fail_on_call = 3  # full sync, first window, then the second window fails
+
+  with pytest.raises(RuntimeError):
+    mirror.delta_sync(resource, window=timedelta(days=7))
+
+  assert mirror.state("genome")["high_water"] == _day(-13)
+  assert mirror.get("genome", "1.1")["genome_name"] == "E. coli K-12"
+
+
+def test_reconcile_deletes_rows_removed_remotely(mirror, clock):
+  resource = FakeGenome(_genomes(("1.1", "E. coli", _day(-30)), ("2.1", "Salmonella", _day(-30)), ("3.1", "Listeria", _day(-30))))
+  mirror.full_sync(resource, fq=["public:true"])
+  del resource.docs["2.1"]
+
+  assert mirror.reconcile(resource) == 1
+  assert [doc["genome_id"] for doc in mirror.iter_docs("genome")] == ["1.1", "3.1"]
+  call = resource.calls[-1]
+  assert (call["profile"], call["export"], call["fq"]) == ("ids", True, ["public:true"])
+
+
+def test_delta_sync_can_reconcile(mirror, clock):
+  resource = FakeGenome(_genomes(("1.1", "E. coli", _day(-30)), ("2.1", "Salmonella", _day(-30))))
+  mirror.full_sync(resource)
+  del resource.docs["1.1"]
+
+  assert mirror.delta_sync(resource)["deleted"] == 0
+  assert mirror.count("genome") == 2
+  assert mirror.delta_sync(resource, reconcile=True)["deleted"] == 1
+  assert mirror.count("genome") == 1
+
+
+def test_sync_picks_full_then_delta(mirror, clock):
+  resource = FakeGenome(_genomes(("1.1", "E. coli", _day(-30))))
+  assert mirror.sync(resource)["mode"] == "full"
+  assert mirror.sync(resource)["mode"] == "delta"
+
+
+def test_reconcile_without_state_is_a_no_op(mirror):
+  assert mirror.reconcile(FakeGenome([])) == 0
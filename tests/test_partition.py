@@ -0,0 +1,109 @@
+import re
+from datetime import datetime, timedelta
+
+import pytest
+
+from bvbrc_solr_api.core import partition as partition_module
+from bvbrc_solr_api.core.partition import PartitionedExporter, partition_filters
+
+
+def _unquote(text):
+  return re.sub(r"\\(.)", r"\1", text[1:-1]) if text.startswith('"') else text
+
+
+def _date(text):
+  return datetime.fromisoformat(text.replace("Z", "+00:00"))
+
+
+class FakeSolr:
+  """Answers the rows=0 stats / range facet / facet.query requests the planner sends."""
+
+  def __init__(self, docs, field):
+    self.docs, self.field, self.requests = docs, field, []
+
+  def __call__(self, collection, params, **kwargs):
+    self.requests.append(params)
+    assert params["rows"] == 0 and "start" not in params
+    values = [doc[self.field] for doc in self.docs if self.field in doc]
+    flat = [v for value in values for v in (value if isinstance(value, list) else [value])]
+    result = {"response": {"numFound": len(self.docs), "docs": []}}
+    if params.get("stats"):
+      result["stats"] = {"stats_fields": {self.field: {
+        "min": min(flat), "max": max(flat), "count": len(flat), "missing": len(self.docs) - len(values),
+      }}}
+    elif "facet.range" in params:
+      start, end, gap = params["facet.range.start"], params["facet.range.end"], params["facet.range.gap"]
+      if isinstance(start, str):
+        step = timedelta(milliseconds=int(gap.strip("+MILLISECONDS")))
+        start, end, key = _date(start), _date(end), _date
+      else:
+        step, key = type(start)(gap), lambda value: value
+      counts, low = [], start
+      while low < end:
+        counts += [str(low), sum(1 for value in flat if low <= key(value) < low + step)]
+        low += step
+      result["facet_counts"] = {"facet_ranges": {self.field: {"counts": counts}}}
+    elif "facet.query" in params:
+      queries = {}
+      for query in params["facet.query"]:
+        bound = _unquote(re.match(rf"^{self.field}:\[\* TO (.*)\}}$", query).group(1))
+        queries[query] = sum(1 for value in flat if str(value) < bound)
+      result["facet_counts"] = {"facet_queries": queries}
+    else:
+      raise AssertionError(f"unexpected request {params}")
+    return result
+
+
+def _drive(steps, solr):
+  try:
+    params = next(steps)
+    while True:
+      params = steps.send(solr("genome_feature", params))
+  except StopIteration as stop:
+    return stop.value
+
+
+def _sizes(values, splits, key):
+  edges = [None] + [key(split) for split in splits] + [None]
+  return [
+    sum(1 for value in values if (low is None or key(value) >= low) and (high is None or key(value) < high))
+    for low, high in zip(edges, edges[1:])
+  ]
+
+
+@pytest.mark.parametrize("values,key", [
+  ([f"PATRIC.{i * 7919 % 100003}.CDS.{i}" for i in range(5000)], str),
+  ([i * i for i in range(5000)], float),
+  ([i / 7.0 for i in range(5000)], float),
+  ([(datetime(2020, 1, 1) + timedelta(minutes=i * i)).strftime("%Y-%m-%dT%H:%M:%SZ") for i in range(5000)], _date),
+], ids=["string", "int", "float", "date"])
+def test_sample_strategy_plans_balanced_splits_without_deep_offsets(values, key):
+  solr = FakeSolr([{"feature_id": value} for value in values], "feature_id")
+  splits = _drive(partition_module._sample_splits({"q": "*:*"}, "feature_id", 4), solr)
+  sizes = _sizes(values, splits, key)
+  assert len(sizes) == 4 and sum(sizes) == len(values)
+  assert max(sizes) - min(sizes) <= len(values) // 20
+  assert len(solr.requests) <= 2 + partition_module._MAX_BISECT_ROUNDS
+
+
+def test_plan_sends_only_rows0_requests(monkeypatch):
+  solr = FakeSolr([{"feature_id": f"f{i:05d}"} for i in range(1000)], "feature_id")
+  monkeypatch.setattr(partition_module, "select", solr)
+  exporter = PartitionedExporter(
+    collection="genome_feature", base_params={"q": "*:*"}, base_url="https://example.org/solr",
+    unique_key="feature_id", partitions=3,
+  )
+  filters = exporter.plan()
+  assert len(filters) == 3 and filters[0].startswith("feature_id:[* TO ")
+  assert solr.requests[0]["stats.field"] == "feature_id"
+
+
+def test_facet_strategy_bounds_the_bucket_list():
+  params = next(partition_module._facet_splits({"q": "*:*"}, "genome_id", 4))
+  assert params["facet.limit"] == partition_module.MAX_FACET_SPLIT_VALUES
+
+
+def test_sample_strategy_rejects_multi_valued_fields():
+  docs = [{"feature_id": str(i), "go": [f"GO:{i}", f"GO:{i + 1}"]} for i in range(50)]
+  with pytest.raises(ValueError, match="multi-valued"):
+    _drive(partition_module._sample_splits({"q": "*:*"}, "go", 4), FakeSolr(docs, "go"))
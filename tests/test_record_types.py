@@ -0,0 +1,81 @@
+import sys
+
+import pytest
+
+from bvbrc_solr_api.core.record_types import Record, record_type
+from bvbrc_solr_api.core.resource import BaseResource
+from bvbrc_solr_api.resources.genome_amr import GenomeAmr
+
+
+AMR_DOC = {
+  "id": "a1",
+  "genome_id": "83332.12",
+  "genome_name": "Mycobacterium tuberculosis H37Rv",
+  "taxon_id": "83332",
+  "antibiotic": "isoniazid",
+  "resistant_phenotype": "Resistant",
+  "laboratory_typing_method": "Broth dilution",
+  "measurement_value": "0.2",
+  "source": "PATRIC",
+  "date_inserted": "2024-01-01T00:00:00Z",
+}
+
+
+def _resources():
+  return [
+    cls for name in sorted(sys.modules) if name.startswith("bvbrc_solr_api.resources.")
+    for cls in vars(sys.modules[name]).values()
+    if isinstance(cls, type) and issubclass(cls, BaseResource) and cls is not BaseResource and cls.collection
+  ]
+
+
+def test_round_trip_keeps_declared_and_extra_fields():
+  Feature = record_type("Feature", ["feature_id", "start", "end", "strand"], interned=["strand"])
+  doc = {"feature_id": "f1", "start": "10", "end": 99, "strand": "+", "go": ["GO:1"]}
+  record = Feature.from_doc(doc)
+  assert isinstance(record, Record)
+  assert (record.start, record.end) == (10, 99)
+  assert record.extra == {"go": ["GO:1"]}
+  assert record["go"] == ["GO:1"] and record.get("product") is None and "strand" in record
+  assert record.to_dict() == {"feature_id": "f1", "start": 10, "end": 99, "strand": "+", "go": ["GO:1"]}
+  assert Feature.from_doc(record.to_dict()) == record
+  with pytest.raises(KeyError):
+    record["product"]
+
+
+def test_numeric_conversion_and_errors():
+  Expression = record_type("Expression", ["id", "fpkm", "taxon_id", "score"], types={"score": float})
+  record = Expression.from_doc({"id": "e1", "fpkm": "1.5", "taxon_id": ["1", "2"], "score": "3"})
+  assert (record.fpkm, record.taxon_id, record.score) == (1.5, [1, 2], 3.0)
+  with pytest.raises(ValueError, match="fpkm"):
+    Expression.from_doc({"id": "e2", "fpkm": "n/a"})
+
+
+def test_categorical_strings_are_interned():
+  Amr = record_type("Amr", ["id", "antibiotic"], interned=["antibiotic"])
+  first = Amr.from_doc({"id": "1", "antibiotic": "".join(["isonia", "zid"])})
+  second = Amr.from_doc({"id": "2", "antibiotic": "".join(["isoni", "azid"])})
+  assert first.antibiotic is second.antibiotic
+
+
+def test_every_resource_has_a_record_type_covering_its_docs():
+  resources = _resources()
+  assert len(resources) == 34
+  for cls in resources:
+    assert len(cls.record_type().fields) > 1, cls.__name__
+
+  record = GenomeAmr.record_type().from_doc(AMR_DOC)
+  assert record.extra is None
+  assert record.taxon_id == 83332
+  assert record.antibiotic is sys.intern("isoniazid")
+  assert sys.getsizeof(record) < sys.getsizeof(AMR_DOC)
+
+
+def test_record_type_refuses_resources_without_declared_fields(monkeypatch):
+  class Bare(BaseResource):
+    collection = "bare"
+    unique_key = "id"
+
+  monkeypatch.setattr(BaseResource, "_record_types", {})
+  with pytest.raises(ValueError, match="no record_fields"):
+    Bare.record_type()
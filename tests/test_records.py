@@ -0,0 +1,50 @@
+import csv
+import io
+
+import pytest
+
+from bvbrc_solr_api.core.records import iter_records
+
+
+CSV_INPUTS = [
+  b'id,name\n1,"quoted, with comma"\n2,"multi\nline"\n3,"doubled ""quote"""\n',
+  b'id,name\n1,5" disk\n2,x\n3,y"\n4,z\n',
+  b'id,name\n1,"a"b\n2,\n3\n4,x,extra\n',
+  b'id,name\r\n1,"crlf\r\nvalue"\r\n2,plain\r\n',
+  b'id,name\n1,no newline at end',
+]
+
+TSV_INPUTS = [
+  b'a\tb\n1\t5" disk\n2\tx\n3\ty"\n4\tz\n',
+  b'a\tb\n1\t"tab\tinside"\n2\t"line\nbreak"\n',
+]
+
+
+def _dictreader(payload, delimiter):
+  return list(csv.DictReader(io.StringIO(payload.decode("utf-8"), newline=""), delimiter=delimiter))
+
+
+def _chunked(payload, size):
+  return [payload[i:i + size] for i in range(0, len(payload), size)]
+
+
+@pytest.mark.parametrize("payload", CSV_INPUTS)
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+def test_csv_matches_dictreader(payload, size):
+  assert list(iter_records(_chunked(payload, size), "csv")) == _dictreader(payload, ",")
+
+
+@pytest.mark.parametrize("payload", TSV_INPUTS)
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+def test_tsv_matches_dictreader(payload, size):
+  assert list(iter_records(_chunked(payload, size), "tsv")) == _dictreader(payload, "\t")
+
+
+def test_unterminated_quoted_field_raises():
+  with pytest.raises(ValueError):
+    list(iter_records([b'id,name\n1,"never closed\n2,x\n'], "csv"))
+
+
+def test_fasta_records_are_split_on_headers():
+  payload = b">a desc\nACGT\nAC\n>b\nGG\n"
+  assert list(iter_records(_chunked(payload, 3), "fasta")) == [">a desc\nACGT\nAC\n", ">b\nGG\n"]
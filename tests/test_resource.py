@@ -0,0 +1,116 @@
+import re
+
+import httpx
+import pytest
+
+from bvbrc_solr_api.core import resource as resource_module
+from bvbrc_solr_api.core.cache import MemoryCache, ResponseCache
+from bvbrc_solr_api.core.transport import Transport
+from bvbrc_solr_api.resources.genome import Genome
+
+
+def _paged_options(monkeypatch):
+  calls = []
+
+  def paginate(core_name, filter, options, *args, **kwargs):
+    calls.append(options)
+    return iter([])
+
+  monkeypatch.setattr(resource_module, "paginate", paginate)
+  return calls
+
+
+def test_paginated_queries_keep_every_field(monkeypatch):
+  calls = _paged_options(monkeypatch)
+  genome = Genome({"base_url": "https://example.org/api/", "headers": {}})
+  list(genome.iter_all("eq(genus,Vibrio)"))
+  list(genome._run("eq(genus,Vibrio)", {"paginate": True}))
+  assert [options.get("select") for options in calls] == [None, None]
+
+
+def test_paginated_queries_honour_an_explicit_profile(monkeypatch):
+  calls = _paged_options(monkeypatch)
+  genome = Genome({"base_url": "https://example.org/api/", "headers": {}})
+  list(genome.iter_all("eq(genus,Vibrio)", {"profile": "summary"}))
+  assert calls[0]["select"] == genome.profile_fields("summary")
+
+
+def test_solr_exports_default_to_the_bulk_profile():
+  genome = Genome({"base_url": "https://example.org/api/", "headers": {}, "solr_base_url": "https://example.org/solr"})
+  assert genome._fields(None, None, bulk=True) == genome.profile_fields("summary")
+  assert Genome({"bulk_profile": "full"})._fields(None, None, bulk=True) is None
+
+
+def test_paginated_queries_use_the_context_cache_and_router(monkeypatch):
+  seen = []
+
+  def paginate(core_name, filter, options, *args, **kwargs):
+    seen.append(kwargs)
+    return iter([])
+
+  monkeypatch.setattr(resource_module, "paginate", paginate)
+  cache, router = object(), object()
+  genome = Genome({"base_url": "https://example.org/api/", "headers": {}, "cache": cache, "router": router})
+  list(genome._run("eq(genus,Vibrio)", {"paginate": True, "page_size": 50}))
+  assert seen[0]["cache"] is cache and seen[0]["router"] is router
+  assert seen[0]["page_size"] == 50
+
+
+def _paged_genome(context):
+  docs = [{"genome_id": f"{i}.1", "genome_name": f"g{i}"} for i in range(5)]
+  bodies = []
+
+  def handler(request):
+    body = request.content.decode()
+    bodies.append(body)
+    size, offset = re.search(r"limit\((\d+)(?:,(\d+))?\)", body).groups()
+    size, offset = int(size), int(offset or 0)
+    page = docs[offset:offset + size]
+    headers = {"Content-Range": f"items {offset}-{offset + len(page) - 1}/{len(docs)}"}
+    return httpx.Response(200, json=page, headers=headers)
+
+  transport = Transport()
+  transport._client = httpx.Client(transport=httpx.MockTransport(handler))
+  genome = Genome({"base_url": "https://example.org/api/", "headers": {}, "transport": transport, **context})
+  return genome, docs, bodies
+
+
+def test_paginated_pages_are_cached():
+  genome, docs, bodies = _paged_genome({"cache": ResponseCache(MemoryCache())})
+  options = {"paginate": True, "page_size": 2}
+  assert list(genome._run("eq(genus,Vibrio)", options)) == docs
+  requests = len(bodies)
+  assert list(genome._run("eq(genus,Vibrio)", options)) == docs
+  assert len(bodies) == requests
+
+
+def test_paginated_pages_are_answered_by_the_router():
+  class Router:
+    def __init__(self):
+      self.calls = []
+
+    def run(self, core_name, filter, options):
+      self.calls.append(options["offset"])
+      return [{"genome_id": "local"}] if options["offset"] == 0 else None
+
+  router = Router()
+  genome, docs, bodies = _paged_genome({"router": router})
+  rows = list(genome._run("eq(genus,Vibrio)", {"paginate": True, "page_size": 1}))
+  # The local first page has no total, so the rest is paged sequentially from the network.
+  assert rows == [{"genome_id": "local"}, *docs[1:]]
+  assert router.calls == [0, 1, 2, 3, 4, 5]
+  assert len(bodies) == 5
+
+
+def test_paginated_arrow_returns_one_table():
+  pytest.importorskip("pyarrow")
+  genome, docs, _ = _paged_genome({})
+  table = genome._run("eq(genus,Vibrio)", {"paginate": True, "page_size": 2, "arrow": True})
+  assert table.num_rows == len(docs)
+  assert table.column("genome_id").to_pylist() == [doc["genome_id"] for doc in docs]
+
+
+def test_paginated_arrow_rejects_record_type():
+  genome = Genome({"base_url": "https://example.org/api/", "headers": {}})
+  with pytest.raises(ValueError, match="mutually exclusive"):
+    genome._run("eq(genus,Vibrio)", {"paginate": True, "arrow": True, "record_type": True})
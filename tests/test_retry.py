@@ -0,0 +1,134 @@
+import asyncio
+
+import httpx
+import pytest
+
+from bvbrc_solr_api.core import retry as retry_module
+from bvbrc_solr_api.core import transport as transport_module
+from bvbrc_solr_api.core.retry import RetryPolicy, TokenBucket, parse_retry_after
+from bvbrc_solr_api.core.transport import Transport
+
+
+URL = "https://example.org/api/genome/"
+
+
+def _transport(responses, monkeypatch, **kwargs):
+  """A Transport whose client replays `responses` (status codes, Responses or exceptions) in order."""
+  sent = []
+  sleeps = []
+  pending = list(responses)
+
+  def handler(request):
+    sent.append(request)
+    item = pending.pop(0)
+    if isinstance(item, Exception):
+      raise item
+    return item if isinstance(item, httpx.Response) else httpx.Response(item, json=[])
+
+  transport = Transport(**kwargs)
+  transport._client = httpx.Client(transport=httpx.MockTransport(handler))
+  transport._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+  monkeypatch.setattr(transport_module.time, "sleep", sleeps.append)
+
+  async def no_wait(delay):
+    sleeps.append(delay)
+
+  monkeypatch.setattr(transport_module.asyncio, "sleep", no_wait)
+  return transport, sent, sleeps
+
+
+@pytest.mark.parametrize("failure", [429, 502, 503, 504, httpx.ConnectTimeout("slow"), httpx.ReadError("reset")])
+def test_retryable_statuses_and_exceptions_are_resent(monkeypatch, failure):
+  transport, sent, sleeps = _transport([failure, 200], monkeypatch)
+  assert transport.post(URL, content=b"x").status_code == 200
+  assert len(sent) == 2 and len(sleeps) == 1
+  assert transport.stats["retries"] == 1
+
+
+@pytest.mark.parametrize("status", [400, 401, 404, 500])
+def test_other_statuses_are_returned_without_retry(monkeypatch, status):
+  transport, sent, sleeps = _transport([status, 200], monkeypatch)
+  assert transport.post(URL, content=b"x").status_code == status
+  assert len(sent) == 1 and sleeps == []
+
+
+def test_non_retryable_exceptions_propagate_immediately(monkeypatch):
+  transport, sent, _ = _transport([httpx.UnsupportedProtocol("ftp"), 200], monkeypatch)
+  with pytest.raises(httpx.UnsupportedProtocol):
+    transport.post(URL, content=b"x")
+  assert len(sent) == 1
+
+
+def test_retries_stop_after_max_retries(monkeypatch):
+  transport, sent, sleeps = _transport([503] * 5, monkeypatch, retry=RetryPolicy(2))
+  assert transport.post(URL, content=b"x").status_code == 503
+  assert len(sent) == 3 and len(sleeps) == 2
+
+  transport, sent, _ = _transport([httpx.ReadTimeout("slow")] * 5, monkeypatch, retry=RetryPolicy(1))
+  with pytest.raises(httpx.ReadTimeout):
+    transport.post(URL, content=b"x")
+  assert len(sent) == 2
+
+
+def test_retry_none_disables_retries(monkeypatch):
+  transport, sent, _ = _transport([503, 200], monkeypatch, retry=None)
+  assert transport.post(URL, content=b"x").status_code == 503
+  assert len(sent) == 1
+
+
+def test_retry_after_is_honoured_and_capped(monkeypatch):
+  responses = [httpx.Response(429, headers={"Retry-After": "7"}), httpx.Response(503, headers={"Retry-After": "120"}), 200]
+  transport, _, sleeps = _transport(responses, monkeypatch, retry=RetryPolicy(3, backoff_max=30.0))
+  assert transport.post(URL, content=b"x").status_code == 200
+  assert sleeps == [7.0, 30.0]
+
+
+def test_backoff_is_jittered_within_the_exponential_bound(monkeypatch):
+  monkeypatch.setattr(retry_module.random, "uniform", lambda low, high: high)
+  policy = RetryPolicy(backoff_base=0.5, backoff_max=3.0)
+  assert [policy.delay(attempt) for attempt in range(5)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+
+def test_parse_retry_after():
+  assert parse_retry_after("12") == 12.0
+  assert parse_retry_after("Thu, 01 Jan 1970 00:00:00 GMT") == 0.0
+  assert parse_retry_after("soon") is None and parse_retry_after(None) is None
+
+
+def test_async_post_retries_and_resends_the_same_body(monkeypatch):
+  transport, sent, sleeps = _transport([502, httpx.ConnectError("refused"), 200], monkeypatch)
+  response = asyncio.run(transport.async_post(URL, content=b"eq(genome_id,1)"))
+  assert response.status_code == 200
+  assert [request.content for request in sent] == [b"eq(genome_id,1)"] * 3
+  assert len(sleeps) == 2
+
+
+class Clock:
+  def __init__(self):
+    self.now = 100.0
+
+  def __call__(self):
+    return self.now
+
+
+def test_token_bucket_allows_a_burst_then_spaces_requests(monkeypatch):
+  clock = Clock()
+  monkeypatch.setattr(retry_module.time, "monotonic", clock)
+  bucket = TokenBucket(rate=2, burst=3)
+  assert [bucket._reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+  assert bucket._reserve() == pytest.approx(0.5)
+  assert bucket._reserve() == pytest.approx(1.0)
+  clock.now += 10
+  assert bucket._reserve() == 0.0  # refilled, but never beyond the burst
+  assert bucket.waited == pytest.approx(1.5)
+  with pytest.raises(ValueError):
+    TokenBucket(rate=0)
+
+
+def test_transport_throttles_through_its_token_bucket(monkeypatch):
+  clock = Clock()
+  monkeypatch.setattr(retry_module.time, "monotonic", clock)
+  transport, _, waits = _transport([200, 200, 200], monkeypatch, rate_limit=1, rate_burst=1)
+  for _ in range(3):
+    transport.post(URL, content=b"x")
+  assert waits == [pytest.approx(1.0), pytest.approx(2.0)]
@@ -0,0 +1,90 @@
+import pytest
+
+from bvbrc_solr_api.core.mirror import Mirror
+from bvbrc_solr_api.core.router import MirrorRouter, parse_rql
+
+
+DOCS = [
+  {"genome_id": "1.1", "genome_name": "Escherichia coli K-12", "host_group": ["Human"], "taxon_id": 562,
+   "public": True, "date_modified": "2024-01-01T00:00:00Z"},
+  {"genome_id": "1.2", "genome_name": "Escherichia coli O157", "host_group": ["Bovine", "Human"], "taxon_id": 562,
+   "public": False, "date_modified": "2024-01-02T00:00:00Z"},
+  {"genome_id": "2.1", "genome_name": "Salmonella enterica", "host_group": ["Avian"], "taxon_id": 28901,
+   "public": True, "date_modified": "2024-01-03T00:00:00Z"},
+]
+
+
+class FakeGenome:
+  collection = "genome"
+  unique_key = "genome_id"
+
+  def _fields(self, fields, profile, bulk=False):
+    return fields
+
+  def stream_all_solr(self, **kwargs):
+    return iter([dict(doc) for doc in DOCS])
+
+
+@pytest.fixture()
+def router(tmp_path):
+  mirror = Mirror(
+    str(tmp_path / "mirror.db"),
+    index_fields={"genome": ["genome_name", "host_group", "taxon_id", "public"]},
+  )
+  mirror.full_sync(FakeGenome())
+  router = MirrorRouter(mirror)
+  yield router
+  router.close()
+  mirror.close()
+
+
+def _solr_ids(predicate):
+  # Reference answer: what Solr returns for the query, sorted by the unique key.
+  return [doc["genome_id"] for doc in sorted(DOCS, key=lambda doc: doc["genome_id"]) if predicate(doc)]
+
+
+def _local_ids(router, filter, sort="+genome_id"):
+  docs = router.run("genome", filter, {"sort": sort})
+  return None if docs is None else [doc["genome_id"] for doc in docs]
+
+
+def test_exact_and_numeric_fields_match_solr(router):
+  assert _local_ids(router, "eq(genome_id,1.2)") == _solr_ids(lambda doc: doc["genome_id"] == "1.2")
+  assert _local_ids(router, "eq(taxon_id,562)") == _solr_ids(lambda doc: doc["taxon_id"] == 562)
+  assert _local_ids(router, "gt(taxon_id,1000)") == _solr_ids(lambda doc: doc["taxon_id"] > 1000)
+  assert _local_ids(router, "in(genome_id,1.1,2.1)") == _solr_ids(lambda doc: doc["genome_id"] in ("1.1", "2.1"))
+  assert router.stats["local"] == 4
+
+
+def test_multi_valued_field_goes_to_solr(router):
+  # Solr matches any value of a multi-valued field; a scalar SQL comparison would return [].
+  assert _local_ids(router, "eq(host_group,Human)") is None
+  assert _local_ids(router, "eq(genome_id,1.1)", sort="+host_group,+genome_id") is None
+  assert router.stats["local"] == 0
+  assert any("multi-valued" in reason for reason in router.stats["remote_reasons"])
+
+
+def test_text_field_goes_to_solr_unless_declared_exact(router):
+  # Tokenized, case-insensitive text match in Solr; exact comparison locally would miss it.
+  assert _local_ids(router, "eq(genome_name,escherichia%20coli%20k-12)") is None
+  router.exact_fields = {"genome": {"genome_name"}}
+  assert _local_ids(router, "eq(genome_name,Salmonella%20enterica)") == ["2.1"]
+
+
+def test_boolean_field_goes_to_solr(router):
+  assert _local_ids(router, "eq(public,true)") is None
+
+
+def test_parse_rql_nesting():
+  assert parse_rql("and(eq(a,1),in(b,x,y))") == ("and", [("eq", ["a", "1"]), ("in", ["b", "x", "y"])])
+
+
+@pytest.mark.parametrize("expr", ["eq(", "eq(a,", "eq(a,1", "and(eq(a,1)", "and(eq(a,1),"])
+def test_parse_rql_rejects_unbalanced_input(expr):
+  with pytest.raises(ValueError, match="Unbalanced"):
+    parse_rql(expr)
+
+
+def test_malformed_filter_goes_to_solr(router):
+  assert router.run("genome", "eq(", {}) is None
+  assert router.stats["local"] == 0
@@ -0,0 +1,36 @@
+import csv
+
+import pytest
+
+from bvbrc_solr_api.core.sinks import CsvSink, _RollingSink, _TextSink, open_sink, read_export
+
+
+def test_rolling_bases_cannot_be_instantiated(tmp_path):
+  with pytest.raises(TypeError):
+    _RollingSink(str(tmp_path))
+  with pytest.raises(TypeError):
+    _TextSink(str(tmp_path))
+
+
+def test_csv_sink_requires_fields(tmp_path):
+  with pytest.raises(ValueError, match="fields"):
+    CsvSink(str(tmp_path))
+  with pytest.raises(ValueError, match="fields"):
+    open_sink(str(tmp_path), "tsv")
+
+
+def test_csv_sink_keeps_one_header_across_batches_and_files(tmp_path):
+  with CsvSink(str(tmp_path), fields=["genome_id", "genus", "host"], max_rows=2) as sink:
+    sink.write([{"genome_id": "1", "genus": "Mycobacterium"}])
+    sink.write([{"genome_id": "2", "host": "Human"}, {"genome_id": "3", "genus": "Vibrio", "host": ["Fish", "Human"]}])
+  assert len(sink.files) == 2
+  headers = set()
+  for path in sink.files:
+    with open(path, newline="") as handle:
+      headers.add(tuple(next(csv.reader(handle))))
+  assert headers == {("genome_id", "genus", "host")}
+  assert list(read_export(str(tmp_path))) == [
+    {"genome_id": "1", "genus": "Mycobacterium"},
+    {"genome_id": "2", "host": "Human"},
+    {"genome_id": "3", "genus": "Vibrio", "host": '["Fish","Human"]'},
+  ]
@@ -0,0 +1,14 @@
+from bvbrc_solr_api.core.solr_query_builder import MAX_BOOLEAN_CLAUSES, and_filters, in_filters, terms
+
+
+def test_in_filters_keeps_the_composable_form_by_default():
+  ids = [str(i) for i in range(MAX_BOOLEAN_CLAUSES + 1)]
+  clause = in_filters("genome_id", ids)
+  assert clause.startswith("genome_id:(0 OR 1 OR ")
+  assert and_filters(clause, "genus:Mycobacterium") == f"({clause} AND genus:Mycobacterium)"
+
+
+def test_in_filters_switches_to_terms_only_when_asked():
+  ids = [str(i) for i in range(MAX_BOOLEAN_CLAUSES + 1)]
+  assert in_filters("genome_id", ids, terms_threshold=MAX_BOOLEAN_CLAUSES) == terms("genome_id", ids)
+  assert in_filters("genome_id", ids[:3], terms_threshold=MAX_BOOLEAN_CLAUSES) == "genome_id:(0 OR 1 OR 2)"
@@ -0,0 +1,84 @@
+import asyncio
+import threading
+
+import httpx
+
+from bvbrc_solr_api.core import transport as transport_module
+from bvbrc_solr_api.core.http_client import async_fetch_page, async_iter_run, async_run
+from bvbrc_solr_api.core.solr_http_client import async_select
+from bvbrc_solr_api.core.transport import Transport
+
+
+def test_async_client_is_pooled_per_event_loop():
+  transport = Transport()
+
+  async def clients():
+    return transport.get_async_client(), transport.get_async_client()
+
+  first, again = asyncio.run(clients())
+  second, _ = asyncio.run(clients())
+  assert first is again
+  assert second is not first
+  assert first.is_closed
+  assert not transport._closing
+
+
+def test_stale_client_on_a_live_loop_is_closed_on_that_loop():
+  transport = Transport()
+  other = asyncio.new_event_loop()
+  thread = threading.Thread(target=other.run_forever, daemon=True)
+  thread.start()
+  try:
+    stale = asyncio.run_coroutine_threadsafe(_client(transport), other).result(5)
+    fresh = asyncio.run(_client(transport))
+    asyncio.run_coroutine_threadsafe(asyncio.sleep(0), other).result(5)
+    assert stale.is_closed
+    assert fresh is not stale and not fresh.is_closed
+  finally:
+    other.call_soon_threadsafe(other.stop)
+    thread.join(5)
+    other.close()
+
+
+async def _client(transport):
+  return transport.get_async_client()
+
+
+class RecordingTransport:
+  def __init__(self):
+    self.calls = []
+
+  async def async_post(self, url, *, client=None, **kwargs):
+    self.calls.append(url)
+    request = httpx.Request("POST", url)
+    if "solr" in url:
+      return httpx.Response(200, json={"response": {"numFound": 0, "docs": []}}, request=request)
+    return httpx.Response(200, json=[{"genome_id": "1"}], headers={"Content-Range": "items 0-0/1"}, request=request)
+
+  def async_stream(self, url, *, client=None, **kwargs):
+    calls = self.calls
+
+    class Stream:
+      async def __aenter__(self):
+        calls.append(url)
+        return httpx.Response(200, content=b'[{"genome_id": "1"}]', request=httpx.Request("POST", url))
+
+      async def __aexit__(self, *exc):
+        return False
+
+    return Stream()
+
+
+def test_async_calls_without_a_client_use_the_default_transport(monkeypatch):
+  default = RecordingTransport()
+  monkeypatch.setattr(transport_module, "_default_transport", default)
+  base_url = "https://example.org/api/"
+
+  async def calls():
+    await async_run("genome", "eq(genome_id,1)", None, base_url, None)
+    await async_fetch_page("genome", "eq(genome_id,1)", None, base_url, None)
+    assert [doc async for doc in async_iter_run("genome", "eq(genome_id,1)", None, base_url, None)] == [{"genome_id": "1"}]
+    await async_select("genome", {"q": "*:*"}, base_url="https://example.org/solr/")
+
+  asyncio.run(calls())
+  assert len(default.calls) == 4